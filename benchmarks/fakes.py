@@ -0,0 +1,290 @@
+import random
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import ExitStack, contextmanager
+from dataclasses import replace
+from functools import partial
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from unittest.mock import patch
+from src.database.models import Job, RejectedJob, RelevantJob
+from benchmarks.metrics import LatencyRecorder
+
+WORDS = (
+    "python django flask fastapi postgres kubernetes docker aws terraform react typescript "
+    "data pipeline airflow spark kafka microservices testing ci cd observability remote hybrid "
+    "senior junior lead mentor design review api scale latency backend frontend platform team "
+    "product customers ownership agile growth learning budget equity salary benefits"
+).split()
+
+class FakeListing:
+    """Search result with the attributes linkedin_scraper's Job listings expose"""
+    
+    def __init__(self, title: str, company: str, location: str, description: str, linkedin_url: str):
+        self.title = title
+        self.company = company
+        self.location = location
+        self.description = description
+        self.linkedin_url = linkedin_url
+    
+    def scrape(self, close_on_complete: bool = False):
+        """Descriptions are already filled in"""
+        pass
+
+class FakeJobSearch:
+    """Stand-in for linkedin_scraper's JobSearch returning synthetic listings
+    
+    Every search returns listings_per_keyword listings with ~description_words
+    word descriptions. A duplicate_rate share of them repost an earlier
+    listing's description under a new link, exercising the evaluation cache
+    and near-duplicate detection.
+    """
+    
+    def __init__(self, listings_per_keyword: int, description_words: int = 200, duplicate_rate: float = 0,
+                 seed: int = 0):
+        """Initialize the search"""
+        self.listings_per_keyword = listings_per_keyword
+        self.description_words = description_words
+        self.duplicate_rate = duplicate_rate
+        self.random = random.Random(seed)
+        self.descriptions: List[str] = []
+        self.next_id = 4000000000
+    
+    def search(self, keyword: str) -> List[FakeListing]:
+        """Return synthetic listings for a keyword"""
+        listings = []
+        for _ in range(self.listings_per_keyword):
+            self.next_id += 1
+            if self.descriptions and self.random.random() < self.duplicate_rate:
+                description = self.random.choice(self.descriptions)
+            else:
+                description = " ".join(self.random.choice(WORDS) for _ in range(self.description_words))
+                self.descriptions.append(description)
+            listings.append(FakeListing(
+                title=f"{keyword.title()} Engineer",
+                company=f"Company {self.next_id % 997}",
+                location=self.random.choice(["Remote", "Berlin", "London", "New York"]),
+                description=description,
+                linkedin_url=f"https://www.linkedin.com/jobs/view/{self.next_id}/"
+            ))
+        return listings
+
+class FakeDatabase:
+    """In-memory state shared by every FakeDatabaseOperations of one benchmark
+    
+    Each operation counts as one database round trip and waits latency_ms
+    to model the network.
+    """
+    
+    def __init__(self, latency_ms: float = 0, recorder: LatencyRecorder = None):
+        """Initialize an empty database"""
+        self.latency = latency_ms / 1000
+        self.recorder = recorder or LatencyRecorder()
+        self.lock = threading.Lock()
+        self.round_trips = Counter()
+        self.jobs: Dict[int, Job] = {}
+        self.ids_by_link: Dict[str, int] = {}
+        self.status: Dict[int, str] = {}
+        self.leases: Dict[int, str] = {}
+        self.verdicts: Dict[int, object] = {}
+        self.attempts: Dict[int, int] = Counter()
+        self.checkpoints: Dict[Tuple[str, str], int] = {}
+        self.progress: Dict[Tuple[str, str], float] = {}
+        self.cache: Dict[str, dict] = {}
+        self.signatures: Dict[int, List[int]] = {}
+        self.buckets: Dict[Tuple[int, int], Set[int]] = defaultdict(set)
+    
+    @contextmanager
+    def round_trip(self, name: str):
+        """Count and time one round trip, holding the database lock"""
+        started = time.perf_counter()
+        if self.latency:
+            time.sleep(self.latency)
+        with self.lock:
+            self.round_trips[name] += 1
+            yield
+        self.recorder.record(f"db.{name}", time.perf_counter() - started)
+    
+    @contextmanager
+    def installed(self):
+        """Make run_scraper, run_evaluator and the verdict sink use this database"""
+        operations = partial(FakeDatabaseOperations, self)
+        with ExitStack() as stack:
+            for module in ("src.run_scraper", "src.run_evaluator", "src.database.verdict_sink"):
+                stack.enter_context(patch(f"{module}.DatabaseOperations", operations))
+            for module in ("src.run_scraper", "src.run_evaluator"):
+                stack.enter_context(patch(f"{module}.apply_migrations", lambda db: 0))
+            yield self
+
+class FakeDatabaseOperations:
+    """DatabaseOperations backed by a FakeDatabase instead of Postgres"""
+    
+    def __init__(self, store: FakeDatabase, *args, **kwargs):
+        """Initialize the operations"""
+        self.store = store
+        self.conn = None
+    
+    def __enter__(self):
+        self.connect()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def connect(self):
+        """Pretend to check out a connection"""
+        self.conn = True
+        return self.conn
+    
+    def close(self):
+        """Pretend to return the connection"""
+        self.conn = None
+    
+    def save_jobs_bulk(self, jobs: List[Job]) -> Tuple[int, int]:
+        """Save new jobs, skipping known links"""
+        if not jobs:
+            return 0, 0
+        saved = 0
+        with self.store.round_trip("save_jobs_bulk"):
+            for job in jobs:
+                if job.link in self.store.ids_by_link:
+                    continue
+                job.id = len(self.store.jobs) + 1
+                self.store.jobs[job.id] = replace(job)
+                self.store.ids_by_link[job.link] = job.id
+                self.store.status[job.id] = "pending"
+                saved += 1
+        return saved, len(jobs) - saved
+    
+    def get_scrape_checkpoints(self, source: str) -> Dict[str, int]:
+        with self.store.round_trip("get_scrape_checkpoints"):
+            return {keyword: value for (name, keyword), value in self.store.checkpoints.items() if name == source}
+    
+    def save_scrape_checkpoints(self, source: str, checkpoints: Dict[str, int]) -> bool:
+        if not checkpoints:
+            return True
+        with self.store.round_trip("save_scrape_checkpoints"):
+            for keyword, posting_id in checkpoints.items():
+                key = (source, keyword)
+                self.store.checkpoints[key] = max(self.store.checkpoints.get(key, posting_id), posting_id)
+        return True
+    
+    def get_finished_keywords(self, source: str, max_age_seconds: int) -> Set[str]:
+        with self.store.round_trip("get_finished_keywords"):
+            cutoff = time.time() - max_age_seconds
+            return {keyword for (name, keyword), at in self.store.progress.items() if name == source and at > cutoff}
+    
+    def mark_keyword_finished(self, source: str, keyword: str) -> bool:
+        with self.store.round_trip("mark_keyword_finished"):
+            self.store.progress[(source, keyword)] = time.time()
+        return True
+    
+    def clear_scrape_progress(self, source: str) -> bool:
+        with self.store.round_trip("clear_scrape_progress"):
+            for key in [key for key in self.store.progress if key[0] == source]:
+                del self.store.progress[key]
+        return True
+    
+    def iter_job_links(self, fetch_size: int = None) -> Iterator[str]:
+        with self.store.round_trip("iter_job_links"):
+            links = list(self.store.ids_by_link)
+        yield from links
+    
+    def claim_jobs(self, worker_id: str, limit: int, lease_seconds: int, after_id: int = 0,
+                   job_ids: Optional[List[int]] = None) -> List[Job]:
+        """Lease pending, unleased jobs after after_id in id order"""
+        with self.store.round_trip("claim_jobs"):
+            candidates = sorted(job_ids) if job_ids is not None else sorted(self.store.jobs)
+            claimed = []
+            for job_id in candidates:
+                if len(claimed) >= limit:
+                    break
+                if job_id <= after_id or self.store.status.get(job_id) != "pending" or job_id in self.store.leases:
+                    continue
+                self.store.leases[job_id] = worker_id
+                claimed.append(replace(self.store.jobs[job_id]))
+            return claimed
+    
+    def release_jobs(self, worker_id: str, job_ids: List[int]) -> int:
+        if not job_ids:
+            return 0
+        with self.store.round_trip("release_jobs"):
+            released = [job_id for job_id in job_ids if self.store.leases.get(job_id) == worker_id]
+            for job_id in released:
+                del self.store.leases[job_id]
+            return len(released)
+    
+    def save_verdicts_bulk(self, relevant_jobs: List[RelevantJob], rejected_jobs: List[RejectedJob]) -> Optional[int]:
+        if not relevant_jobs and not rejected_jobs:
+            return 0
+        saved = 0
+        with self.store.round_trip("save_verdicts_bulk"):
+            for verdict in relevant_jobs + rejected_jobs:
+                if verdict.job_id in self.store.verdicts:
+                    continue
+                self.store.verdicts[verdict.job_id] = verdict
+                self.store.status[verdict.job_id] = "relevant" if isinstance(verdict, RelevantJob) else "rejected"
+                self.store.leases.pop(verdict.job_id, None)
+                saved += 1
+        return saved
+    
+    def record_failed_evaluations(self, job_ids: List[int], max_attempts: int) -> Optional[int]:
+        if not job_ids:
+            return 0
+        with self.store.round_trip("record_failed_evaluations"):
+            updated = 0
+            for job_id in job_ids:
+                if self.store.status.get(job_id) != "pending":
+                    continue
+                self.store.attempts[job_id] += 1
+                if self.store.attempts[job_id] >= max_attempts:
+                    self.store.status[job_id] = "failed"
+                updated += 1
+            return updated
+    
+    def get_cached_evaluation(self, content_hash: str, max_age_seconds: int) -> Optional[dict]:
+        with self.store.round_trip("get_cached_evaluation"):
+            return self.store.cache.get(content_hash)
+    
+    def save_cached_evaluation(self, content_hash: str, verdict: dict) -> bool:
+        with self.store.round_trip("save_cached_evaluation"):
+            self.store.cache[content_hash] = dict(verdict)
+        return True
+    
+    def evict_evaluation_cache(self, max_age_seconds: int, max_entries: int) -> int:
+        with self.store.round_trip("evict_evaluation_cache"):
+            return 0
+    
+    def save_job_signatures(self, signatures: List[Tuple[int, List[int], List[int]]]) -> bool:
+        if not signatures:
+            return True
+        with self.store.round_trip("save_job_signatures"):
+            for job_id, signature, band_keys in signatures:
+                self.store.signatures[job_id] = signature
+                for band, bucket in enumerate(band_keys):
+                    self.store.buckets[(band, bucket)].add(job_id)
+        return True
+    
+    def find_near_duplicate_candidates(self, job_id: Optional[int], band_keys: List[int]) -> List[dict]:
+        """Find evaluated jobs sharing an LSH bucket with the given band keys"""
+        with self.store.round_trip("find_near_duplicate_candidates"):
+            job_ids = set()
+            for band, bucket in enumerate(band_keys):
+                job_ids |= self.store.buckets.get((band, bucket), set())
+            job_ids.discard(job_id)
+            candidates = []
+            for candidate_id in sorted(job_ids):
+                verdict = self.store.verdicts.get(candidate_id)
+                if verdict is None:
+                    continue
+                relevant = isinstance(verdict, RelevantJob)
+                candidates.append({
+                    "job_id": candidate_id,
+                    "minhash": self.store.signatures[candidate_id],
+                    "is_relevant": relevant,
+                    "score": verdict.evaluation_score if relevant else 0,
+                    "summary": verdict.evaluation_summary if relevant else "",
+                    "reason": "" if relevant else verdict.reason,
+                    "failed": False,
+                })
+            return candidates
@@ -0,0 +1,85 @@
+import math
+import resource
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, List
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a list of values"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+class LatencyRecorder:
+    """Thread-safe collection of latency samples, in seconds, by name"""
+    
+    def __init__(self):
+        """Initialize an empty recorder"""
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+        self.lock = threading.Lock()
+    
+    def record(self, name: str, seconds: float):
+        """Add one sample"""
+        with self.lock:
+            self.samples[name].append(seconds)
+    
+    @contextmanager
+    def timed(self, name: str):
+        """Record how long the enclosed block takes"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+    
+    def summary(self) -> Dict[str, dict]:
+        """Count and p50/p95/p99 in milliseconds of every named sample"""
+        with self.lock:
+            return {
+                name: {
+                    "count": len(values),
+                    "p50_ms": round(percentile(values, 0.50) * 1000, 3),
+                    "p95_ms": round(percentile(values, 0.95) * 1000, 3),
+                    "p99_ms": round(percentile(values, 0.99) * 1000, 3),
+                }
+                for name, values in sorted(self.samples.items())
+            }
+
+def compare(current: dict, baseline: dict, tolerance: float) -> List[str]:
+    """List the metrics of current that are worse than baseline by more than tolerance
+    
+    Throughput should not fall; p95 latencies, round trips per job and peak
+    RSS should not rise.
+    """
+    checks = []
+    for stage, values in current["stages"].items():
+        if stage in baseline["stages"]:
+            checks.append((f"{stage} jobs/s", values["jobs_per_second"],
+                           baseline["stages"][stage]["jobs_per_second"], False))
+    for name, values in current["latency"].items():
+        # Sub-millisecond timings are mostly scheduler noise
+        if name in baseline["latency"] and baseline["latency"][name]["p95_ms"] >= 1:
+            checks.append((f"{name} p95 ms", values["p95_ms"], baseline["latency"][name]["p95_ms"], True))
+    for stage, value in current["db"]["round_trips_per_job"].items():
+        if stage in baseline["db"]["round_trips_per_job"]:
+            checks.append((f"{stage} db round trips/job", value, baseline["db"]["round_trips_per_job"][stage], True))
+    checks.append(("peak RSS MiB", current["peak_rss_mb"], baseline["peak_rss_mb"], True))
+    
+    regressions = []
+    for label, value, previous, lower_is_better in checks:
+        if not previous:
+            continue
+        change = (value - previous) / previous
+        if (change if lower_is_better else -change) > tolerance:
+            regressions.append(f"{label}: {previous} -> {value} ({change:+.1%})")
+    return regressions
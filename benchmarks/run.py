@@ -0,0 +1,216 @@
+import argparse
+import json
+import logging
+import platform
+import sys
+import time
+from contextlib import ExitStack, contextmanager
+from datetime import datetime, timezone
+from functools import wraps
+from types import SimpleNamespace
+from unittest.mock import patch
+from src.config import settings
+from src.evaluators.openrouter import OpenRouterEvaluator
+from src.run_evaluator import run_evaluator
+from src.run_scraper import run_scraper
+from src.scrapers.linkedin_scraper import LinkedInScraper
+from benchmarks.fakes import FakeDatabase, FakeJobSearch
+from benchmarks.metrics import LatencyRecorder, compare, peak_rss_mb
+from benchmarks.stub_openrouter import StubOpenRouter
+
+logger = logging.getLogger(__name__)
+
+class BenchmarkScraper(LinkedInScraper):
+    """LinkedIn scraper driving a FakeJobSearch instead of a browser"""
+    
+    def __init__(self, job_search: FakeJobSearch, recorder: LatencyRecorder):
+        """Initialize the scraper"""
+        super().__init__()
+        self.fake_search = job_search
+        self.recorder = recorder
+    
+    def setup(self):
+        """Use the fake search instead of logging in"""
+        self.driver = SimpleNamespace(quit=lambda: None)
+        self.job_search = self.fake_search
+        return True
+    
+    def _search(self, job_search, keyword):
+        with self.recorder.timed("scrape.search"):
+            return super()._search(job_search, keyword)
+
+@contextmanager
+def override_settings(**values):
+    """Temporarily replace settings, restoring them afterwards"""
+    previous = {name: getattr(settings, name) for name in values}
+    for name, value in values.items():
+        setattr(settings, name, value)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(settings, name, value)
+
+@contextmanager
+def timed_llm_calls(recorder: LatencyRecorder):
+    """Record the latency of every OpenRouter call, retries included"""
+    call, call_async = OpenRouterEvaluator._call_llm_api, OpenRouterEvaluator._call_llm_api_async
+    
+    @wraps(call)
+    def timed_call(self, prompt):
+        with recorder.timed("llm.call"):
+            return call(self, prompt)
+    
+    @wraps(call_async)
+    async def timed_call_async(self, prompt):
+        with recorder.timed("llm.call"):
+            return await call_async(self, prompt)
+    
+    with patch.object(OpenRouterEvaluator, "_call_llm_api", timed_call), \
+            patch.object(OpenRouterEvaluator, "_call_llm_api_async", timed_call_async):
+        yield
+
+def benchmark_settings(options, keywords, api_url) -> dict:
+    """Settings pinned for a run, so results do not depend on the local .env"""
+    return {
+        "SEARCH_KEYWORDS": keywords,
+        "SCRAPER_SESSIONS": 1,
+        "SCRAPER_SEARCHES_PER_MINUTE": 0,
+        "SCRAPER_DETAIL_PAGES_PER_MINUTE": 0,
+        "SCRAPER_FULL_RESYNC": False,
+        "SCRAPER_FETCH_DESCRIPTIONS": True,
+        "LINK_INDEX_ENABLED": True,
+        "OPENROUTER_API_KEY": "benchmark",
+        "OPENROUTER_API_URL": api_url,
+        "EVALUATOR_CONCURRENCY": options.concurrency,
+        "EVALUATOR_BATCH_SIZE": options.batch_size,
+        "EVALUATOR_REQUESTS_PER_MINUTE": options.requests_per_minute,
+        "LLM_MAX_RETRIES": options.max_retries,
+        "LLM_BACKOFF_BASE_SECONDS": 0.05,
+        "LLM_BACKOFF_MAX_SECONDS": 1,
+        "LLM_TIMEOUT_SECONDS": 30,
+        "EVALUATION_CACHE_ENABLED": options.cache,
+        "NEAR_DUPLICATE_ENABLED": options.near_duplicates,
+        "PREFILTER_ENABLED": True,
+        "PREFILTER_EXCLUDE_TITLE": "",
+        "PREFILTER_EXCLUDE_COMPANY": "",
+        "PREFILTER_EXCLUDE_LOCATION": "",
+        "PREFILTER_REQUIRED_KEYWORDS": "",
+        "PREFILTER_MIN_SIMILARITY": 0,
+    }
+
+def stage_result(jobs: int, seconds: float) -> dict:
+    """Throughput of one stage"""
+    return {
+        "jobs": jobs,
+        "seconds": round(seconds, 3),
+        "jobs_per_second": round(jobs / seconds, 2) if seconds > 0 else 0.0,
+    }
+
+def run_benchmark(options) -> dict:
+    """Scrape synthetic listings and evaluate them against the stubs, returning the results"""
+    recorder = LatencyRecorder()
+    database = FakeDatabase(options.db_latency_ms, recorder)
+    job_search = FakeJobSearch(options.listings, options.description_words, options.duplicate_rate, options.seed)
+    keywords = [f"keyword {i}" for i in range(options.keywords)]
+    stub = StubOpenRouter(options.latency_ms, options.jitter_ms, options.error_rate, options.throttle_rate,
+                          options.seed)
+    
+    with ExitStack() as stack:
+        stack.enter_context(stub)
+        stack.enter_context(database.installed())
+        stack.enter_context(override_settings(**benchmark_settings(options, keywords, stub.url)))
+        stack.enter_context(timed_llm_calls(recorder))
+        
+        started = time.perf_counter()
+        run_scraper(BenchmarkScraper(job_search, recorder))
+        scrape_seconds = time.perf_counter() - started
+        scrape_round_trips = sum(database.round_trips.values())
+        
+        started = time.perf_counter()
+        run_evaluator()
+        evaluate_seconds = time.perf_counter() - started
+        evaluate_round_trips = sum(database.round_trips.values()) - scrape_round_trips
+    
+    saved = len(database.jobs)
+    evaluated = len(database.verdicts)
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "parameters": {name: value for name, value in vars(options).items() if name not in ("output", "baseline")},
+        "stages": {
+            "scrape": stage_result(saved, scrape_seconds),
+            "evaluate": stage_result(evaluated, evaluate_seconds),
+        },
+        "latency": recorder.summary(),
+        "db": {
+            "round_trips": dict(sorted(database.round_trips.items())),
+            "round_trips_per_job": {
+                "scrape": round(scrape_round_trips / saved, 3) if saved else 0.0,
+                "evaluate": round(evaluate_round_trips / evaluated, 3) if evaluated else 0.0,
+            },
+        },
+        "llm": dict(stub.stats, unevaluated=saved - evaluated),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+def parse_args(argv=None):
+    """Parse the command line"""
+    parser = argparse.ArgumentParser(description="Offline end-to-end benchmark of the scraper and evaluator")
+    parser.add_argument("--keywords", type=int, default=5, help="search keywords to scrape")
+    parser.add_argument("--listings", type=int, default=100, help="listings returned per keyword")
+    parser.add_argument("--description-words", type=int, default=200, help="words per synthetic description")
+    parser.add_argument("--duplicate-rate", type=float, default=0.1, help="share of listings reposting a description")
+    parser.add_argument("--latency-ms", type=float, default=50, help="stub LLM latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=20, help="random extra stub LLM latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of LLM requests failing with HTTP 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="share of LLM requests failing with HTTP 429")
+    parser.add_argument("--db-latency-ms", type=float, default=0.5, help="simulated database round trip time")
+    parser.add_argument("--concurrency", type=int, default=8, help="EVALUATOR_CONCURRENCY")
+    parser.add_argument("--batch-size", type=int, default=1, help="EVALUATOR_BATCH_SIZE")
+    parser.add_argument("--requests-per-minute", type=float, default=0, help="EVALUATOR_REQUESTS_PER_MINUTE, 0 for no limit")
+    parser.add_argument("--max-retries", type=int, default=4, help="LLM_MAX_RETRIES")
+    parser.add_argument("--no-cache", dest="cache", action="store_false", help="disable the evaluation cache")
+    parser.add_argument("--no-near-duplicates", dest="near_duplicates", action="store_false",
+                        help="disable near-duplicate detection")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the synthetic data and stub failures")
+    parser.add_argument("--output", default="benchmark-results.json", help="where to write the JSON results")
+    parser.add_argument("--baseline", help="earlier results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="relative change reported as a regression")
+    parser.add_argument("--verbose", action="store_true", help="keep the pipeline's INFO logs")
+    return parser.parse_args(argv)
+
+def main(argv=None) -> int:
+    """Run the benchmark, write its results and compare them with a baseline"""
+    options = parse_args(argv)
+    root_logger = logging.getLogger()
+    level = root_logger.level
+    if not options.verbose:
+        root_logger.setLevel(logging.WARNING)
+    try:
+        results = run_benchmark(options)
+    finally:
+        root_logger.setLevel(level)
+    with open(options.output, "w") as f:
+        json.dump(results, f, indent=2)
+    
+    for stage, values in results["stages"].items():
+        print(f"{stage}: {values['jobs']} jobs in {values['seconds']}s ({values['jobs_per_second']} jobs/s)")
+    for name, values in results["latency"].items():
+        print(f"{name}: p50 {values['p50_ms']}ms, p95 {values['p95_ms']}ms, p99 {values['p99_ms']}ms")
+    print(f"db round trips per job: {results['db']['round_trips_per_job']}")
+    print(f"peak RSS: {results['peak_rss_mb']} MiB")
+    print(f"Results written to {options.output}")
+    
+    if options.baseline:
+        with open(options.baseline) as f:
+            regressions = compare(results, json.load(f), options.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print(f"No regressions against {options.baseline}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Job ids of the jobs in a batch prompt
+BATCH_JOB_ID = re.compile(r"Job ID: (\d+)")
+
+def _verdict(seed: str) -> dict:
+    """Build a deterministic verdict for a prompt"""
+    score = sum(seed.encode()) % 101
+    return {
+        "is_relevant": score >= 70,
+        "score": score,
+        "reason": "Synthetic verdict from the benchmark stub",
+        "summary": "Synthetic job" if score >= 70 else "",
+        "skills_match": ["python"],
+        "missing_skills": [],
+    }
+
+class StubOpenRouter:
+    """Local stand-in for the OpenRouter chat completions API
+    
+    Every request waits latency_ms (plus up to jitter_ms), then fails with
+    HTTP 429 with probability throttle_rate, with HTTP 500 with probability
+    error_rate, and otherwise answers with a verdict for every job in the
+    prompt. Counters of what was served are kept in stats.
+    """
+    
+    def __init__(self, latency_ms: float = 0, jitter_ms: float = 0, error_rate: float = 0,
+                 throttle_rate: float = 0, seed: int = 0):
+        """Initialize the stub"""
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "throttled": 0, "errors": 0}
+        self.server = None
+        self._thread = None
+    
+    @property
+    def url(self) -> str:
+        """Chat completions URL of the running stub"""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/api/v1/chat/completions"
+    
+    def __enter__(self):
+        """Start serving"""
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stop serving"""
+        self.stop()
+    
+    def start(self):
+        """Serve on a free local port in a background thread"""
+        stub = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                status, payload = stub.respond(json.loads(body or b"{}"))
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self._thread = threading.Thread(target=self.server.serve_forever, name="stub-openrouter", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Stop serving"""
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+    
+    def respond(self, request: dict) -> tuple:
+        """Decide the (status, payload) answer to one chat completion request"""
+        with self.lock:
+            self.stats["requests"] += 1
+            delay = (self.latency_ms + self.random.random() * self.jitter_ms) / 1000
+            roll = self.random.random()
+            if roll < self.throttle_rate:
+                self.stats["throttled"] += 1
+                status = 429
+            elif roll < self.throttle_rate + self.error_rate:
+                self.stats["errors"] += 1
+                status = 500
+            else:
+                status = 200
+        time.sleep(delay)
+        
+        if status != 200:
+            return status, {"error": {"code": status, "message": "Synthetic failure"}}
+        
+        prompt = request["messages"][-1]["content"]
+        job_ids = BATCH_JOB_ID.findall(prompt)
+        if job_ids:
+            content = {"evaluations": [dict(_verdict(prompt + job_id), job_id=int(job_id)) for job_id in job_ids]}
+        else:
+            content = _verdict(prompt)
+        return 200, {"choices": [{"message": {"role": "assistant", "content": json.dumps(content)}}]}
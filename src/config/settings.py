@@ -9,17 +9,102 @@ DB_HOST = os.getenv("DB_HOST", "database")
 DB_NAME = os.getenv("POSTGRES_DB", "jobflow")
 DB_USER = os.getenv("POSTGRES_USER", "jobflow")
 DB_PASSWORD = os.getenv("POSTGRES_PASSWORD", "password")
+DB_FETCH_SIZE = int(os.getenv("DB_FETCH_SIZE", 100))
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", 1))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", 10))
 
 # LinkedIn settings
 LINKEDIN_USERNAME = os.getenv("LINKEDIN_USERNAME")
 LINKEDIN_PASSWORD = os.getenv("LINKEDIN_PASSWORD")
 SEARCH_KEYWORDS = os.getenv("SEARCH_KEYWORDS", "Python Developer").split(",")
 SCRAPER_INTERVAL_SECONDS = int(os.getenv("SCRAPER_INTERVAL_SECONDS", 21600))
+SCRAPER_BACKEND = os.getenv("SCRAPER_BACKEND", "selenium")
+SCRAPER_FULL_RESYNC = os.getenv("SCRAPER_FULL_RESYNC", "false").lower() == "true"
+SCRAPER_RESUME_MAX_AGE_SECONDS = int(os.getenv("SCRAPER_RESUME_MAX_AGE_SECONDS", 86400))
+SCRAPER_KEEP_ALIVE = os.getenv("SCRAPER_KEEP_ALIVE", "false").lower() == "true"
+SCRAPER_FETCH_DESCRIPTIONS = os.getenv("SCRAPER_FETCH_DESCRIPTIONS", "true").lower() == "true"
+LINK_INDEX_ENABLED = os.getenv("LINK_INDEX_ENABLED", "true").lower() == "true"
+LINK_INDEX_CAPACITY = int(os.getenv("LINK_INDEX_CAPACITY", 500000))
+LINK_INDEX_ERROR_RATE = float(os.getenv("LINK_INDEX_ERROR_RATE", 0.001))
+SCRAPER_SESSIONS = int(os.getenv("SCRAPER_SESSIONS", 1))
+SCRAPER_SEARCHES_PER_MINUTE = float(os.getenv("SCRAPER_SEARCHES_PER_MINUTE", 30))
+SCRAPER_DETAIL_PAGES_PER_MINUTE = float(os.getenv("SCRAPER_DETAIL_PAGES_PER_MINUTE", 60))
+
+# HTTP scraper settings
+LINKEDIN_GUEST_API_URL = os.getenv("LINKEDIN_GUEST_API_URL", "https://www.linkedin.com/jobs-guest/jobs/api")
+SCRAPER_HTTP_WORKERS = int(os.getenv("SCRAPER_HTTP_WORKERS", 8))
+SCRAPER_HTTP_MAX_PAGES = int(os.getenv("SCRAPER_HTTP_MAX_PAGES", 4))
+SCRAPER_HTTP_REQUESTS_PER_MINUTE = float(os.getenv("SCRAPER_HTTP_REQUESTS_PER_MINUTE", 120))
+SCRAPER_HTTP_TIMEOUT_SECONDS = float(os.getenv("SCRAPER_HTTP_TIMEOUT_SECONDS", 15))
 
 # LLM settings
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
+OPENROUTER_API_URL = os.getenv("OPENROUTER_API_URL", "https://openrouter.ai/api/v1/chat/completions")
 LLM_MODEL = os.getenv("LLM_MODEL", "google/gemini-1.5-pro")
 EVALUATOR_INTERVAL_SECONDS = int(os.getenv("EVALUATOR_INTERVAL_SECONDS", 3600))
+EVALUATOR_LISTEN = os.getenv("EVALUATOR_LISTEN", "true").lower() == "true"
+EVALUATOR_DEBOUNCE_SECONDS = float(os.getenv("EVALUATOR_DEBOUNCE_SECONDS", 2))
+EVALUATOR_CONCURRENCY = int(os.getenv("EVALUATOR_CONCURRENCY", 1))
+EVALUATOR_REQUESTS_PER_MINUTE = float(os.getenv("EVALUATOR_REQUESTS_PER_MINUTE", 60))
+EVALUATOR_BATCH_SIZE = int(os.getenv("EVALUATOR_BATCH_SIZE", 1))
+EVALUATOR_CLAIM_BATCH_SIZE = int(os.getenv("EVALUATOR_CLAIM_BATCH_SIZE", 50))
+EVALUATOR_LEASE_SECONDS = int(os.getenv("EVALUATOR_LEASE_SECONDS", 900))
+# Failed evaluations of a job before it is set aside as failed
+EVALUATOR_MAX_ATTEMPTS = int(os.getenv("EVALUATOR_MAX_ATTEMPTS", 3))
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", 60))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", 4))
+LLM_BACKOFF_BASE_SECONDS = float(os.getenv("LLM_BACKOFF_BASE_SECONDS", 1))
+LLM_BACKOFF_MAX_SECONDS = float(os.getenv("LLM_BACKOFF_MAX_SECONDS", 60))
+DESCRIPTION_COMPACTION_ENABLED = os.getenv("DESCRIPTION_COMPACTION_ENABLED", "true").lower() == "true"
+LLM_DESCRIPTION_TOKEN_BUDGET = int(os.getenv("LLM_DESCRIPTION_TOKEN_BUDGET", 1500))
+# Per-model overrides, e.g. "openai/gpt-4o-mini=1000,google/gemini-1.5-pro=3000"
+LLM_TOKEN_BUDGETS = os.getenv("LLM_TOKEN_BUDGETS", "")
+VERDICT_BATCH_SIZE = int(os.getenv("VERDICT_BATCH_SIZE", 50))
+VERDICT_FLUSH_INTERVAL_MS = int(os.getenv("VERDICT_FLUSH_INTERVAL_MS", 1000))
+
+# Combined pipeline settings
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", 200))
+
+# Metrics endpoint (Prometheus text format at /metrics)
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "false").lower() == "true"
+METRICS_HOST = os.getenv("METRICS_HOST", "0.0.0.0")
+METRICS_PORT = int(os.getenv("METRICS_PORT", 9100))
+
+# Tracing and profiling; SIGUSR1 switches capturing on and off in a running process
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "false").lower() == "true"
+TRACING_MODE = os.getenv("TRACING_MODE", "spans")  # spans, sample or cprofile
+TRACING_SAMPLE_INTERVAL_MS = float(os.getenv("TRACING_SAMPLE_INTERVAL_MS", 5))
+TRACING_OUTPUT_DIR = os.getenv("TRACING_OUTPUT_DIR", "profiles")
+
+# User profile
+USER_SKILLS = os.getenv("USER_SKILLS", "Python, Data Science")
+USER_EXPERIENCE = os.getenv("USER_EXPERIENCE", "5+ years in software development")
+USER_PREFERENCES = os.getenv("USER_PREFERENCES", "Remote work")
+# Bump to invalidate cached verdicts; derived from the profile when unset
+PROFILE_VERSION = os.getenv("PROFILE_VERSION", "")
+
+# Evaluation cache settings
+EVALUATION_CACHE_ENABLED = os.getenv("EVALUATION_CACHE_ENABLED", "true").lower() == "true"
+EVALUATION_CACHE_TTL_SECONDS = int(os.getenv("EVALUATION_CACHE_TTL_SECONDS", 30 * 24 * 3600))
+EVALUATION_CACHE_MAX_ENTRIES = int(os.getenv("EVALUATION_CACHE_MAX_ENTRIES", 100000))
+EVALUATION_CACHE_LRU_SIZE = int(os.getenv("EVALUATION_CACHE_LRU_SIZE", 1024))
+
+# Near-duplicate detection settings
+NEAR_DUPLICATE_ENABLED = os.getenv("NEAR_DUPLICATE_ENABLED", "true").lower() == "true"
+NEAR_DUPLICATE_THRESHOLD = float(os.getenv("NEAR_DUPLICATE_THRESHOLD", 0.9))
+MINHASH_PERMUTATIONS = int(os.getenv("MINHASH_PERMUTATIONS", 128))
+LSH_BANDS = int(os.getenv("LSH_BANDS", 16))
+
+# Pre-filter settings; every rule is disabled when left empty
+PREFILTER_ENABLED = os.getenv("PREFILTER_ENABLED", "true").lower() == "true"
+PREFILTER_EXCLUDE_TITLE = os.getenv("PREFILTER_EXCLUDE_TITLE", "")
+PREFILTER_EXCLUDE_COMPANY = os.getenv("PREFILTER_EXCLUDE_COMPANY", "")
+PREFILTER_EXCLUDE_LOCATION = os.getenv("PREFILTER_EXCLUDE_LOCATION", "")
+PREFILTER_REQUIRED_KEYWORDS = os.getenv("PREFILTER_REQUIRED_KEYWORDS", "")
+PREFILTER_MIN_SIMILARITY = float(os.getenv("PREFILTER_MIN_SIMILARITY", 0))
 
 # Selenium settings
-HEADLESS = os.getenv("ENVIRONMENT", "development") == "production"
\ No newline at end of file
+HEADLESS = os.getenv("ENVIRONMENT", "development") == "production"
+# Persisted LinkedIn session; either one lets a run skip the login
+LINKEDIN_COOKIES_PATH = os.getenv("LINKEDIN_COOKIES_PATH", "")
+CHROME_USER_DATA_DIR = os.getenv("CHROME_USER_DATA_DIR") or None
\ No newline at end of file
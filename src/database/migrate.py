@@ -0,0 +1,70 @@
+import logging
+from pathlib import Path
+from typing import List, Tuple
+from src.database.operations import DatabaseOperations
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+
+# Serializes migrations when several processes start at once
+MIGRATION_LOCK_ID = 7351
+
+def list_migrations() -> List[Tuple[int, Path]]:
+    """List the migration files as (version, path), oldest first"""
+    migrations = []
+    for path in MIGRATIONS_DIR.glob("*.sql"):
+        version = int(path.name.split("_", 1)[0])
+        migrations.append((version, path))
+    return sorted(migrations)
+
+def apply_migrations(db: DatabaseOperations) -> int:
+    """Apply every migration the database has not seen yet
+    
+    Pending migrations run in one transaction together with their entries in
+    schema_migrations, so a failing migration leaves the schema untouched.
+    Returns the number of migrations applied.
+    """
+    if not db.conn:
+        db.connect()
+    
+    try:
+        cursor = db.conn.cursor()
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", (MIGRATION_LOCK_ID,))
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                applied_at TIMESTAMP NOT NULL DEFAULT NOW()
+            )
+            """
+        )
+        cursor.execute("SELECT version FROM schema_migrations")
+        applied = {row[0] for row in cursor.fetchall()}
+        
+        pending = [(version, path) for version, path in list_migrations() if version not in applied]
+        for version, path in pending:
+            logger.info(f"Applying migration {path.name}")
+            cursor.execute(path.read_text())
+            cursor.execute(
+                "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+                (version, path.stem)
+            )
+        db.conn.commit()
+        return len(pending)
+    except Exception as e:
+        db.conn.rollback()
+        logger.error(f"Error applying migrations: {e}")
+        raise
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    db = DatabaseOperations()
+    try:
+        logger.info(f"Applied {apply_migrations(db)} migrations")
+    finally:
+        db.close()
@@ -0,0 +1,90 @@
+-- Initial schema; every statement is idempotent so databases created before
+-- migrations were versioned adopt it unchanged
+
+CREATE TABLE IF NOT EXISTS scraped_jobs (
+    id SERIAL PRIMARY KEY,
+    title TEXT NOT NULL DEFAULT '',
+    company TEXT NOT NULL DEFAULT '',
+    location TEXT NOT NULL DEFAULT '',
+    description TEXT NOT NULL DEFAULT '',
+    link TEXT NOT NULL,
+    source TEXT NOT NULL DEFAULT '',
+    scraped_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+-- Deduplication of scraped jobs happens on the link (ON CONFLICT (link))
+CREATE UNIQUE INDEX IF NOT EXISTS scraped_jobs_link_key ON scraped_jobs (link);
+
+CREATE TABLE IF NOT EXISTS relevant_jobs (
+    id SERIAL PRIMARY KEY,
+    job_id INTEGER NOT NULL REFERENCES scraped_jobs (id) ON DELETE CASCADE,
+    evaluation_score REAL NOT NULL DEFAULT 0,
+    evaluation_summary TEXT NOT NULL DEFAULT '',
+    evaluated_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS rejected_jobs (
+    id SERIAL PRIMARY KEY,
+    job_id INTEGER NOT NULL REFERENCES scraped_jobs (id) ON DELETE CASCADE,
+    reason TEXT NOT NULL DEFAULT '',
+    evaluated_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+-- Verdicts keyed by a hash of the normalized job content, model and profile
+CREATE TABLE IF NOT EXISTS evaluation_cache (
+    content_hash TEXT PRIMARY KEY,
+    verdict JSONB NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    last_used_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS evaluation_cache_last_used_at_idx ON evaluation_cache (last_used_at);
+
+-- MinHash signatures and LSH buckets for near-duplicate detection
+ALTER TABLE scraped_jobs ADD COLUMN IF NOT EXISTS minhash BIGINT[];
+
+CREATE TABLE IF NOT EXISTS job_lsh_buckets (
+    band SMALLINT NOT NULL,
+    bucket BIGINT NOT NULL,
+    job_id INTEGER NOT NULL REFERENCES scraped_jobs (id) ON DELETE CASCADE,
+    PRIMARY KEY (band, bucket, job_id)
+);
+
+-- Evaluation work queue: a job is claimed by one worker until its lease expires
+ALTER TABLE scraped_jobs ADD COLUMN IF NOT EXISTS claimed_by TEXT;
+ALTER TABLE scraped_jobs ADD COLUMN IF NOT EXISTS claim_expires_at TIMESTAMP;
+
+-- One verdict per job, even if a lease expires while a worker is still busy
+CREATE UNIQUE INDEX IF NOT EXISTS relevant_jobs_job_id_key ON relevant_jobs (job_id);
+CREATE UNIQUE INDEX IF NOT EXISTS rejected_jobs_job_id_key ON rejected_jobs (job_id);
+
+-- Newest posting seen per scraper and keyword, for incremental scraping
+CREATE TABLE IF NOT EXISTS scrape_checkpoints (
+    source TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    last_posting_id BIGINT NOT NULL,
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (source, keyword)
+);
+
+-- Wake listening evaluators when new jobs are stored; one notification per
+-- statement, split into chunks of ids to stay under the 8000 byte payload limit
+CREATE OR REPLACE FUNCTION notify_new_jobs() RETURNS TRIGGER AS $$
+DECLARE
+    job_ids TEXT;
+BEGIN
+    FOR job_ids IN
+        SELECT string_agg(id::TEXT, ',' ORDER BY id)
+        FROM (SELECT id, (ROW_NUMBER() OVER (ORDER BY id) - 1) / 500 AS chunk FROM new_jobs) numbered
+        GROUP BY chunk
+    LOOP
+        PERFORM pg_notify('new_jobs', job_ids);
+    END LOOP;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER scraped_jobs_notify_new_jobs
+    AFTER INSERT ON scraped_jobs
+    REFERENCING NEW TABLE AS new_jobs
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_new_jobs();
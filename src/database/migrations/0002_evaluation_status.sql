@@ -0,0 +1,16 @@
+-- Track each job's evaluation state on the job itself, so finding pending
+-- work reads a small partial index instead of anti-joining every verdict
+ALTER TABLE scraped_jobs ADD COLUMN IF NOT EXISTS evaluation_status TEXT NOT NULL DEFAULT 'pending'
+    CHECK (evaluation_status IN ('pending', 'relevant', 'rejected'));
+
+UPDATE scraped_jobs j SET evaluation_status = 'relevant'
+WHERE EXISTS (SELECT 1 FROM relevant_jobs r WHERE r.job_id = j.id);
+
+UPDATE scraped_jobs j SET evaluation_status = 'rejected'
+WHERE EXISTS (SELECT 1 FROM rejected_jobs x WHERE x.job_id = j.id);
+
+CREATE INDEX IF NOT EXISTS scraped_jobs_pending_idx ON scraped_jobs (id)
+WHERE evaluation_status = 'pending';
+
+-- Foreign keys are not indexed by Postgres; cascading deletes and lookups by job need these
+CREATE INDEX IF NOT EXISTS job_lsh_buckets_job_id_idx ON job_lsh_buckets (job_id);
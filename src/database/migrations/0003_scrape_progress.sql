@@ -0,0 +1,8 @@
+-- Keywords finished by the scrape run in progress, so an interrupted run
+-- resumes where it stopped; cleared once a run gets through every keyword
+CREATE TABLE IF NOT EXISTS scrape_progress (
+    source TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    finished_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (source, keyword)
+);
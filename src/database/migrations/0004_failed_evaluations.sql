@@ -0,0 +1,8 @@
+-- Evaluations that fail for reasons other than throttling leave the job
+-- pending and count an attempt; after EVALUATOR_MAX_ATTEMPTS the job is set
+-- aside as failed instead of being recorded as rejected
+ALTER TABLE scraped_jobs ADD COLUMN IF NOT EXISTS evaluation_attempts INTEGER NOT NULL DEFAULT 0;
+
+ALTER TABLE scraped_jobs DROP CONSTRAINT IF EXISTS scraped_jobs_evaluation_status_check;
+ALTER TABLE scraped_jobs ADD CONSTRAINT scraped_jobs_evaluation_status_check
+    CHECK (evaluation_status IN ('pending', 'relevant', 'rejected', 'failed'));
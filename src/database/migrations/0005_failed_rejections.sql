@@ -0,0 +1,7 @@
+-- Failed evaluations used to be stored as rejections; flag them so they are
+-- never reused as verdicts, e.g. by near-duplicates of the job
+ALTER TABLE rejected_jobs ADD COLUMN IF NOT EXISTS failed BOOLEAN NOT NULL DEFAULT FALSE;
+
+UPDATE rejected_jobs SET failed = TRUE
+WHERE reason LIKE 'Error during evaluation:%'
+   OR reason IN ('Failed to parse LLM response', 'Evaluator not set up properly');
@@ -1,12 +1,113 @@
 import logging
-import psycopg2
+import re
+import select
+from psycopg2.extras import Json, execute_values
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from src.config import settings
 from src.database.models import Job, RelevantJob, RejectedJob
+from src.database.pool import PreparingConnection, get_pool
+from src.utils.tracing import traced_methods
 
 logger = logging.getLogger(__name__)
 
+# Channel the scraped_jobs insert trigger notifies with comma-separated new job ids
+NEW_JOBS_CHANNEL = "new_jobs"
+
+# Hot queries, kept here so tests can check their plans against the real schema
+SAVE_JOB_QUERY = """
+    INSERT INTO scraped_jobs (title, company, location, description, link, source)
+    VALUES (%s, %s, %s, %s, %s, %s)
+    RETURNING id
+"""
+
+JOB_EXISTS_QUERY = "SELECT id FROM scraped_jobs WHERE link = %s"
+
+# Served by the partial index on pending jobs, so its cost follows the backlog, not the history
+UNEVALUATED_JOBS_QUERY = """
+    SELECT j.id, j.title, j.company, j.location, j.description, j.link, j.source, j.scraped_at
+    FROM scraped_jobs j
+    WHERE j.evaluation_status = 'pending' AND j.id > %s
+    ORDER BY j.id
+    LIMIT %s
+"""
+
+CLAIM_JOBS_QUERY = """
+    UPDATE scraped_jobs j
+    SET claimed_by = %s, claim_expires_at = NOW() + %s * INTERVAL '1 second'
+    WHERE j.id IN (
+        SELECT s.id
+        FROM scraped_jobs s
+        WHERE s.evaluation_status = 'pending' AND s.id > %s
+          {id_filter}
+          AND (s.claim_expires_at IS NULL OR s.claim_expires_at < NOW())
+        ORDER BY s.id
+        LIMIT %s
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING j.id, j.title, j.company, j.location, j.description, j.link, j.source, j.scraped_at
+"""
+
+# Records the verdict and marks the job relevant in one statement
+SAVE_RELEVANT_JOB_QUERY = """
+    WITH verdict AS (
+        INSERT INTO relevant_jobs (job_id, evaluation_score, evaluation_summary)
+        VALUES (%s, %s, %s)
+        ON CONFLICT (job_id) DO NOTHING
+        RETURNING id, job_id
+    ), status AS (
+        UPDATE scraped_jobs
+        SET evaluation_status = 'relevant', claimed_by = NULL, claim_expires_at = NULL
+        WHERE id IN (SELECT job_id FROM verdict)
+    )
+    SELECT id FROM verdict
+"""
+
+# Records the verdict and marks the job rejected in one statement
+SAVE_REJECTED_JOB_QUERY = """
+    WITH verdict AS (
+        INSERT INTO rejected_jobs (job_id, reason)
+        VALUES (%s, %s)
+        ON CONFLICT (job_id) DO NOTHING
+        RETURNING id, job_id
+    ), status AS (
+        UPDATE scraped_jobs
+        SET evaluation_status = 'rejected', claimed_by = NULL, claim_expires_at = NULL
+        WHERE id IN (SELECT job_id FROM verdict)
+    )
+    SELECT id FROM verdict
+"""
+
+# Multi-row variants of the verdict queries, for execute_values
+SAVE_RELEVANT_JOBS_QUERY = """
+    WITH verdict AS (
+        INSERT INTO relevant_jobs (job_id, evaluation_score, evaluation_summary)
+        VALUES %s
+        ON CONFLICT (job_id) DO NOTHING
+        RETURNING job_id
+    ), status AS (
+        UPDATE scraped_jobs
+        SET evaluation_status = 'relevant', claimed_by = NULL, claim_expires_at = NULL
+        WHERE id IN (SELECT job_id FROM verdict)
+    )
+    SELECT job_id FROM verdict
+"""
+
+SAVE_REJECTED_JOBS_QUERY = """
+    WITH verdict AS (
+        INSERT INTO rejected_jobs (job_id, reason)
+        VALUES %s
+        ON CONFLICT (job_id) DO NOTHING
+        RETURNING job_id
+    ), status AS (
+        UPDATE scraped_jobs
+        SET evaluation_status = 'rejected', claimed_by = NULL, claim_expires_at = NULL
+        WHERE id IN (SELECT job_id FROM verdict)
+    )
+    SELECT job_id FROM verdict
+"""
+
+@traced_methods
 class DatabaseOperations:
     """Database operations for job management"""
     
@@ -17,16 +118,24 @@ class DatabaseOperations:
         self.user = user or settings.DB_USER
         self.password = password or settings.DB_PASSWORD
         self.conn = None
+        self.pool = None
+        # Listening connections keep session state and are not reused
+        self.listening = False
+    
+    def __enter__(self):
+        """Check out a connection for the duration of a with block"""
+        self.connect()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Hand the connection back to the pool"""
+        self.close()
     
     def connect(self):
-        """Connect to the database"""
+        """Connect to the database, taking a connection from the shared pool"""
         try:
-            self.conn = psycopg2.connect(
-                host=self.host,
-                database=self.database,
-                user=self.user,
-                password=self.password
-            )
+            self.pool = get_pool(self.host, self.database, self.user, self.password)
+            self.conn = self.pool.getconn()
             logger.info("Connected to database")
             return self.conn
         except Exception as e:
@@ -34,10 +143,45 @@ class DatabaseOperations:
             raise
     
     def close(self):
-        """Close the database connection"""
+        """Release the database connection back to the pool"""
         if self.conn:
-            self.conn.close()
+            if self.pool:
+                self.pool.putconn(self.conn, close=self.listening)
+            else:
+                self.conn.close()
             self.conn = None
+            self.pool = None
+            self.listening = False
+    
+    def _execute(self, cursor, name: str, query: str, params: tuple):
+        """Execute a hot query as a server-side prepared statement
+        
+        Each pooled connection parses the query once and reuses the plan for
+        later calls. Connections not from the pool run the query directly.
+        """
+        if not isinstance(self.conn, PreparingConnection):
+            cursor.execute(query, params)
+            return
+        
+        if name not in self.conn.prepared:
+            # Prepared statements take $n placeholders instead of %s
+            positional = iter(range(1, len(params) + 1))
+            cursor.execute(f"PREPARE {name} AS " + re.sub(r"%s", lambda _: f"${next(positional)}", query))
+            self.conn.prepared.add(name)
+        cursor.execute(f"EXECUTE {name} (" + ", ".join(["%s"] * len(params)) + ")", params)
+    
+    def _row_to_job(self, row) -> Job:
+        """Convert a scraped_jobs row to a Job object"""
+        return Job(
+            id=row[0],
+            title=row[1],
+            company=row[2],
+            location=row[3],
+            description=row[4],
+            link=row[5],
+            source=row[6],
+            scraped_at=row[7]
+        )
     
     def save_job(self, job: Job) -> Optional[int]:
         """Save a job to the database"""
@@ -46,12 +190,8 @@ class DatabaseOperations:
             
         try:
             cursor = self.conn.cursor()
-            cursor.execute(
-                """
-                INSERT INTO scraped_jobs (title, company, location, description, link, source)
-                VALUES (%s, %s, %s, %s, %s, %s)
-                RETURNING id
-                """,
+            self._execute(
+                cursor, "save_job", SAVE_JOB_QUERY,
                 (job.title, job.company, job.location, job.description, job.link, job.source)
             )
             job_id = cursor.fetchone()[0]
@@ -63,60 +203,290 @@ class DatabaseOperations:
             logger.error(f"Error saving job to database: {e}")
             return None
     
-    def job_exists(self, job_link: str) -> bool:
-        """Check if a job with the given link already exists in the database"""
+    def save_jobs_bulk(self, jobs: List[Job]) -> Tuple[int, int]:
+        """Save a batch of jobs in a single transaction, skipping known links
+
+        Duplicates are resolved by the database through the unique index on
+        ``scraped_jobs.link``. Saved jobs get their ``id`` filled in.
+        Returns a ``(saved, duplicates)`` tuple.
+        """
+        if not jobs:
+            return 0, 0
+        
+        if not self.conn:
+            self.connect()
+        
+        # Drop duplicates inside the batch so one INSERT never conflicts with itself
+        unique_jobs = {}
+        for job in jobs:
+            unique_jobs.setdefault(job.link, job)
+        
+        try:
+            cursor = self.conn.cursor()
+            rows = execute_values(
+                cursor,
+                """
+                INSERT INTO scraped_jobs (title, company, location, description, link, source)
+                VALUES %s
+                ON CONFLICT (link) DO NOTHING
+                RETURNING id, link
+                """,
+                [
+                    (job.title, job.company, job.location, job.description, job.link, job.source)
+                    for job in unique_jobs.values()
+                ],
+                fetch=True
+            )
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Error saving jobs to database: {e}")
+            return 0, 0
+        
+        for job_id, link in rows:
+            unique_jobs[link].id = job_id
+        
+        saved = len(rows)
+        duplicates = len(jobs) - saved
+        logger.info(f"Saved {saved} jobs to database, skipped {duplicates} duplicates")
+        return saved, duplicates
+    
+    def get_scrape_checkpoints(self, source: str) -> Dict[str, int]:
+        """Get the newest posting id seen for each keyword of a scraper"""
+        if not self.conn:
+            self.connect()
+            
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "SELECT keyword, last_posting_id FROM scrape_checkpoints WHERE source = %s",
+                (source,)
+            )
+            return dict(cursor.fetchall())
+        except Exception as e:
+            logger.error(f"Error getting scrape checkpoints: {e}")
+            return {}
+    
+    def save_scrape_checkpoints(self, source: str, checkpoints: Dict[str, int]) -> bool:
+        """Save per-keyword checkpoints of a scraper, never moving one backwards"""
+        if not checkpoints:
+            return True
+        
+        if not self.conn:
+            self.connect()
+            
+        try:
+            cursor = self.conn.cursor()
+            execute_values(
+                cursor,
+                """
+                INSERT INTO scrape_checkpoints (source, keyword, last_posting_id)
+                VALUES %s
+                ON CONFLICT (source, keyword) DO UPDATE
+                SET last_posting_id = GREATEST(scrape_checkpoints.last_posting_id, EXCLUDED.last_posting_id),
+                    updated_at = NOW()
+                """,
+                [(source, keyword, posting_id) for keyword, posting_id in checkpoints.items()]
+            )
+            self.conn.commit()
+            return True
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Error saving scrape checkpoints: {e}")
+            return False
+    
+    def get_finished_keywords(self, source: str, max_age_seconds: int) -> Set[str]:
+        """Get the keywords an unfinished scrape run of a scraper already got through
+        
+        Progress older than max_age_seconds belongs to a run that was
+        abandoned long ago and is ignored.
+        """
+        if not self.conn:
+            self.connect()
+            
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                """
+                SELECT keyword FROM scrape_progress
+                WHERE source = %s AND finished_at > NOW() - make_interval(secs => %s)
+                """,
+                (source, max_age_seconds)
+            )
+            keywords = {row[0] for row in cursor.fetchall()}
+            self.conn.commit()
+            return keywords
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Error getting scrape progress: {e}")
+            return set()
+    
+    def mark_keyword_finished(self, source: str, keyword: str) -> bool:
+        """Record that the current scrape run of a scraper has stored a keyword's jobs"""
         if not self.conn:
             self.connect()
             
         try:
             cursor = self.conn.cursor()
             cursor.execute(
-                "SELECT id FROM scraped_jobs WHERE link = %s",
-                (job_link,)
+                """
+                INSERT INTO scrape_progress (source, keyword) VALUES (%s, %s)
+                ON CONFLICT (source, keyword) DO UPDATE SET finished_at = NOW()
+                """,
+                (source, keyword)
             )
+            self.conn.commit()
+            return True
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Error saving scrape progress: {e}")
+            return False
+    
+    def clear_scrape_progress(self, source: str) -> bool:
+        """Forget the progress of a scraper's run once it got through every keyword"""
+        if not self.conn:
+            self.connect()
+            
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("DELETE FROM scrape_progress WHERE source = %s", (source,))
+            self.conn.commit()
+            return True
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Error clearing scrape progress: {e}")
+            return False
+    
+    def iter_job_links(self, fetch_size: int = None) -> Iterator[str]:
+        """Stream the links of all scraped jobs with a single server-side cursor"""
+        if not self.conn:
+            self.connect()
+            
+        cursor = self.conn.cursor(name="job_links")
+        cursor.itersize = fetch_size or settings.DB_FETCH_SIZE * 10
+        try:
+            cursor.execute("SELECT link FROM scraped_jobs")
+            for (link,) in cursor:
+                yield link
+        except Exception as e:
+            logger.error(f"Error streaming job links: {e}")
+        finally:
+            cursor.close()
+            # End the read transaction the named cursor lived in
+            self.conn.commit()
+    
+    def job_exists(self, job_link: str) -> bool:
+        """Check if a job with the given link already exists in the database"""
+        if not self.conn:
+            self.connect()
+            
+        try:
+            cursor = self.conn.cursor()
+            self._execute(cursor, "job_exists", JOB_EXISTS_QUERY, (job_link,))
             result = cursor.fetchone()
             return result is not None
         except Exception as e:
             logger.error(f"Error checking if job exists: {e}")
             return False
     
+    def count_pending_jobs(self) -> Optional[int]:
+        """Count the jobs waiting for a verdict, or None if the database cannot be read"""
+        if not self.conn:
+            self.connect()
+            
+        try:
+            cursor = self.conn.cursor()
+            # Counts from the partial index of pending jobs
+            cursor.execute("SELECT COUNT(*) FROM scraped_jobs WHERE evaluation_status = 'pending'")
+            count = cursor.fetchone()[0]
+            self.conn.commit()
+            return count
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Error counting pending jobs: {e}")
+            return None
+    
     def get_unevaluated_jobs(self) -> List[Job]:
         """Get jobs that haven't been evaluated yet"""
+        jobs = list(self.iter_unevaluated_jobs())
+        logger.info(f"Found {len(jobs)} unevaluated jobs")
+        return jobs
+    
+    def iter_unevaluated_jobs(self, fetch_size: int = None) -> Iterator[Job]:
+        """Stream jobs that haven't been evaluated yet, one page at a time
+        
+        Pages are fetched by keyset pagination on id, so only fetch_size jobs
+        are held in memory, and commits made while consuming the stream (such
+        as saving verdicts) do not invalidate it the way a named cursor would.
+        Each page is read in its own transaction, committed before its jobs
+        are yielded.
+        """
+        if not self.conn:
+            self.connect()
+        
+        fetch_size = fetch_size or settings.DB_FETCH_SIZE
+        last_id = 0
+        while True:
+            try:
+                cursor = self.conn.cursor()
+                cursor.execute(
+                    UNEVALUATED_JOBS_QUERY,
+                    (last_id, fetch_size)
+                )
+                rows = cursor.fetchall()
+                self.conn.commit()
+            except Exception as e:
+                self.conn.rollback()
+                logger.error(f"Error getting unevaluated jobs: {e}")
+                return
+            
+            for row in rows:
+                yield self._row_to_job(row)
+            
+            if len(rows) < fetch_size:
+                return
+            last_id = rows[-1][0]
+    
+    def claim_jobs(self, worker_id: str, limit: int, lease_seconds: int, after_id: int = 0,
+                   job_ids: Optional[List[int]] = None) -> List[Job]:
+        """Claim a batch of unevaluated jobs for one worker
+        
+        Claimed jobs are leased to the worker and skipped by other workers
+        until the lease expires, so a crashed worker's jobs are picked up
+        again after lease_seconds. Rows locked by a concurrent claim are
+        skipped rather than waited for. Passing the last claimed id as
+        after_id pages through the queue without rescanning earlier rows.
+        Passing job_ids restricts the claim to those jobs, e.g. the ones a
+        notification announced.
+        """
         if not self.conn:
             self.connect()
             
         try:
             cursor = self.conn.cursor()
-            cursor.execute(
-                """
-                SELECT j.id, j.title, j.company, j.location, j.description, j.link, j.source, j.scraped_at
-                FROM scraped_jobs j
-                LEFT JOIN relevant_jobs r ON j.id = r.job_id
-                LEFT JOIN rejected_jobs x ON j.id = x.job_id
-                WHERE r.id IS NULL AND x.id IS NULL
-                """
+            id_filter = "AND s.id = ANY(%s)" if job_ids is not None else ""
+            params = (worker_id, lease_seconds, after_id)
+            if job_ids is not None:
+                params += (list(job_ids),)
+            self._execute(
+                cursor, "claim_jobs_by_id" if job_ids is not None else "claim_jobs",
+                CLAIM_JOBS_QUERY.format(id_filter=id_filter), params + (limit,)
             )
-            jobs = []
-            for row in cursor.fetchall():
-                job = Job(
-                    id=row[0],
-                    title=row[1],
-                    company=row[2],
-                    location=row[3],
-                    description=row[4],
-                    link=row[5],
-                    source=row[6],
-                    scraped_at=row[7]
-                )
-                jobs.append(job)
-            logger.info(f"Found {len(jobs)} unevaluated jobs")
+            rows = cursor.fetchall()
+            self.conn.commit()
+            jobs = [self._row_to_job(row) for row in sorted(rows)]
+            logger.info(f"Claimed {len(jobs)} jobs for worker {worker_id}")
             return jobs
         except Exception as e:
-            logger.error(f"Error getting unevaluated jobs: {e}")
+            self.conn.rollback()
+            logger.error(f"Error claiming jobs: {e}")
             return []
     
-    def save_relevant_job(self, relevant_job: RelevantJob) -> Optional[int]:
-        """Save a relevant job to the database"""
+    def release_jobs(self, worker_id: str, job_ids: List[int]) -> int:
+        """Release the worker's leases on the given jobs so others can claim them"""
+        if not job_ids:
+            return 0
+        
         if not self.conn:
             self.connect()
             
@@ -124,16 +494,72 @@ class DatabaseOperations:
             cursor = self.conn.cursor()
             cursor.execute(
                 """
-                INSERT INTO relevant_jobs (job_id, evaluation_score, evaluation_summary)
-                VALUES (%s, %s, %s)
-                RETURNING id
+                UPDATE scraped_jobs
+                SET claimed_by = NULL, claim_expires_at = NULL
+                WHERE id = ANY(%s) AND claimed_by = %s
                 """,
+                (list(job_ids), worker_id)
+            )
+            released = cursor.rowcount
+            self.conn.commit()
+            return released
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Error releasing jobs: {e}")
+            return 0
+    
+    def listen(self, channel: str = NEW_JOBS_CHANNEL):
+        """Subscribe this connection to a notification channel
+        
+        The connection is switched to autocommit so notifications are
+        delivered while it waits; use a dedicated DatabaseOperations for it.
+        """
+        if not self.conn:
+            self.connect()
+        
+        self.conn.autocommit = True
+        self.listening = True
+        cursor = self.conn.cursor()
+        cursor.execute(f"LISTEN {channel}")
+        logger.info(f"Listening for notifications on channel '{channel}'")
+    
+    def wait_for_notifications(self, timeout: float) -> List[str]:
+        """Wait up to timeout seconds for notifications and return their payloads
+        
+        Every notification already queued is returned, so bursts are drained
+        in one call. Returns an empty list if the timeout passes first.
+        """
+        if not self.conn:
+            self.connect()
+        
+        if not self.conn.notifies:
+            readable, _, _ = select.select([self.conn], [], [], max(timeout, 0))
+            if not readable:
+                return []
+        self.conn.poll()
+        
+        payloads = [notify.payload for notify in self.conn.notifies]
+        self.conn.notifies.clear()
+        return payloads
+    
+    def save_relevant_job(self, relevant_job: RelevantJob) -> Optional[int]:
+        """Save a relevant job to the database"""
+        if not self.conn:
+            self.connect()
+            
+        try:
+            cursor = self.conn.cursor()
+            self._execute(
+                cursor, "save_relevant_job", SAVE_RELEVANT_JOB_QUERY,
                 (relevant_job.job_id, relevant_job.evaluation_score, relevant_job.evaluation_summary)
             )
-            relevant_job_id = cursor.fetchone()[0]
+            result = cursor.fetchone()
             self.conn.commit()
+            if result is None:
+                logger.warning(f"Job {relevant_job.job_id} already has a verdict")
+                return None
             logger.info(f"Job {relevant_job.job_id} marked as relevant")
-            return relevant_job_id
+            return result[0]
         except Exception as e:
             self.conn.rollback()
             logger.error(f"Error saving relevant job: {e}")
@@ -144,21 +570,264 @@ class DatabaseOperations:
         if not self.conn:
             self.connect()
             
+        try:
+            cursor = self.conn.cursor()
+            self._execute(
+                cursor, "save_rejected_job", SAVE_REJECTED_JOB_QUERY, (rejected_job.job_id, rejected_job.reason)
+            )
+            result = cursor.fetchone()
+            self.conn.commit()
+            if result is None:
+                logger.warning(f"Job {rejected_job.job_id} already has a verdict")
+                return None
+            logger.info(f"Job {rejected_job.job_id} marked as rejected")
+            return result[0]
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Error saving rejected job: {e}")
+            return None
+    
+    def save_verdicts_bulk(self, relevant_jobs: List[RelevantJob], rejected_jobs: List[RejectedJob]) -> Optional[int]:
+        """Save a batch of verdicts with one multi-row insert per table in a single transaction
+        
+        Jobs that already have a verdict are skipped. Returns the number of
+        verdicts saved, or None if the transaction failed and nothing was saved.
+        """
+        if not relevant_jobs and not rejected_jobs:
+            return 0
+        
+        if not self.conn:
+            self.connect()
+            
+        try:
+            cursor = self.conn.cursor()
+            saved = 0
+            if relevant_jobs:
+                saved += len(execute_values(
+                    cursor, SAVE_RELEVANT_JOBS_QUERY,
+                    [(job.job_id, job.evaluation_score, job.evaluation_summary) for job in relevant_jobs],
+                    page_size=len(relevant_jobs), fetch=True
+                ))
+            if rejected_jobs:
+                saved += len(execute_values(
+                    cursor, SAVE_REJECTED_JOBS_QUERY,
+                    [(job.job_id, job.reason) for job in rejected_jobs],
+                    page_size=len(rejected_jobs), fetch=True
+                ))
+            self.conn.commit()
+            skipped = len(relevant_jobs) + len(rejected_jobs) - saved
+            if skipped:
+                logger.warning(f"Skipped {skipped} verdicts for jobs that already have one")
+            return saved
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Error saving batch of verdicts: {e}")
+            return None
+    
+    def record_failed_evaluations(self, job_ids: List[int], max_attempts: int) -> Optional[int]:
+        """Count a failed evaluation attempt for each job, without recording a verdict
+        
+        Jobs stay pending so they are evaluated again, until their attempts
+        reach max_attempts and they are set aside as failed. Returns the number
+        of jobs updated, or None if the update failed.
+        """
+        if not job_ids:
+            return 0
+        
+        if not self.conn:
+            self.connect()
+            
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                """
+                UPDATE scraped_jobs
+                SET evaluation_attempts = evaluation_attempts + 1,
+                    evaluation_status = CASE
+                        WHEN evaluation_attempts + 1 >= %s THEN 'failed' ELSE evaluation_status
+                    END
+                WHERE id = ANY(%s) AND evaluation_status = 'pending'
+                """,
+                (max_attempts, list(job_ids))
+            )
+            updated = cursor.rowcount
+            self.conn.commit()
+            return updated
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Error recording failed evaluations: {e}")
+            return None
+    
+    def get_cached_evaluation(self, content_hash: str, max_age_seconds: int) -> Optional[dict]:
+        """Get a cached evaluation verdict that is younger than max_age_seconds"""
+        if not self.conn:
+            self.connect()
+            
+        try:
+            cursor = self.conn.cursor()
+            # Touch the entry so size-based eviction keeps recently used verdicts
+            cursor.execute(
+                """
+                UPDATE evaluation_cache
+                SET last_used_at = NOW()
+                WHERE content_hash = %s
+                  AND created_at > NOW() - %s * INTERVAL '1 second'
+                RETURNING verdict
+                """,
+                (content_hash, max_age_seconds)
+            )
+            result = cursor.fetchone()
+            self.conn.commit()
+            return result[0] if result else None
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Error reading evaluation cache: {e}")
+            return None
+    
+    def save_cached_evaluation(self, content_hash: str, verdict: dict) -> bool:
+        """Store an evaluation verdict in the cache"""
+        if not self.conn:
+            self.connect()
+            
         try:
             cursor = self.conn.cursor()
             cursor.execute(
                 """
-                INSERT INTO rejected_jobs (job_id, reason)
+                INSERT INTO evaluation_cache (content_hash, verdict)
                 VALUES (%s, %s)
-                RETURNING id
+                ON CONFLICT (content_hash) DO UPDATE
+                SET verdict = EXCLUDED.verdict, created_at = NOW(), last_used_at = NOW()
                 """,
-                (rejected_job.job_id, rejected_job.reason)
+                (content_hash, Json(verdict))
             )
-            rejected_job_id = cursor.fetchone()[0]
             self.conn.commit()
-            logger.info(f"Job {rejected_job.job_id} marked as rejected")
-            return rejected_job_id
+            return True
         except Exception as e:
             self.conn.rollback()
-            logger.error(f"Error saving rejected job: {e}")
-            return None
\ No newline at end of file
+            logger.error(f"Error saving to evaluation cache: {e}")
+            return False
+    
+    def evict_evaluation_cache(self, max_age_seconds: int, max_entries: int) -> int:
+        """Delete expired cache entries and the least recently used beyond max_entries"""
+        if not self.conn:
+            self.connect()
+            
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "DELETE FROM evaluation_cache WHERE created_at <= NOW() - %s * INTERVAL '1 second'",
+                (max_age_seconds,)
+            )
+            evicted = cursor.rowcount
+            cursor.execute(
+                """
+                DELETE FROM evaluation_cache
+                WHERE content_hash IN (
+                    SELECT content_hash FROM evaluation_cache
+                    ORDER BY last_used_at DESC
+                    OFFSET %s
+                )
+                """,
+                (max_entries,)
+            )
+            evicted += cursor.rowcount
+            self.conn.commit()
+            if evicted:
+                logger.info(f"Evicted {evicted} entries from evaluation cache")
+            return evicted
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Error evicting evaluation cache: {e}")
+            return 0
+    
+    def save_job_signatures(self, signatures: List[Tuple[int, List[int], List[int]]]) -> bool:
+        """Store MinHash signatures and LSH bucket keys for saved jobs
+        
+        Each entry is a ``(job_id, signature, band_keys)`` tuple.
+        """
+        if not signatures:
+            return True
+        
+        if not self.conn:
+            self.connect()
+            
+        try:
+            cursor = self.conn.cursor()
+            execute_values(
+                cursor,
+                """
+                UPDATE scraped_jobs j SET minhash = v.minhash
+                FROM (VALUES %s) AS v (id, minhash)
+                WHERE j.id = v.id
+                """,
+                [(job_id, signature) for job_id, signature, _ in signatures],
+                template="(%s, %s::BIGINT[])"
+            )
+            execute_values(
+                cursor,
+                """
+                INSERT INTO job_lsh_buckets (band, bucket, job_id)
+                VALUES %s
+                ON CONFLICT DO NOTHING
+                """,
+                [
+                    (band, bucket, job_id)
+                    for job_id, _, band_keys in signatures
+                    for band, bucket in enumerate(band_keys)
+                ]
+            )
+            self.conn.commit()
+            return True
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Error saving job signatures: {e}")
+            return False
+    
+    def find_near_duplicate_candidates(self, job_id: Optional[int], band_keys: List[int]) -> List[dict]:
+        """Find evaluated jobs sharing an LSH bucket with the given band keys
+        
+        Returns dicts with the candidate's ``job_id``, ``minhash`` signature and
+        its verdict (``is_relevant``, ``score``, ``summary``, ``reason``), with
+        ``failed`` set for rejections recorded for a failed evaluation.
+        """
+        if not self.conn:
+            self.connect()
+            
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                """
+                SELECT j.id, j.minhash, r.id IS NOT NULL, r.evaluation_score, r.evaluation_summary, x.reason,
+                       COALESCE(x.failed, FALSE)
+                FROM (
+                    SELECT DISTINCT b.job_id
+                    FROM job_lsh_buckets b
+                    JOIN unnest(%s::SMALLINT[], %s::BIGINT[]) AS k (band, bucket)
+                      ON b.band = k.band AND b.bucket = k.bucket
+                    WHERE b.job_id IS DISTINCT FROM %s
+                ) c
+                JOIN scraped_jobs j ON j.id = c.job_id
+                LEFT JOIN relevant_jobs r ON r.job_id = j.id
+                LEFT JOIN rejected_jobs x ON x.job_id = j.id
+                WHERE r.id IS NOT NULL OR x.id IS NOT NULL
+                """,
+                (list(range(len(band_keys))), band_keys, job_id)
+            )
+            candidates = [
+                {
+                    "job_id": row[0],
+                    "minhash": row[1],
+                    "is_relevant": row[2],
+                    "score": row[3] or 0,
+                    "summary": row[4] or "",
+                    "reason": row[5] or "",
+                    "failed": row[6],
+                }
+                for row in cursor.fetchall()
+            ]
+            self.conn.commit()
+            return candidates
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Error finding near-duplicate jobs: {e}")
+            return []
\ No newline at end of file
@@ -0,0 +1,123 @@
+import logging
+import threading
+import time
+from typing import Dict, Tuple
+import psycopg2
+from psycopg2.extensions import connection as _connection, cursor as _cursor
+from psycopg2.pool import ThreadedConnectionPool
+from src.config import settings
+from src.utils.metrics import DB_QUERY_SECONDS
+from src.utils.tracing import span
+
+logger = logging.getLogger(__name__)
+
+def _statement_kind(query) -> str:
+    """Label a statement by its leading keyword, or by name for prepared statements"""
+    if isinstance(query, bytes):
+        query = query[:80].decode("utf-8", "replace")
+    words = str(query)[:80].split(None, 2)
+    if not words:
+        return "unknown"
+    kind = words[0].lower()
+    if kind in ("execute", "prepare") and len(words) > 1:
+        return words[1].split("(", 1)[0].lower()
+    return kind
+
+class TimedCursor(_cursor):
+    """Cursor that records how long each statement takes"""
+    
+    def execute(self, query, vars=None):
+        kind = _statement_kind(query)
+        started = time.perf_counter()
+        try:
+            with span(f"sql {kind}"):
+                return super().execute(query, vars)
+        finally:
+            DB_QUERY_SECONDS.labels(kind).observe(time.perf_counter() - started)
+
+class PreparingConnection(_connection):
+    """Connection that remembers which statements it has prepared on the server"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = set()
+        self.cursor_factory = TimedCursor
+    
+    def commit(self):
+        with span("commit"):
+            return super().commit()
+
+class ConnectionPool:
+    """Process-wide pool of database connections
+    
+    Connections are checked before they are handed out, so ones dropped by
+    the server or the network are replaced instead of failing the caller.
+    """
+    
+    def __init__(self, min_size: int, max_size: int, **connect_kwargs):
+        """Open min_size connections with the given connection parameters"""
+        self.pool = ThreadedConnectionPool(
+            min_size, max_size, connection_factory=PreparingConnection, **connect_kwargs
+        )
+        self.max_size = max_size
+    
+    def getconn(self) -> PreparingConnection:
+        """Check out a live connection, replacing any that fail the health check"""
+        for _ in range(self.max_size + 1):
+            conn = self.pool.getconn()
+            if self._is_healthy(conn):
+                return conn
+            logger.warning("Discarding broken database connection")
+            self.pool.putconn(conn, close=True)
+        raise psycopg2.OperationalError("No healthy database connection available")
+    
+    def putconn(self, conn, close: bool = False):
+        """Return a connection, closing it if it is broken or has session state"""
+        if conn.closed:
+            close = True
+        elif not close:
+            try:
+                # Never hand out a connection in the middle of someone else's transaction
+                conn.rollback()
+            except psycopg2.Error:
+                close = True
+        self.pool.putconn(conn, close=close)
+    
+    def closeall(self):
+        """Close every connection in the pool"""
+        self.pool.closeall()
+    
+    def _is_healthy(self, conn) -> bool:
+        """Check that a connection is open and the server answers"""
+        if conn.closed:
+            return False
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.close()
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+_pools: Dict[Tuple, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+def get_pool(host: str, database: str, user: str, password: str) -> ConnectionPool:
+    """Get the shared pool for a database, creating it on first use"""
+    key = (host, database, user, password)
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = ConnectionPool(
+                settings.DB_POOL_MIN_SIZE, settings.DB_POOL_MAX_SIZE,
+                host=host, database=database, user=user, password=password
+            )
+            logger.info(f"Opened database connection pool for {database} on {host}")
+        return _pools[key]
+
+def close_pools():
+    """Close every shared pool, e.g. before the process exits"""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.closeall()
+        _pools.clear()
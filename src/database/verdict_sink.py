@@ -0,0 +1,178 @@
+import logging
+import threading
+import time
+from typing import List
+from src.config import settings
+from src.database.models import Job, RelevantJob, RejectedJob
+from src.database.operations import DatabaseOperations
+from src.utils.metrics import JOBS_ERRORED, JOBS_EVALUATED, JOBS_REJECTED, JOBS_RELEVANT
+from src.utils.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+class VerdictSink:
+    """Buffers evaluation verdicts and saves them in batches
+    
+    Verdicts are written with one multi-row insert per table and a single
+    commit by a background thread, whenever batch_size of them are buffered
+    and every flush_interval_ms. A failed flush keeps the verdicts buffered
+    for the next one. Failed evaluations are not verdicts: they are saved
+    as an attempt on the job, which stays pending until it runs out of
+    EVALUATOR_MAX_ATTEMPTS. Buffering never waits on the database, so add() is
+    safe to call from an event loop. The sink uses its own connection, so
+    flushes never share a transaction with the caller.
+    """
+    
+    def __init__(self, db: DatabaseOperations = None, batch_size: int = None, flush_interval_ms: int = None):
+        """Initialize the sink"""
+        # A sink that opened its own connection also closes it
+        self.owns_db = db is None
+        self.db = db or DatabaseOperations()
+        self.batch_size = max(1, batch_size or settings.VERDICT_BATCH_SIZE)
+        if flush_interval_ms is None:
+            flush_interval_ms = settings.VERDICT_FLUSH_INTERVAL_MS
+        self.flush_interval = flush_interval_ms / 1000
+        self.relevant_jobs: List[RelevantJob] = []
+        self.rejected_jobs: List[RejectedJob] = []
+        self.failed_job_ids: List[int] = []
+        self.max_attempts = settings.EVALUATOR_MAX_ATTEMPTS
+        self.saved = 0
+        # Guards the buffers only; held for appends and swaps, never during a write
+        self.lock = threading.Lock()
+        # Serializes writes, so a flush returns only after earlier verdicts are saved
+        self._flush_lock = threading.Lock()
+        self._full = threading.Event()
+        self._stopped = threading.Event()
+        self._flusher = None
+    
+    def __enter__(self):
+        """Start the periodic flush"""
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Flush everything that is buffered"""
+        self.close()
+    
+    def __len__(self) -> int:
+        """Number of verdicts and failed attempts waiting to be saved"""
+        return len(self.relevant_jobs) + len(self.rejected_jobs) + len(self.failed_job_ids)
+    
+    def start(self):
+        """Flush in the background whenever a batch fills up, and every flush_interval"""
+        if self._flusher is None:
+            self._flusher = threading.Thread(target=self._flush_periodically, name="verdict-sink", daemon=True)
+            self._flusher.start()
+    
+    def add(self, job: Job, evaluation: dict):
+        """Buffer the verdict of an evaluated job, waking the flusher if the batch is full
+        
+        Failures are not verdicts; the job is left pending so it returns to
+        the queue once its lease is released. Transient failures, such as
+        throttling, are free; any other failure counts as an attempt.
+        """
+        if evaluation.get("error"):
+            JOBS_ERRORED.inc()
+            if evaluation.get("transient"):
+                logger.info(f"Returning job {job.id} to the queue after a transient failure")
+                return
+            logger.warning(f"Returning job {job.id} to the queue after a failed evaluation: {evaluation.get('reason')}")
+            with self.lock:
+                self.failed_job_ids.append(job.id)
+                full = len(self) >= self.batch_size
+            if full:
+                self._full.set()
+            return
+        
+        JOBS_EVALUATED.inc()
+        with self.lock:
+            if evaluation["is_relevant"]:
+                JOBS_RELEVANT.inc()
+                self.relevant_jobs.append(RelevantJob(
+                    job_id=job.id,
+                    evaluation_score=evaluation["score"],
+                    evaluation_summary=evaluation["summary"]
+                ))
+            else:
+                JOBS_REJECTED.inc()
+                self.rejected_jobs.append(RejectedJob(
+                    job_id=job.id,
+                    reason=evaluation["reason"]
+                ))
+            full = len(self) >= self.batch_size
+        if full:
+            self._full.set()
+    
+    @traced()
+    def flush(self) -> bool:
+        """Save every buffered verdict in one transaction, then the failed attempts
+        
+        Returns False if the database rejected either; what it rejected stays
+        buffered.
+        """
+        with self._flush_lock:
+            # Take the batch, so verdicts keep being buffered while it is written
+            with self.lock:
+                relevant_jobs, rejected_jobs = self.relevant_jobs, self.rejected_jobs
+                failed_job_ids = self.failed_job_ids
+                self.relevant_jobs, self.rejected_jobs, self.failed_job_ids = [], [], []
+            
+            flushed = True
+            if relevant_jobs or rejected_jobs:
+                try:
+                    saved = self.db.save_verdicts_bulk(relevant_jobs, rejected_jobs)
+                except Exception as e:
+                    logger.error(f"Error flushing verdicts: {e}")
+                    saved = None
+                if saved is None:
+                    with self.lock:
+                        self.relevant_jobs = relevant_jobs + self.relevant_jobs
+                        self.rejected_jobs = rejected_jobs + self.rejected_jobs
+                    flushed = False
+                else:
+                    logger.info(f"Saved {saved} of {len(relevant_jobs) + len(rejected_jobs)} buffered verdicts")
+                    self.saved += saved
+            
+            if failed_job_ids:
+                try:
+                    recorded = self.db.record_failed_evaluations(failed_job_ids, self.max_attempts)
+                except Exception as e:
+                    logger.error(f"Error flushing failed evaluations: {e}")
+                    recorded = None
+                if recorded is None:
+                    with self.lock:
+                        self.failed_job_ids = failed_job_ids + self.failed_job_ids
+                    flushed = False
+            return flushed
+    
+    def close(self, retries: int = 3):
+        """Stop the periodic flush and save what is left, retrying failed flushes
+        
+        Verdicts that still cannot be saved are logged, since the LLM calls
+        that produced them would otherwise be lost without a trace.
+        """
+        self._stopped.set()
+        self._full.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        
+        for attempt in range(retries + 1):
+            if self.flush():
+                break
+            if attempt < retries:
+                time.sleep(2 ** attempt)
+        else:
+            for verdict in self.relevant_jobs + self.rejected_jobs:
+                logger.error(f"Lost verdict for job {verdict.job_id}: {verdict}")
+        if self.owns_db:
+            self.db.close()
+    
+    def _flush_periodically(self):
+        """Flush buffered verdicts until the sink is closed; close() saves the rest"""
+        while True:
+            self._full.wait(self.flush_interval or None)
+            self._full.clear()
+            if self._stopped.is_set():
+                return
+            self.flush()
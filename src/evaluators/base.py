@@ -1,6 +1,27 @@
+import asyncio
+import threading
 from abc import ABC, abstractmethod
+from typing import List, Optional
 from src.database.models import Job
 
+class TransientEvaluationError(Exception):
+    """An evaluation failed for a reason that may go away, such as throttling
+    
+    Jobs that fail this way should go back to the queue rather than be
+    recorded as rejected.
+    """
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class EvaluatorUnavailableError(Exception):
+    """The evaluator cannot evaluate anything, e.g. its API key was revoked or its credits ran out
+    
+    Raised instead of returning a verdict, so the run stops and every job
+    stays pending until the problem is fixed.
+    """
+
 class BaseEvaluator(ABC):
     """Base class for job evaluators"""
     
@@ -17,4 +38,119 @@ class BaseEvaluator(ABC):
     @abstractmethod
     def cleanup(self):
         """Clean up resources"""
-        pass
\ No newline at end of file
+        pass
+    
+    async def evaluate_async(self, job: Job) -> dict:
+        """Evaluate a job without blocking the event loop
+        
+        Evaluators with a native async client should override this; the default
+        runs the synchronous evaluate() in a worker thread.
+        """
+        return await asyncio.to_thread(self.evaluate, job)
+    
+    def evaluate_batch(self, jobs: List[Job]) -> List[dict]:
+        """Evaluate several jobs, returning results in the same order
+        
+        Evaluators that can pack jobs into one request should override this.
+        """
+        return [self.evaluate(job) for job in jobs]
+    
+    async def evaluate_batch_async(self, jobs: List[Job]) -> List[dict]:
+        """Evaluate several jobs without blocking the event loop"""
+        return list(await asyncio.gather(*(self.evaluate_async(job) for job in jobs)))
+    
+    async def cleanup_async(self):
+        """Clean up resources bound to the event loop"""
+        pass
+
+class StageEvaluator(BaseEvaluator):
+    """Base class for stages that answer some jobs before a wrapped evaluator
+    
+    Subclasses implement _lookup() to return a verdict for jobs they can
+    decide on their own, and may implement _store() to keep verdicts coming
+    back from the wrapped evaluator. Everything else is passed through.
+    
+    Both may hit the database, so the async paths run them in a worker
+    thread instead of on the event loop, one call per stage at a time.
+    """
+    
+    def __init__(self, evaluator: BaseEvaluator):
+        """Initialize the stage around the evaluator it protects"""
+        self.evaluator = evaluator
+        self.model = getattr(evaluator, "model", type(evaluator).__name__)
+        # Guards the stage's own state, such as an LRU, against concurrent async workers
+        self.lock = threading.Lock()
+    
+    @abstractmethod
+    def _lookup(self, job: Job) -> Optional[dict]:
+        """Return a verdict for the job, or None to pass it on"""
+        pass
+    
+    def _store(self, job: Job, evaluation: dict):
+        """Handle a verdict produced by the wrapped evaluator"""
+        pass
+    
+    def setup(self):
+        """Set up the wrapped evaluator"""
+        return self.evaluator.setup()
+    
+    def evaluate(self, job: Job) -> dict:
+        """Evaluate a job, passing it on only if this stage cannot decide"""
+        evaluation = self._lookup(job)
+        if evaluation is None:
+            evaluation = self.evaluator.evaluate(job)
+            self._store(job, evaluation)
+        return evaluation
+    
+    async def evaluate_async(self, job: Job) -> dict:
+        """Evaluate a job asynchronously, passing it on only if this stage cannot decide"""
+        evaluation = (await asyncio.to_thread(self._lookup_all, [job]))[0]
+        if evaluation is None:
+            evaluation = await self.evaluator.evaluate_async(job)
+            await asyncio.to_thread(self._store_all, [job], [evaluation])
+        return evaluation
+    
+    def evaluate_batch(self, jobs: List[Job]) -> List[dict]:
+        """Evaluate several jobs, passing on only those this stage cannot decide"""
+        evaluations = [self._lookup(job) for job in jobs]
+        misses = [i for i, evaluation in enumerate(evaluations) if evaluation is None]
+        if misses:
+            results = self.evaluator.evaluate_batch([jobs[i] for i in misses])
+            self._merge(jobs, evaluations, misses, results)
+        return evaluations
+    
+    async def evaluate_batch_async(self, jobs: List[Job]) -> List[dict]:
+        """Evaluate several jobs asynchronously, passing on only those this stage cannot decide"""
+        evaluations = await asyncio.to_thread(self._lookup_all, jobs)
+        misses = [i for i, evaluation in enumerate(evaluations) if evaluation is None]
+        if misses:
+            results = await self.evaluator.evaluate_batch_async([jobs[i] for i in misses])
+            for index, evaluation in zip(misses, results):
+                evaluations[index] = evaluation
+            await asyncio.to_thread(self._store_all, [jobs[i] for i in misses], results)
+        return evaluations
+    
+    def cleanup(self):
+        """Clean up the wrapped evaluator"""
+        self.evaluator.cleanup()
+    
+    async def cleanup_async(self):
+        """Clean up the wrapped evaluator's event loop resources"""
+        await self.evaluator.cleanup_async()
+    
+    def _lookup_all(self, jobs: List[Job]) -> List[Optional[dict]]:
+        """Look several jobs up while holding the stage's lock"""
+        with self.lock:
+            return [self._lookup(job) for job in jobs]
+    
+    def _store_all(self, jobs: List[Job], evaluations: List[dict]):
+        """Store several verdicts while holding the stage's lock"""
+        with self.lock:
+            for job, evaluation in zip(jobs, evaluations):
+                self._store(job, evaluation)
+    
+    def _merge(self, jobs: List[Job], evaluations: List[Optional[dict]], misses: List[int], results: List[dict]):
+        """Fill in and store the verdicts the wrapped evaluator returned"""
+        for index, evaluation in zip(misses, results):
+            evaluations[index] = evaluation
+            self._store(jobs[index], evaluation)
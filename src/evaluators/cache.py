@@ -0,0 +1,104 @@
+import hashlib
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import Optional
+from src.config import settings
+from src.database.models import Job
+from src.database.operations import DatabaseOperations
+from src.evaluators.base import BaseEvaluator, StageEvaluator
+from src.utils.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+def _normalize(text: str) -> str:
+    """Normalize text so trivial formatting changes hash the same"""
+    return _WHITESPACE.sub(" ", (text or "").lower()).strip()
+
+def profile_version() -> str:
+    """Get the version of the user profile the verdicts were made against"""
+    if settings.PROFILE_VERSION:
+        return settings.PROFILE_VERSION
+    profile = "\n".join([settings.USER_SKILLS, settings.USER_EXPERIENCE, settings.USER_PREFERENCES])
+    return hashlib.sha256(_normalize(profile).encode("utf-8")).hexdigest()[:16]
+
+def content_hash(job: Job, model: str, version: str) -> str:
+    """Hash the normalized job content together with the model and profile version"""
+    parts = [_normalize(job.title), _normalize(job.company), _normalize(job.description), model, version]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+class CachingEvaluator(StageEvaluator):
+    """Evaluator that reuses verdicts for jobs with identical content
+    
+    Reposted jobs and copies of the same description under another link hash
+    to the same key, so only the first copy costs an LLM call. Verdicts live
+    in the evaluation_cache table, fronted by an optional in-process LRU.
+    """
+    
+    def __init__(self, evaluator: BaseEvaluator, db: DatabaseOperations, ttl_seconds: int = None,
+                 max_entries: int = None, lru_size: int = None):
+        """Initialize the caching evaluator"""
+        super().__init__(evaluator)
+        self.db = db
+        self.ttl_seconds = ttl_seconds or settings.EVALUATION_CACHE_TTL_SECONDS
+        self.max_entries = max_entries or settings.EVALUATION_CACHE_MAX_ENTRIES
+        self.lru_size = settings.EVALUATION_CACHE_LRU_SIZE if lru_size is None else lru_size
+        self.version = profile_version()
+        self.lru = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def setup(self):
+        """Set up the wrapped evaluator and evict stale cache entries"""
+        if not self.evaluator.setup():
+            return False
+        self.db.evict_evaluation_cache(self.ttl_seconds, self.max_entries)
+        return True
+    
+    def cleanup(self):
+        """Clean up the wrapped evaluator"""
+        logger.info(f"Evaluation cache: {self.hits} hits, {self.misses} misses")
+        self.evaluator.cleanup()
+    
+    @traced()
+    def _lookup(self, job: Job) -> Optional[dict]:
+        """Look a verdict up in the LRU, then in the database"""
+        key = content_hash(job, self.model, self.version)
+        entry = self.lru.get(key)
+        if entry is not None:
+            evaluation, stored_at = entry
+            if time.monotonic() - stored_at < self.ttl_seconds:
+                self.lru.move_to_end(key)
+                self.hits += 1
+                return dict(evaluation)
+            del self.lru[key]
+        
+        evaluation = self.db.get_cached_evaluation(key, self.ttl_seconds)
+        if evaluation is None:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        self._remember(key, evaluation)
+        return dict(evaluation)
+    
+    @traced()
+    def _store(self, job: Job, evaluation: dict):
+        """Store a verdict, unless it only records a failed evaluation"""
+        if evaluation.get("error"):
+            return
+        key = content_hash(job, self.model, self.version)
+        self._remember(key, evaluation)
+        self.db.save_cached_evaluation(key, evaluation)
+    
+    def _remember(self, key: str, evaluation: dict):
+        """Store a verdict in the in-process LRU"""
+        if self.lru_size <= 0:
+            return
+        self.lru[key] = (dict(evaluation), time.monotonic())
+        self.lru.move_to_end(key)
+        while len(self.lru) > self.lru_size:
+            self.lru.popitem(last=False)
@@ -0,0 +1,126 @@
+import re
+from typing import Dict, List
+from bs4 import BeautifulSoup
+from src.config import settings
+
+_HTML_TAG = re.compile(r"</?[a-zA-Z][^>]*>")
+_SPACES = re.compile(r"[ \t\u00a0\u200b]+")
+_BULLET = re.compile(r"^[-*\u2022\u00b7\u25aa\u25cf\u2013]+\s*")
+
+# Elements that start a new line when HTML is turned into text
+_BLOCK_TAGS = ["p", "div", "br", "li", "ul", "ol", "tr", "section", "h1", "h2", "h3", "h4", "h5", "h6"]
+_HEADING_TAGS = ["h1", "h2", "h3", "h4", "h5", "h6", "strong", "b"]
+
+# Roughly one token per short word or per four characters of a long one, plus
+# one per punctuation mark and per run of extra whitespace; close to BPE
+# tokenizers on English prose
+_TOKEN = re.compile(r"\w{1,4}|[^\w\s]|\s{2,}")
+
+# Lines that never help match a job against a profile
+BOILERPLATE_PATTERNS = re.compile(
+    r"equal (employment )?opportunit"
+    r"|regardless of (race|gender|age|religion|sexual|national|disability|color|colour)"
+    r"|without regard to (race|gender|age|religion|sexual|national|disability|color|colour)"
+    r"|reasonable accommodation"
+    r"|e-verify"
+    r"|privacy (policy|notice|statement)"
+    r"|unsolicited (resumes|cvs|applications)"
+    r"|recruitment agenc"
+    r"|^#li-\w+"
+    r"|^(apply now|show more|show less|see more|see less)$",
+    re.IGNORECASE
+)
+
+# Section headings whose content is a perks list rather than the job
+BENEFITS_HEADING = re.compile(
+    r"^(our |the )?(benefits|perks|what we offer|what('s| is) in it for you|why join us|why you'?ll love working here)"
+    r"( and perks| & perks)?\W*$",
+    re.IGNORECASE
+)
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of LLM tokens in a text without a model-specific tokenizer"""
+    return len(_TOKEN.findall(text or ""))
+
+def token_budget(model: str) -> int:
+    """Get the description token budget for a model
+    
+    LLM_TOKEN_BUDGETS holds comma-separated model=budget overrides of
+    LLM_DESCRIPTION_TOKEN_BUDGET. A non-positive budget disables truncation.
+    """
+    budgets: Dict[str, int] = {}
+    for entry in settings.LLM_TOKEN_BUDGETS.split(","):
+        name, _, budget = entry.rpartition("=")
+        if name.strip() and budget.strip().isdigit():
+            budgets[name.strip()] = int(budget)
+    return budgets.get(model, settings.LLM_DESCRIPTION_TOKEN_BUDGET)
+
+def _is_heading(line: str) -> bool:
+    """Check whether a line is a short section heading, e.g. 'Benefits:'"""
+    return line.endswith(":") and len(line.split()) <= 6 and not _BULLET.match(line)
+
+def _html_to_text(html: str) -> str:
+    """Turn HTML into text with one line per block, bullets for list items and colons after headings"""
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup.find_all(_HEADING_TAGS):
+        text = tag.get_text(strip=True)
+        # Bold text only counts as a heading when it stands alone in its block
+        is_heading = tag.name.startswith("h") or text == tag.parent.get_text(strip=True)
+        if text and is_heading and not text.endswith(":"):
+            tag.append(":")
+    for item in soup.find_all("li"):
+        item.insert(0, "- ")
+    for tag in soup.find_all(_BLOCK_TAGS):
+        tag.insert_before("\n")
+        tag.insert_after("\n")
+    return soup.get_text()
+
+def _lines(text: str) -> List[str]:
+    """Split a description into whitespace-collapsed lines, stripping any HTML"""
+    if _HTML_TAG.search(text):
+        text = _html_to_text(text)
+    lines = (_SPACES.sub(" ", line).strip() for line in text.splitlines())
+    return [line for line in lines if line]
+
+def _truncate(lines: List[str], budget: int) -> List[str]:
+    """Keep whole lines, in order, until the token budget runs out"""
+    kept = []
+    used = 0
+    for line in lines:
+        tokens = estimate_tokens(line)
+        if used + tokens > budget:
+            # Cut the last line at a token boundary
+            remaining = budget - used
+            if remaining > 0:
+                cut = list(_TOKEN.finditer(line))[remaining - 1].end()
+                kept.append(line[:cut])
+            kept.append("[truncated]")
+            break
+        kept.append(line)
+        used += tokens
+    return kept
+
+def compact_description(description: str, budget: int = 0) -> str:
+    """Shrink a job description to what matters for evaluating it
+    
+    Strips HTML, collapses whitespace, drops legal boilerplate, benefits
+    sections and repeated lines, then truncates to budget tokens.
+    """
+    kept = []
+    seen = set()
+    in_benefits = False
+    for line in _lines(description or ""):
+        if _is_heading(line):
+            in_benefits = bool(BENEFITS_HEADING.match(line))
+        if in_benefits or BOILERPLATE_PATTERNS.search(line):
+            continue
+        # Postings often repeat the same section, e.g. once per location
+        key = line.lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        kept.append(line)
+    
+    if budget > 0:
+        kept = _truncate(kept, budget)
+    return "\n".join(kept)
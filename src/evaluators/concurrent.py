@@ -0,0 +1,62 @@
+import asyncio
+import logging
+from typing import Callable, Iterable
+from src.config import settings
+from src.database.models import Job
+from src.evaluators.base import BaseEvaluator, EvaluatorUnavailableError
+from src.utils.iterables import batched
+from src.utils.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+class ConcurrentEvaluator:
+    """Runs an evaluator over many jobs with bounded parallelism
+    
+    A fixed number of workers pull jobs from a shared iterator, so jobs are
+    consumed lazily, and every request start is gated by a requests-per-minute
+    token bucket. With a batch size above 1 each request packs several jobs.
+    Results are handed to ``on_result`` as soon as they finish.
+    """
+    
+    def __init__(self, evaluator: BaseEvaluator, concurrency: int = None, requests_per_minute: float = None,
+                 batch_size: int = None):
+        """Initialize the concurrent evaluator"""
+        self.evaluator = evaluator
+        self.concurrency = max(1, concurrency or settings.EVALUATOR_CONCURRENCY)
+        self.batch_size = max(1, batch_size or settings.EVALUATOR_BATCH_SIZE)
+        if requests_per_minute is None:
+            requests_per_minute = settings.EVALUATOR_REQUESTS_PER_MINUTE
+        self.rate_limiter = TokenBucket(requests_per_minute)
+    
+    async def run(self, jobs: Iterable[Job], on_result: Callable[[Job, dict], None]) -> int:
+        """Evaluate all jobs and return how many were evaluated"""
+        batch_iterator = batched(jobs, self.batch_size)
+        evaluated = 0
+        
+        async def worker():
+            nonlocal evaluated
+            # Workers share one iterator; next() never yields to the loop, so
+            # each batch is handed out exactly once
+            for batch in batch_iterator:
+                await self.rate_limiter.acquire_async()
+                try:
+                    if len(batch) == 1:
+                        evaluations = [await self.evaluator.evaluate_async(batch[0])]
+                    else:
+                        evaluations = await self.evaluator.evaluate_batch_async(batch)
+                except EvaluatorUnavailableError:
+                    # Stops the run; asyncio.run cancels the other workers
+                    raise
+                except Exception as e:
+                    logger.error(f"Error evaluating batch of {len(batch)} jobs: {e}")
+                    continue
+                
+                for job, evaluation in zip(batch, evaluations):
+                    try:
+                        on_result(job, evaluation)
+                        evaluated += 1
+                    except Exception as e:
+                        logger.error(f"Error saving evaluation for job {job.id}: {e}")
+        
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        return evaluated
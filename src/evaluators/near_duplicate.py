@@ -0,0 +1,97 @@
+import logging
+from typing import List, Optional
+from src.config import settings
+from src.database.models import Job
+from src.database.operations import DatabaseOperations
+from src.evaluators.base import BaseEvaluator, StageEvaluator
+from src.utils.minhash import MinHasher, estimate_similarity
+from src.utils.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+class NearDuplicateIndex:
+    """MinHash/LSH index over job descriptions, stored in the database
+    
+    Jobs are indexed as they are saved. A lookup only reads the jobs that
+    share an LSH bucket with the query, so its cost does not grow with the
+    size of scraped_jobs.
+    """
+    
+    def __init__(self, db: DatabaseOperations, threshold: float = None, hasher: MinHasher = None):
+        """Initialize the near-duplicate index"""
+        self.db = db
+        self.threshold = threshold or settings.NEAR_DUPLICATE_THRESHOLD
+        self.hasher = hasher or MinHasher(settings.MINHASH_PERMUTATIONS, settings.LSH_BANDS)
+    
+    def index_jobs(self, jobs: List[Job]) -> int:
+        """Store signatures for saved jobs and return how many were indexed"""
+        signatures = []
+        for job in jobs:
+            if job.id is None:
+                continue
+            signature = self.hasher.signature(job.description)
+            if signature is not None:
+                signatures.append((job.id, signature, self.hasher.band_keys(signature)))
+        
+        if not self.db.save_job_signatures(signatures):
+            return 0
+        return len(signatures)
+    
+    def find_match(self, job: Job) -> Optional[dict]:
+        """Find the most similar evaluated job above the threshold, if any
+        
+        Jobs whose verdict records a failed evaluation are skipped, since
+        there is no verdict to inherit. Returns the candidate dict from the
+        database with a ``similarity`` key.
+        """
+        signature = self.hasher.signature(job.description)
+        if signature is None:
+            return None
+        
+        best = None
+        for candidate in self.db.find_near_duplicate_candidates(job.id, self.hasher.band_keys(signature)):
+            if candidate.get("failed"):
+                continue
+            candidate["similarity"] = estimate_similarity(signature, candidate["minhash"])
+            if candidate["similarity"] < self.threshold:
+                continue
+            if best is None or (candidate["similarity"], -candidate["job_id"]) > (best["similarity"], -best["job_id"]):
+                best = candidate
+        return best
+
+class NearDuplicateEvaluator(StageEvaluator):
+    """Evaluator that inherits verdicts from near-duplicates of a job
+    
+    Postings that differ only in boilerplate, such as a reworded benefits
+    paragraph, take over the verdict of the evaluated job they match instead
+    of going to the wrapped evaluator.
+    """
+    
+    def __init__(self, evaluator: BaseEvaluator, db: DatabaseOperations, threshold: float = None):
+        """Initialize the near-duplicate evaluator"""
+        super().__init__(evaluator)
+        self.index = NearDuplicateIndex(db, threshold)
+        self.inherited = 0
+    
+    def cleanup(self):
+        """Clean up the wrapped evaluator"""
+        logger.info(f"Inherited {self.inherited} verdicts from near-duplicate jobs")
+        self.evaluator.cleanup()
+    
+    @traced()
+    def _lookup(self, job: Job) -> Optional[dict]:
+        """Build a verdict from the closest evaluated near-duplicate of a job"""
+        match = self.index.find_match(job)
+        if match is None:
+            return None
+        
+        self.inherited += 1
+        note = f"Near-duplicate of job {match['job_id']} ({match['similarity']:.0%} similar)"
+        logger.info(f"Job {job.id}: {note}")
+        return {
+            "is_relevant": match["is_relevant"],
+            "score": match["score"],
+            "reason": f"{note}: {match['reason']}" if match["reason"] else note,
+            "summary": match["summary"],
+            "near_duplicate_of": match["job_id"],
+        }
@@ -1,12 +1,58 @@
+import asyncio
 import logging
 import json
+import time
+import httpx
 import requests
+from typing import Dict, List, Optional
 from src.config import settings
 from src.database.models import Job
-from src.evaluators.base import BaseEvaluator
+from src.evaluators.base import BaseEvaluator, EvaluatorUnavailableError, TransientEvaluationError
+from src.evaluators.compaction import compact_description, estimate_tokens, token_budget
+from src.utils.metrics import LLM_PROMPT_TOKENS, LLM_REQUEST_SECONDS, LLM_RESPONSE_TOKENS
+from src.utils.rate_limiter import AdaptiveConcurrency
+from src.utils.retry import backoff_delay, parse_retry_after
+from src.utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
+EVALUATION_FIELDS = """
+          "is_relevant": true/false,
+          "score": 0-100,
+          "reason": "Brief explanation why this job is or isn't a good match",
+          "summary": "Summary of the key points of this job and why it's a good match (if relevant)",
+          "skills_match": ["list", "of", "matching", "skills"],
+          "missing_skills": ["list", "of", "required", "skills", "I", "don't", "have"]"""
+
+EVALUATION_SCHEMA = "{" + EVALUATION_FIELDS + "\n        }"
+
+BATCH_EVALUATION_SCHEMA = "{\n          \"job_id\": <Job ID>," + EVALUATION_FIELDS + "\n        }"
+
+# Responses worth retrying; anything else is a real failure
+THROTTLED_STATUSES = {429}
+TRANSIENT_STATUSES = {408, 429, 500, 502, 503, 504}
+# Bad key, no credits or a blocked account; every other request would fail the same way
+UNAVAILABLE_STATUSES = {401, 402, 403}
+
+def _quota_reset_seconds(headers) -> Optional[float]:
+    """Seconds until an exhausted rate-limit quota resets, if the headers say so"""
+    remaining = headers.get("X-RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset")
+    if remaining is None or reset is None:
+        return None
+    try:
+        if float(remaining) > 0:
+            return None
+        reset = float(reset)
+    except ValueError:
+        return None
+    # OpenRouter sends an epoch timestamp in milliseconds; accept seconds too
+    if reset > 1e12:
+        reset /= 1000
+    if reset > 1e9:
+        reset -= time.time()
+    return max(0.0, reset)
+
 class OpenRouterEvaluator(BaseEvaluator):
     """OpenRouter job evaluator implementation"""
     
@@ -14,7 +60,16 @@ class OpenRouterEvaluator(BaseEvaluator):
         """Initialize the OpenRouter evaluator"""
         self.api_key = settings.OPENROUTER_API_KEY
         self.model = settings.LLM_MODEL
-        self.api_url = "https://openrouter.ai/api/v1/chat/completions"
+        self.api_url = settings.OPENROUTER_API_URL
+        self.timeout = settings.LLM_TIMEOUT_SECONDS
+        self.async_client = None
+        self.max_retries = settings.LLM_MAX_RETRIES
+        self.backoff_base = settings.LLM_BACKOFF_BASE_SECONDS
+        self.backoff_max = settings.LLM_BACKOFF_MAX_SECONDS
+        # Requests in flight adapt to the provider's throttling
+        self.concurrency = AdaptiveConcurrency(settings.EVALUATOR_CONCURRENCY)
+        self.compact_descriptions = settings.DESCRIPTION_COMPACTION_ENABLED
+        self.token_budget = token_budget(self.model)
     
     def setup(self):
         """Set up the OpenRouter evaluator"""
@@ -23,11 +78,12 @@ class OpenRouterEvaluator(BaseEvaluator):
             return False
         return True
     
+    @traced()
     def evaluate(self, job: Job) -> dict:
         """Evaluate a job"""
         if not self.api_key:
             if not self.setup():
-                return {"is_relevant": False, "reason": "Evaluator not set up properly"}
+                return {"is_relevant": False, "reason": "Evaluator not set up properly", "error": True}
         
         try:
             # Form the evaluation prompt
@@ -38,56 +94,174 @@ class OpenRouterEvaluator(BaseEvaluator):
             
             # Parse the result
             return self._parse_evaluation_result(result)
+        except TransientEvaluationError as e:
+            logger.warning(f"Evaluation of job {job.id} failed temporarily: {e}")
+            return self._transient_result(e)
+        except EvaluatorUnavailableError:
+            raise
         except Exception as e:
             logger.error(f"Error evaluating job: {e}")
-            return {
-                "is_relevant": False,
-                "score": 0,
-                "reason": f"Error during evaluation: {str(e)}",
-                "summary": "Error occurred during evaluation"
-            }
+            return self._error_result(e)
     
+    @traced()
+    async def evaluate_async(self, job: Job) -> dict:
+        """Evaluate a job over the shared async HTTP client"""
+        if not self.api_key:
+            if not self.setup():
+                return {"is_relevant": False, "reason": "Evaluator not set up properly", "error": True}
+        
+        try:
+            prompt = self._create_evaluation_prompt(job)
+            result = await self._call_llm_api_async(prompt)
+            return self._parse_evaluation_result(result)
+        except TransientEvaluationError as e:
+            logger.warning(f"Evaluation of job {job.id} failed temporarily: {e}")
+            return self._transient_result(e)
+        except EvaluatorUnavailableError:
+            raise
+        except Exception as e:
+            logger.error(f"Error evaluating job: {e}")
+            return self._error_result(e)
+    
+    def _transient_result(self, error: Exception) -> dict:
+        """Build the result of an evaluation that should be retried later"""
+        return dict(self._error_result(error), transient=True)
+    
+    def _error_result(self, error: Exception) -> dict:
+        """Build the verdict recorded when an evaluation fails"""
+        return {
+            "is_relevant": False,
+            "score": 0,
+            "reason": f"Error during evaluation: {str(error)}",
+            "summary": "Error occurred during evaluation",
+            "error": True
+        }
+    
+    @traced()
+    def evaluate_batch(self, jobs: List[Job]) -> List[dict]:
+        """Evaluate several jobs with a single request
+        
+        Jobs missing from the response, or with an invalid verdict, are
+        re-evaluated one by one.
+        """
+        if len(jobs) < 2:
+            return [self.evaluate(job) for job in jobs]
+        
+        try:
+            prompt = self._create_batch_evaluation_prompt(jobs)
+            evaluations = self._parse_batch_evaluation_result(self._call_llm_api(prompt), jobs)
+        except TransientEvaluationError as e:
+            # Retrying job by job would only add load while the provider is struggling
+            logger.warning(f"Evaluation of batch of {len(jobs)} jobs failed temporarily: {e}")
+            return [self._transient_result(e) for _ in jobs]
+        except EvaluatorUnavailableError:
+            raise
+        except Exception as e:
+            logger.error(f"Error evaluating batch of {len(jobs)} jobs: {e}")
+            evaluations = {}
+        
+        return [evaluations.get(job.id) or self.evaluate(job) for job in jobs]
+    
+    @traced()
+    async def evaluate_batch_async(self, jobs: List[Job]) -> List[dict]:
+        """Evaluate several jobs with a single request over the async client"""
+        if len(jobs) < 2:
+            return [await self.evaluate_async(job) for job in jobs]
+        
+        try:
+            prompt = self._create_batch_evaluation_prompt(jobs)
+            evaluations = self._parse_batch_evaluation_result(await self._call_llm_api_async(prompt), jobs)
+        except TransientEvaluationError as e:
+            logger.warning(f"Evaluation of batch of {len(jobs)} jobs failed temporarily: {e}")
+            return [self._transient_result(e) for _ in jobs]
+        except EvaluatorUnavailableError:
+            raise
+        except Exception as e:
+            logger.error(f"Error evaluating batch of {len(jobs)} jobs: {e}")
+            evaluations = {}
+        
+        return [evaluations.get(job.id) or await self.evaluate_async(job) for job in jobs]
+    
+    @traced()
     def _create_evaluation_prompt(self, job: Job) -> str:
         """Create an evaluation prompt for the job"""
-        # Get user profile from environment variables
-        user_skills = settings.get("USER_SKILLS", "Python, Data Science")
-        user_experience = settings.get("USER_EXPERIENCE", "5+ years in software development")
-        user_preferences = settings.get("USER_PREFERENCES", "Remote work")
-        
         prompt = f"""
         Please evaluate this job offer against my profile and provide a JSON response.
 
         JOB DETAILS:
-        Title: {job.title}
-        Company: {job.company}
-        Location: {job.location}
-        Description: {job.description}
+{self._format_job(job)}
 
-        MY PROFILE:
-        Skills: {user_skills}
-        Experience: {user_experience}
-        Preferences: {user_preferences}
+{self._format_profile()}
 
         Analyze the job description and determine how well it matches my skills, experience, and preferences. 
         Consider technical requirements, experience level, and work arrangements (remote/on-site).
 
         Return a JSON object with the following structure:
-        {{
-          "is_relevant": true/false,
-          "score": 0-100,
-          "reason": "Brief explanation why this job is or isn't a good match",
-          "summary": "Summary of the key points of this job and why it's a good match (if relevant)",
-          "skills_match": ["list", "of", "matching", "skills"],
-          "missing_skills": ["list", "of", "required", "skills", "I", "don't", "have"]
-        }}
+        {EVALUATION_SCHEMA}
 
         Ensure your response can be parsed as valid JSON.
         """
         
         return prompt
     
-    def _call_llm_api(self, prompt: str) -> str:
-        """Call the OpenRouter API"""
+    @traced()
+    def _create_batch_evaluation_prompt(self, jobs: List[Job]) -> str:
+        """Create one evaluation prompt covering several jobs"""
+        job_details = "\n\n".join(
+            f"        Job ID: {job.id}\n{self._format_job(job)}" for job in jobs
+        )
+        
+        prompt = f"""
+        Please evaluate each of these {len(jobs)} job offers against my profile and provide a JSON response.
+
+        JOBS:
+{job_details}
+
+{self._format_profile()}
+
+        Analyze each job description independently and determine how well it matches my skills, experience, and preferences. 
+        Consider technical requirements, experience level, and work arrangements (remote/on-site).
+
+        Return a JSON object of the form {{"evaluations": [...]}} with exactly one element per job.
+        Each element must have the following structure, with "job_id" set to the Job ID above:
+        {BATCH_EVALUATION_SCHEMA}
+
+        Ensure your response can be parsed as valid JSON.
+        """
+        
+        return prompt
+    
+    def _format_job(self, job: Job) -> str:
+        """Format the details of a job for a prompt"""
+        return (
+            f"        Title: {job.title}\n"
+            f"        Company: {job.company}\n"
+            f"        Location: {job.location}\n"
+            f"        Description: {self._prepare_description(job)}"
+        )
+    
+    def _prepare_description(self, job: Job) -> str:
+        """Compact a job description to the model's token budget"""
+        if not self.compact_descriptions:
+            return job.description
+        
+        description = compact_description(job.description, self.token_budget)
+        before = estimate_tokens(job.description)
+        after = estimate_tokens(description)
+        logger.info(f"Compacted description of job {job.id} from {before} to {after} tokens ({before - after} saved)")
+        return description
+    
+    def _format_profile(self) -> str:
+        """Format the user profile for a prompt"""
+        return (
+            f"        MY PROFILE:\n"
+            f"        Skills: {settings.USER_SKILLS}\n"
+            f"        Experience: {settings.USER_EXPERIENCE}\n"
+            f"        Preferences: {settings.USER_PREFERENCES}"
+        )
+    
+    def _build_request(self, prompt: str) -> tuple:
+        """Build the headers and payload for an OpenRouter chat completion"""
         headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key}"
@@ -103,26 +277,164 @@ class OpenRouterEvaluator(BaseEvaluator):
             "response_format": {"type": "json_object"}
         }
         
-        response = requests.post(self.api_url, headers=headers, json=data)
+        return headers, data
+    
+    @traced()
+    def _call_llm_api(self, prompt: str) -> str:
+        """Call the OpenRouter API, retrying throttled and failed requests with backoff"""
+        headers, data = self._build_request(prompt)
+        
+        with LLM_REQUEST_SECONDS.time():
+            for attempt in range(self.max_retries + 1):
+                self.concurrency.acquire()
+                try:
+                    response = requests.post(self.api_url, headers=headers, json=data, timeout=self.timeout)
+                    return self._read_response(response, prompt)
+                except requests.HTTPError:
+                    raise
+                except requests.RequestException as e:
+                    # Connection failures and timeouts
+                    error = TransientEvaluationError(str(e))
+                except TransientEvaluationError as e:
+                    error = e
+                finally:
+                    self.concurrency.release()
+                
+                if attempt < self.max_retries:
+                    delay = backoff_delay(attempt, self.backoff_base, self.backoff_max, error.retry_after)
+                    logger.warning(f"OpenRouter request failed ({error}), retrying in {delay:.1f}s")
+                    time.sleep(delay)
+            raise error
+    
+    @traced()
+    async def _call_llm_api_async(self, prompt: str) -> str:
+        """Call the OpenRouter API over a keep-alive async client, retrying like _call_llm_api"""
+        if self.async_client is None:
+            # Created lazily so it binds to the event loop that uses it
+            self.async_client = httpx.AsyncClient(timeout=self.timeout)
+        
+        headers, data = self._build_request(prompt)
+        
+        with LLM_REQUEST_SECONDS.time():
+            for attempt in range(self.max_retries + 1):
+                await self.concurrency.acquire_async()
+                try:
+                    response = await self.async_client.post(self.api_url, headers=headers, json=data)
+                    return self._read_response(response, prompt)
+                except httpx.TransportError as e:
+                    error = TransientEvaluationError(str(e) or type(e).__name__)
+                except TransientEvaluationError as e:
+                    error = e
+                finally:
+                    self.concurrency.release()
+                
+                if attempt < self.max_retries:
+                    delay = backoff_delay(attempt, self.backoff_base, self.backoff_max, error.retry_after)
+                    logger.warning(f"OpenRouter request failed ({error}), retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+            raise error
+    
+    def _read_response(self, response, prompt: str = "") -> str:
+        """Extract the completion from a response, feeding its rate-limit signals to the limiter
+        
+        Throttled and server-side failures raise TransientEvaluationError,
+        authentication and billing failures EvaluatorUnavailableError; other
+        HTTP errors are raised as they are.
+        """
+        reset = _quota_reset_seconds(response.headers)
+        if reset:
+            logger.info(f"OpenRouter quota exhausted, pausing requests for {reset:.1f}s")
+            self.concurrency.pause(reset)
+        
+        if response.status_code in TRANSIENT_STATUSES:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if response.status_code in THROTTLED_STATUSES:
+                self.concurrency.on_throttle(retry_after)
+            raise TransientEvaluationError(f"OpenRouter returned HTTP {response.status_code}", retry_after)
+        if response.status_code in UNAVAILABLE_STATUSES:
+            raise EvaluatorUnavailableError(f"OpenRouter returned HTTP {response.status_code}: {response.text[:200]}")
+        
         response.raise_for_status()
+        self.concurrency.on_success()
+        body = response.json()
+        content = body["choices"][0]["message"]["content"]
         
-        return response.json()["choices"][0]["message"]["content"]
+        # Prefer the provider's token counts; estimate them when it sends none
+        usage = body.get("usage") or {}
+        LLM_PROMPT_TOKENS.observe(usage.get("prompt_tokens") or estimate_tokens(prompt))
+        LLM_RESPONSE_TOKENS.observe(usage.get("completion_tokens") or estimate_tokens(content))
+        return content
     
+    @traced()
     def _parse_evaluation_result(self, result: str) -> dict:
         """Parse the evaluation result from the LLM"""
         try:
-            evaluation = json.loads(result)
-            return evaluation
+            evaluation = self._validate_evaluation(json.loads(result))
+            if evaluation is not None:
+                return evaluation
+            logger.error("LLM response is not a valid evaluation")
         except json.JSONDecodeError:
             logger.error("Failed to parse LLM response as JSON")
-            return {
-                "is_relevant": False,
-                "score": 0,
-                "reason": "Failed to parse LLM response",
-                "summary": "Error evaluating job"
-            }
+        
+        return {
+            "is_relevant": False,
+            "score": 0,
+            "reason": "Failed to parse LLM response",
+            "summary": "Error evaluating job",
+            "error": True
+        }
+    
+    @traced()
+    def _parse_batch_evaluation_result(self, result: str, jobs: List[Job]) -> Dict[int, dict]:
+        """Parse a batch evaluation result into valid verdicts keyed by job id
+        
+        Elements that are malformed or refer to unknown jobs are dropped.
+        """
+        try:
+            parsed = json.loads(result)
+        except json.JSONDecodeError:
+            logger.error("Failed to parse batch LLM response as JSON")
+            return {}
+        
+        if isinstance(parsed, dict):
+            parsed = parsed.get("evaluations")
+        if not isinstance(parsed, list):
+            logger.error("Batch LLM response does not contain an evaluations array")
+            return {}
+        
+        job_ids = {str(job.id): job.id for job in jobs}
+        evaluations = {}
+        for element in parsed:
+            evaluation = self._validate_evaluation(element)
+            if evaluation is None:
+                continue
+            job_id = job_ids.get(str(evaluation.pop("job_id", None)))
+            if job_id is not None:
+                evaluations.setdefault(job_id, evaluation)
+        
+        if len(evaluations) < len(jobs):
+            logger.warning(f"Batch LLM response covered {len(evaluations)} of {len(jobs)} jobs")
+        return evaluations
+    
+    def _validate_evaluation(self, evaluation) -> Optional[dict]:
+        """Check that a parsed evaluation has the fields the pipeline relies on"""
+        if not isinstance(evaluation, dict) or not isinstance(evaluation.get("is_relevant"), bool):
+            return None
+        try:
+            evaluation["score"] = float(evaluation.get("score", 0))
+        except (TypeError, ValueError):
+            return None
+        evaluation.setdefault("reason", "")
+        evaluation.setdefault("summary", "")
+        return evaluation
     
     def cleanup(self):
         """Clean up resources"""
         # No cleanup needed for API-based evaluator
-        pass
\ No newline at end of file
+        pass
+    
+    async def cleanup_async(self):
+        """Close the async HTTP client"""
+        if self.async_client is not None:
+            await self.async_client.aclose()
+            self.async_client = None
\ No newline at end of file
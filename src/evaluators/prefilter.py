@@ -0,0 +1,130 @@
+import logging
+import math
+import re
+import zlib
+from collections import Counter
+from typing import Dict, Optional
+from src.config import settings
+from src.database.models import Job
+from src.evaluators.base import BaseEvaluator, StageEvaluator
+from src.utils.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+_STOP_WORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or our that the their this to we will with you your
+""".split())
+
+def _compile(pattern: str) -> Optional[re.Pattern]:
+    """Compile a case-insensitive rule, or return None for an empty one"""
+    return re.compile(pattern, re.IGNORECASE) if pattern else None
+
+def _keywords_pattern(keywords: str) -> Optional[re.Pattern]:
+    """Compile a comma-separated keyword list into one word-boundary regex"""
+    words = [re.escape(word.strip()) for word in keywords.split(",") if word.strip()]
+    if not words:
+        return None
+    return re.compile(r"(?<!\w)(?:" + "|".join(words) + r")(?!\w)", re.IGNORECASE)
+
+def hashed_bag_of_words(text: str, dimensions: int = 1 << 18) -> Dict[int, float]:
+    """Vectorize text as a sparse, length-normalized hashed bag of words"""
+    counts = Counter(
+        zlib.crc32(token.encode("utf-8")) % dimensions
+        for token in _TOKEN.findall((text or "").lower())
+        if token not in _STOP_WORDS
+    )
+    # Sublinear term frequency keeps long boilerplate from dominating
+    vector = {index: 1 + math.log(count) for index, count in counts.items()}
+    norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+    return {index: weight / norm for index, weight in vector.items()} if norm else {}
+
+def cosine_similarity(a: Dict[int, float], b: Dict[int, float]) -> float:
+    """Cosine similarity of two normalized sparse vectors"""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b.get(index, 0.0) for index, weight in a.items())
+
+class PreFilterEvaluator(StageEvaluator):
+    """Cheap local stage that rejects obvious misses before the LLM
+    
+    Jobs are checked against compiled title, company, location and keyword rules and
+    against the similarity of their hashed bag of words to the user profile.
+    Jobs that fail a check are rejected with a rule-based reason; the rest
+    are passed on to the wrapped evaluator. Every rule is off when unset.
+    """
+    
+    def __init__(self, evaluator: BaseEvaluator, exclude_title: str = None, exclude_company: str = None,
+                 exclude_location: str = None, required_keywords: str = None, min_similarity: float = None):
+        """Initialize the pre-filter from arguments or settings"""
+        super().__init__(evaluator)
+        self.exclude_title = _compile(
+            settings.PREFILTER_EXCLUDE_TITLE if exclude_title is None else exclude_title
+        )
+        self.exclude_company = _compile(
+            settings.PREFILTER_EXCLUDE_COMPANY if exclude_company is None else exclude_company
+        )
+        self.exclude_location = _compile(
+            settings.PREFILTER_EXCLUDE_LOCATION if exclude_location is None else exclude_location
+        )
+        self.required_keywords = _keywords_pattern(
+            settings.PREFILTER_REQUIRED_KEYWORDS if required_keywords is None else required_keywords
+        )
+        self.min_similarity = settings.PREFILTER_MIN_SIMILARITY if min_similarity is None else min_similarity
+        self.profile_vector = hashed_bag_of_words(
+            " ".join([settings.USER_SKILLS, settings.USER_EXPERIENCE, settings.USER_PREFERENCES])
+        )
+        self.stats = Counter()
+    
+    def cleanup(self):
+        """Report what the pre-filter did and clean up the wrapped evaluator"""
+        rejected = sum(count for rule, count in self.stats.items() if rule != "passed")
+        total = rejected + self.stats["passed"]
+        details = ", ".join(f"{rule}: {count}" for rule, count in sorted(self.stats.items()) if rule != "passed")
+        logger.info(f"Pre-filter rejected {rejected} of {total} jobs" + (f" ({details})" if details else ""))
+        self.evaluator.cleanup()
+    
+    @traced()
+    def _lookup(self, job: Job) -> Optional[dict]:
+        """Reject the job if it fails a rule, otherwise pass it on"""
+        rule, reason = self._check(job)
+        if rule is None:
+            self.stats["passed"] += 1
+            return None
+        
+        self.stats[rule] += 1
+        return {
+            "is_relevant": False,
+            "score": 0,
+            "reason": f"Pre-filter: {reason}",
+            "summary": "",
+            "prefiltered": rule,
+        }
+    
+    def _check(self, job: Job) -> tuple:
+        """Return the (rule, reason) of the first failed check, or (None, None)"""
+        if self.exclude_title:
+            match = self.exclude_title.search(job.title or "")
+            if match:
+                return "title", f"title matches excluded pattern '{match.group(0)}'"
+        
+        if self.exclude_company:
+            match = self.exclude_company.search(job.company or "")
+            if match:
+                return "company", f"company matches excluded pattern '{match.group(0)}'"
+        
+        if self.exclude_location:
+            match = self.exclude_location.search(job.location or "")
+            if match:
+                return "location", f"location matches excluded pattern '{match.group(0)}'"
+        
+        text = f"{job.title}\n{job.description}"
+        if self.required_keywords and not self.required_keywords.search(text):
+            return "keywords", "none of the required keywords appear in the job"
+        
+        if self.min_similarity > 0:
+            similarity = cosine_similarity(hashed_bag_of_words(text), self.profile_vector)
+            if similarity < self.min_similarity:
+                return "similarity", f"profile similarity {similarity:.2f} is below {self.min_similarity:.2f}"
+        
+        return None, None
@@ -1,9 +1,28 @@
+import asyncio
+import atexit
 import logging
+import math
+import os
+import socket
 import time
+from typing import Iterable, Iterator, List, Optional, Set
 from src.config import settings
-from src.database.operations import DatabaseOperations
-from src.database.models import RelevantJob, RejectedJob
+from src.database.migrate import apply_migrations
+from src.database.operations import NEW_JOBS_CHANNEL, DatabaseOperations
+from src.database.models import Job
+from src.database.pool import close_pools
+from src.database.verdict_sink import VerdictSink
+from src.evaluators.base import BaseEvaluator, EvaluatorUnavailableError
+from src.evaluators.cache import CachingEvaluator
+from src.evaluators.concurrent import ConcurrentEvaluator
+from src.evaluators.near_duplicate import NearDuplicateEvaluator
 from src.evaluators.openrouter import OpenRouterEvaluator
+from src.evaluators.prefilter import PreFilterEvaluator
+from src.utils.iterables import batched
+from src.utils.metrics import EVALUATION_BACKLOG
+from src.utils.metrics_server import start_metrics_server
+from src.utils.rate_limiter import TokenBucket
+from src.utils.tracing import start_tracing, traced
 
 # Set up logging
 logging.basicConfig(
@@ -12,66 +31,194 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def run_evaluator():
-    """Run the job evaluator"""
-    db = DatabaseOperations()
+# Delay before a listener whose connection failed subscribes again
+LISTEN_RETRY_SECONDS = 10
+
+async def evaluate_concurrently(sink: VerdictSink, evaluator: BaseEvaluator, jobs: Iterable[Job]) -> int:
+    """Evaluate jobs in parallel, buffering each result in the sink as soon as it is ready"""
+    try:
+        return await ConcurrentEvaluator(evaluator).run(jobs, sink.add)
+    finally:
+        await evaluator.cleanup_async()
+
+def claim_jobs(db: DatabaseOperations, worker_id: str, claimed_ids: Set[int],
+               job_ids: Optional[List[int]] = None) -> Iterator[Job]:
+    """Yield unevaluated jobs, claiming them from the shared queue a batch at a time
+    
+    Each batch is claimed only once the previous one has been consumed, so
+    evaluation starts on the first page and leases are not taken early. The
+    ids of claimed jobs are added to claimed_ids so the caller can release
+    whatever is left unevaluated when the run ends. Passing job_ids limits
+    the claims to those jobs instead of sweeping the whole queue.
+    """
+    last_id = 0
+    while True:
+        jobs = db.claim_jobs(
+            worker_id, settings.EVALUATOR_CLAIM_BATCH_SIZE, settings.EVALUATOR_LEASE_SECONDS, after_id=last_id,
+            job_ids=job_ids
+        )
+        if not jobs:
+            return
+        claimed_ids.update(job.id for job in jobs)
+        last_id = jobs[-1].id
+        yield from jobs
+
+def build_evaluator(db: DatabaseOperations) -> BaseEvaluator:
+    """Create the OpenRouter evaluator behind the configured cheaper stages"""
     evaluator = OpenRouterEvaluator()
     
+    # Let jobs that differ only in boilerplate inherit an earlier verdict
+    if settings.NEAR_DUPLICATE_ENABLED:
+        evaluator = NearDuplicateEvaluator(evaluator, db)
+    
+    # Reuse verdicts of reposted and duplicate jobs instead of paying for them again
+    if settings.EVALUATION_CACHE_ENABLED:
+        evaluator = CachingEvaluator(evaluator, db)
+    
+    # Reject obvious misses locally before anything else
+    if settings.PREFILTER_ENABLED:
+        evaluator = PreFilterEvaluator(evaluator)
+    return evaluator
+
+@traced()
+def evaluate_jobs(evaluator: BaseEvaluator, sink: VerdictSink, jobs: Iterable[Job],
+                  rate_limiter: TokenBucket = None):
+    """Evaluate jobs and buffer their verdicts in the sink, concurrently when configured to"""
+    if settings.EVALUATOR_CONCURRENCY > 1:
+        evaluated = asyncio.run(evaluate_concurrently(sink, evaluator, jobs))
+        logger.info(f"Evaluated {evaluated} jobs with concurrency {settings.EVALUATOR_CONCURRENCY}")
+        return
+    
+    # Evaluate jobs in batches, pacing requests to the configured rate
+    rate_limiter = rate_limiter or TokenBucket(settings.EVALUATOR_REQUESTS_PER_MINUTE)
+    for batch in batched(jobs, settings.EVALUATOR_BATCH_SIZE):
+        rate_limiter.acquire()
+        try:
+            evaluations = evaluator.evaluate_batch(batch)
+        except EvaluatorUnavailableError:
+            raise
+        except Exception as e:
+            logger.error(f"Error evaluating batch of {len(batch)} jobs: {e}")
+            continue
+        
+        # Buffer evaluation results for the next batched save
+        for job, evaluation in zip(batch, evaluations):
+            try:
+                sink.add(job, evaluation)
+            except Exception as e:
+                logger.error(f"Error saving evaluation for job {job.id}: {e}")
+
+def worker_name() -> str:
+    """Identify this process in job leases"""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+@traced()
+def run_evaluator(job_ids: Optional[List[int]] = None):
+    """Run the job evaluator over the whole queue, or only over the given jobs"""
+    db = DatabaseOperations()
+    evaluator = build_evaluator(db)
+    worker_id = worker_name()
+    claimed_ids = set()
+    # Verdicts are saved in batches on a connection of their own
+    sink = VerdictSink()
+    
     try:
         # Connect to database
         db.connect()
+        apply_migrations(db)
         
         # Set up evaluator
         if not evaluator.setup():
             logger.error("Failed to set up evaluator")
             return
         
-        # Get unevaluated jobs
-        unevaluated_jobs = db.get_unevaluated_jobs()
-        logger.info(f"Found {len(unevaluated_jobs)} unevaluated jobs")
+        # Claim unevaluated jobs so concurrent workers never evaluate the same job
+        unevaluated_jobs = claim_jobs(db, worker_id, claimed_ids, job_ids)
         
-        # Evaluate each job
-        for job in unevaluated_jobs:
-            try:
-                # Evaluate job
-                evaluation = evaluator.evaluate(job)
-                
-                # Save evaluation result
-                if evaluation["is_relevant"]:
-                    relevant_job = RelevantJob(
-                        job_id=job.id,
-                        evaluation_score=evaluation["score"],
-                        evaluation_summary=evaluation["summary"]
-                    )
-                    db.save_relevant_job(relevant_job)
-                else:
-                    rejected_job = RejectedJob(
-                        job_id=job.id,
-                        reason=evaluation["reason"]
-                    )
-                    db.save_rejected_job(rejected_job)
-                
-                # Add a small delay between evaluations
-                time.sleep(1)
-            except Exception as e:
-                logger.error(f"Error evaluating job {job.id}: {e}")
+        sink.start()
+        evaluate_jobs(evaluator, sink, unevaluated_jobs)
         
+    except EvaluatorUnavailableError as e:
+        # Claimed jobs are released below and stay pending for a later run
+        logger.error(f"Stopping evaluation, the evaluator is unavailable: {e}")
     except Exception as e:
         logger.error(f"Error running evaluator: {e}")
     finally:
-        # Clean up resources
+        # Clean up resources; verdicts must be saved before their leases are released
+        sink.close()
+        if claimed_ids:
+            # Hand back leases early; jobs without a verdict are claimable again
+            logger.info(f"Processed {len(claimed_ids)} claimed jobs")
+            db.release_jobs(worker_id, list(claimed_ids))
         evaluator.cleanup()
         db.close()
         logger.info("Evaluator run completed")
 
+def count_backlog() -> float:
+    """Count the jobs waiting for a verdict for the backlog gauge, or NaN if the database cannot be read"""
+    try:
+        with DatabaseOperations() as db:
+            count = db.count_pending_jobs()
+    except Exception as e:
+        logger.warning(f"Error counting the evaluation backlog: {e}")
+        count = None
+    return math.nan if count is None else count
+
+def parse_job_ids(payloads: List[str]) -> List[int]:
+    """Collect the job ids of new-job notification payloads"""
+    job_ids = set()
+    for payload in payloads:
+        for job_id in payload.split(","):
+            if job_id.strip().isdigit():
+                job_ids.add(int(job_id))
+    return sorted(job_ids)
+
+def listen_for_jobs():
+    """Evaluate new jobs as soon as they are stored, sweeping the whole queue periodically
+    
+    Notifications arriving within EVALUATOR_DEBOUNCE_SECONDS of each other
+    are evaluated in one run. The sweep every EVALUATOR_INTERVAL_SECONDS
+    catches jobs whose notification was missed, e.g. while the evaluator
+    was down, and jobs whose lease expired.
+    """
+    listener = DatabaseOperations()
+    listener.listen(NEW_JOBS_CHANNEL)
+    next_sweep = time.monotonic()
+    try:
+        while True:
+            payloads = listener.wait_for_notifications(next_sweep - time.monotonic())
+            if payloads:
+                # Let a burst of inserts settle into one run
+                time.sleep(settings.EVALUATOR_DEBOUNCE_SECONDS)
+                payloads += listener.wait_for_notifications(0)
+                job_ids = parse_job_ids(payloads)
+                logger.info(f"Notified of {len(job_ids)} new jobs")
+                run_evaluator(job_ids)
+            if time.monotonic() >= next_sweep:
+                run_evaluator()
+                next_sweep = time.monotonic() + settings.EVALUATOR_INTERVAL_SECONDS
+    finally:
+        listener.close()
+
 if __name__ == "__main__":
-    # Run the evaluator periodically
+    atexit.register(close_pools)
+    # The backlog is counted whenever metrics are scraped
+    EVALUATION_BACKLOG.set_function(count_backlog)
+    start_metrics_server()
+    start_tracing("evaluator")
+    
+    # Run the evaluator whenever jobs are stored, or periodically
     while True:
         try:
-            run_evaluator()
+            if settings.EVALUATOR_LISTEN:
+                # Only returns if the listening connection fails
+                listen_for_jobs()
+            else:
+                run_evaluator()
         except Exception as e:
             logger.error(f"Error in evaluator: {e}")
         
-        # Sleep for a specified interval
-        logger.info(f"Sleeping for {settings.EVALUATOR_INTERVAL_SECONDS} seconds")
-        time.sleep(settings.EVALUATOR_INTERVAL_SECONDS)
\ No newline at end of file
+        # Sleep for a specified interval; a failed listener reconnects sooner
+        interval = LISTEN_RETRY_SECONDS if settings.EVALUATOR_LISTEN else settings.EVALUATOR_INTERVAL_SECONDS
+        logger.info(f"Sleeping for {interval} seconds")
+        time.sleep(interval)
@@ -0,0 +1,188 @@
+import atexit
+import logging
+import threading
+import time
+from queue import Empty, Full, Queue
+from typing import List
+from src.config import settings
+from src.database.migrate import apply_migrations
+from src.database.models import Job
+from src.database.operations import DatabaseOperations
+from src.database.pool import close_pools
+from src.database.verdict_sink import VerdictSink
+from src.evaluators.base import EvaluatorUnavailableError
+from src.run_evaluator import build_evaluator, claim_jobs, count_backlog, evaluate_jobs, worker_name
+from src.run_scraper import create_scraper, run_scraper
+from src.utils.metrics import EVALUATION_BACKLOG
+from src.utils.metrics_server import start_metrics_server
+from src.utils.rate_limiter import TokenBucket
+from src.utils.tracing import start_tracing
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Delay before a pipeline whose evaluator stage failed is started again
+RESTART_DELAY_SECONDS = 60
+
+class JobHandoff:
+    """Bounded in-memory queue of stored jobs between the scraper and evaluator stages
+    
+    The scraper blocks while the queue is full, so a slow LLM slows scraping
+    down instead of piling jobs up in memory. Jobs are stored before they
+    are queued; any that are lost with the process are picked up from the
+    database by the evaluator's sweep.
+    """
+    
+    def __init__(self, maxsize: int = None):
+        """Initialize the queue"""
+        self.queue = Queue(maxsize=maxsize or settings.PIPELINE_QUEUE_SIZE)
+        self.closed = threading.Event()
+    
+    def put(self, jobs: List[Job]):
+        """Queue stored jobs for evaluation, waiting while the queue is full
+        
+        Jobs are dropped once the handoff is closed, so the scraper never
+        waits on an evaluator that has stopped.
+        """
+        for job in jobs:
+            while not self.closed.is_set():
+                try:
+                    self.queue.put(job, timeout=1)
+                    break
+                except Full:
+                    continue
+    
+    def take(self, max_jobs: int, timeout: float) -> List[Job]:
+        """Wait up to timeout seconds for a job, then take up to max_jobs without waiting"""
+        try:
+            jobs = [self.queue.get(timeout=max(0, timeout))]
+        except Empty:
+            return []
+        while len(jobs) < max_jobs:
+            try:
+                jobs.append(self.queue.get_nowait())
+            except Empty:
+                break
+        return jobs
+    
+    def close(self):
+        """Stop accepting jobs"""
+        self.closed.set()
+
+def evaluate_handoff(handoff: JobHandoff, stop: threading.Event):
+    """Evaluate handed-off jobs as they arrive until stopped
+    
+    Jobs are still claimed before they are evaluated, so separate evaluator
+    processes never work on the same jobs. The whole database queue is
+    swept on start and every EVALUATOR_INTERVAL_SECONDS, catching jobs
+    stored while the pipeline was down and jobs whose lease expired. While
+    the evaluator is unavailable, handed-off jobs are left for the next sweep.
+    """
+    db = DatabaseOperations()
+    evaluator = build_evaluator(db)
+    worker_id = worker_name()
+    # Verdicts are saved in batches on a connection of their own
+    sink = VerdictSink()
+    rate_limiter = TokenBucket(settings.EVALUATOR_REQUESTS_PER_MINUTE)
+    next_sweep = time.monotonic()
+    paused = False
+    
+    try:
+        # Connect to database
+        db.connect()
+        apply_migrations(db)
+        
+        # Set up evaluator
+        if not evaluator.setup():
+            logger.error("Failed to set up evaluator")
+            return
+        
+        sink.start()
+        while not stop.is_set():
+            claimed_ids = set()
+            try:
+                if time.monotonic() >= next_sweep:
+                    paused = False
+                    jobs = claim_jobs(db, worker_id, claimed_ids)
+                    next_sweep = time.monotonic() + settings.EVALUATOR_INTERVAL_SECONDS
+                else:
+                    # Wake up at least every second to notice a stop
+                    handed_off = handoff.take(
+                        settings.EVALUATOR_CLAIM_BATCH_SIZE, min(1, next_sweep - time.monotonic())
+                    )
+                    if not handed_off or paused:
+                        continue
+                    jobs = claim_jobs(db, worker_id, claimed_ids, [job.id for job in handed_off])
+                
+                evaluate_jobs(evaluator, sink, jobs, rate_limiter)
+            except EvaluatorUnavailableError as e:
+                logger.error(f"Evaluator unavailable, retrying at the next sweep: {e}")
+                paused = True
+                next_sweep = time.monotonic() + settings.EVALUATOR_INTERVAL_SECONDS
+            except Exception as e:
+                logger.error(f"Error evaluating handed-off jobs: {e}")
+            
+            # Verdicts must be saved before their leases are released
+            if claimed_ids and sink.flush():
+                logger.info(f"Processed {len(claimed_ids)} claimed jobs")
+                db.release_jobs(worker_id, list(claimed_ids))
+        
+    except Exception as e:
+        logger.error(f"Error running evaluator stage: {e}")
+    finally:
+        # Clean up resources; the scraper stops queueing once nobody evaluates
+        handoff.close()
+        sink.close()
+        evaluator.cleanup()
+        db.close()
+        logger.info("Evaluator stage stopped")
+
+def run_pipeline():
+    """Scrape and evaluate in one process, handing newly stored jobs straight to the evaluator
+    
+    The scraper stage runs every SCRAPER_INTERVAL_SECONDS in this thread
+    while the evaluator stage consumes its jobs in another. Returns if the
+    evaluator stage stops.
+    """
+    handoff = JobHandoff()
+    stop = threading.Event()
+    evaluator_stage = threading.Thread(
+        target=evaluate_handoff, args=(handoff, stop), name="pipeline-evaluator", daemon=True
+    )
+    evaluator_stage.start()
+    # Keep one browser alive between runs when configured to
+    scraper = create_scraper() if settings.SCRAPER_KEEP_ALIVE else None
+    
+    try:
+        while evaluator_stage.is_alive():
+            run_scraper(scraper, on_saved=handoff.put)
+            
+            # Sleep for a specified interval, waking up if the evaluator stage stops
+            logger.info(f"Sleeping for {settings.SCRAPER_INTERVAL_SECONDS} seconds")
+            evaluator_stage.join(settings.SCRAPER_INTERVAL_SECONDS)
+        logger.error("Evaluator stage stopped, stopping the pipeline")
+    finally:
+        stop.set()
+        handoff.close()
+        evaluator_stage.join()
+        if scraper is not None:
+            scraper.cleanup()
+
+if __name__ == "__main__":
+    atexit.register(close_pools)
+    EVALUATION_BACKLOG.set_function(count_backlog)
+    start_metrics_server()
+    start_tracing("pipeline")
+    
+    while True:
+        try:
+            run_pipeline()
+        except Exception as e:
+            logger.error(f"Error in pipeline: {e}")
+        
+        logger.info(f"Restarting pipeline in {RESTART_DELAY_SECONDS} seconds")
+        time.sleep(RESTART_DELAY_SECONDS)
@@ -1,8 +1,19 @@
+import atexit
 import logging
 import time
+from typing import Callable, Dict, List, Optional
 from src.config import settings
-from src.database.operations import DatabaseOperations
+from src.database.migrate import apply_migrations
 from src.database.models import Job
+from src.database.operations import DatabaseOperations
+from src.database.pool import close_pools
+from src.evaluators.near_duplicate import NearDuplicateIndex
+from src.utils.bloom import BloomFilter
+from src.utils.metrics import JOBS_DUPLICATE, JOBS_SAVED, JOBS_SCRAPED
+from src.utils.metrics_server import start_metrics_server
+from src.utils.tracing import start_tracing, traced
+from src.scrapers.base import BaseScraper
+from src.scrapers.linkedin_http_scraper import LinkedInHttpScraper
 from src.scrapers.linkedin_scraper import LinkedInScraper
 
 # Set up logging
@@ -12,54 +23,139 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def run_scraper():
-    """Run the job scraper"""
+def load_link_index(db: DatabaseOperations) -> BloomFilter:
+    """Build a Bloom filter of every stored job link in one streaming query"""
+    link_index = BloomFilter(settings.LINK_INDEX_CAPACITY, settings.LINK_INDEX_ERROR_RATE)
+    for link in db.iter_job_links():
+        link_index.add(link)
+    if len(link_index) > link_index.capacity:
+        logger.warning(
+            f"Link index holds {len(link_index)} links, above its capacity of {link_index.capacity}; "
+            "raise LINK_INDEX_CAPACITY to keep the false positive rate down"
+        )
+    logger.info(f"Loaded {len(link_index)} known job links")
+    return link_index
+
+def create_scraper() -> BaseScraper:
+    """Create the scraper for the configured backend"""
+    if settings.SCRAPER_BACKEND == "http":
+        return LinkedInHttpScraper()
+    return LinkedInScraper()
+
+@traced()
+def save_batch(db: DatabaseOperations, scraper: BaseScraper, keyword: str, jobs: List[Job],
+               near_duplicates: Optional[NearDuplicateIndex], totals: Dict[str, int],
+               on_saved: Callable[[List[Job]], None] = None):
+    """Store one keyword's jobs and record the keyword as finished
+    
+    The keyword's checkpoint, the link index and the run's progress only
+    advance once all of its jobs are stored. Jobs new to the database are
+    then passed to on_saved, if given.
+    """
+    # Save jobs in one transaction, letting the database skip known links
+    saved_count, duplicate_count = db.save_jobs_bulk(jobs)
+    totals["scraped"] += len(jobs)
+    totals["saved"] += saved_count
+    totals["duplicates"] += duplicate_count
+    JOBS_SCRAPED.inc(len(jobs))
+    JOBS_SAVED.inc(saved_count)
+    JOBS_DUPLICATE.inc(duplicate_count)
+    logger.info(f"Keyword '{keyword}': saved {saved_count} of {len(jobs)} jobs, {duplicate_count} already existed")
+    
+    if saved_count + duplicate_count == len(jobs):
+        if keyword in scraper.checkpoints:
+            db.save_scrape_checkpoints(scraper.name, {keyword: scraper.checkpoints[keyword]})
+        if scraper.link_index is not None:
+            for job in jobs:
+                scraper.link_index.add(job.link)
+        db.mark_keyword_finished(scraper.name, keyword)
+    
+    # Index the new jobs so the evaluator can spot near-duplicates
+    new_jobs = [job for job in jobs if job.id is not None]
+    if near_duplicates is not None:
+        indexed = near_duplicates.index_jobs(new_jobs)
+        logger.info(f"Indexed {indexed} new jobs for near-duplicate detection")
+    
+    if on_saved is not None and new_jobs:
+        on_saved(new_jobs)
+
+@traced()
+def run_scraper(scraper: BaseScraper = None, on_saved: Callable[[List[Job]], None] = None):
+    """Run the job scraper
+    
+    A scraper passed in by the caller is kept open afterwards, so a
+    long-lived process can reuse its warm browser session across runs.
+    Jobs are stored keyword by keyword as they are scraped, and a run that
+    is interrupted resumes at the first keyword it had not stored.
+    on_saved is called with the jobs of each batch that were new to the
+    database, right after they are stored.
+    """
     db = DatabaseOperations()
-    scraper = LinkedInScraper()
+    keep_alive = scraper is not None
+    scraper = scraper or create_scraper()
     
     try:
         # Connect to database
         db.connect()
+        apply_migrations(db)
         
         # Set up scraper
         if not scraper.setup():
             logger.error("Failed to set up scraper")
             return
         
-        # Get jobs
-        jobs = scraper.scrape()
-        logger.info(f"Scraped {len(jobs)} jobs")
+        # Warm the link index once; a kept-alive scraper keeps it between runs
+        if settings.LINK_INDEX_ENABLED and scraper.link_index is None:
+            scraper.set_link_index(load_link_index(db))
+        
+        # Resume from the newest postings seen by earlier runs
+        if settings.SCRAPER_FULL_RESYNC:
+            logger.info("Full resync: ignoring scrape checkpoints")
+            scraper.set_checkpoints({})
+        else:
+            scraper.set_checkpoints(db.get_scrape_checkpoints(scraper.name))
         
-        # Save jobs to database
-        saved_count = 0
-        for job in jobs:
-            # Check if job already exists
-            if db.job_exists(job.link):
-                logger.info(f"Job already exists: {job.title} at {job.company}")
-                continue
-            
-            # Save job
-            if db.save_job(job):
-                saved_count += 1
-                
-            # Add a small delay between saving jobs
-            time.sleep(0.5)
+        # Skip keywords an interrupted run already stored; a completed run clears its
+        # progress, and the next scheduled run comes a full interval after a failed one
+        finished = set()
+        if not settings.SCRAPER_FULL_RESYNC:
+            finished = db.get_finished_keywords(scraper.name, settings.SCRAPER_RESUME_MAX_AGE_SECONDS)
+        keywords = [keyword for keyword in settings.SEARCH_KEYWORDS if keyword not in finished]
+        if finished:
+            logger.info(f"Resuming interrupted run, skipping {len(finished)} finished keywords")
         
-        logger.info(f"Saved {saved_count} new jobs to database")
+        near_duplicates = NearDuplicateIndex(db) if settings.NEAR_DUPLICATE_ENABLED else None
+        totals = {"scraped": 0, "saved": 0, "duplicates": 0}
+        for keyword, jobs in (scraper.scrape_batches(keywords) if keywords else []):
+            save_batch(db, scraper, keyword, jobs, near_duplicates, totals, on_saved)
+        
+        # Every keyword was attempted; the next run starts from the first one
+        db.clear_scrape_progress(scraper.name)
+        logger.info(f"Scraped {totals['scraped']} jobs")
+        logger.info(f"Saved {totals['saved']} new jobs to database")
+        logger.info(f"Skipped {totals['duplicates']} jobs that already exist")
         
     except Exception as e:
         logger.error(f"Error running scraper: {e}")
     finally:
         # Clean up resources
-        scraper.cleanup()
+        if not keep_alive:
+            scraper.cleanup()
         db.close()
         logger.info("Scraper run completed")
 
 if __name__ == "__main__":
+    atexit.register(close_pools)
+    start_metrics_server()
+    start_tracing("scraper")
+    
+    # Keep one browser alive between runs when configured to
+    scraper = create_scraper() if settings.SCRAPER_KEEP_ALIVE else None
+    
     # Run the scraper periodically
     while True:
         try:
-            run_scraper()
+            run_scraper(scraper)
         except Exception as e:
             logger.error(f"Error in scraper: {e}")
         
@@ -1,10 +1,36 @@
+import re
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, Iterator, List, Optional, Tuple
+from src.config import settings
 from src.database.models import Job
+from src.utils.bloom import BloomFilter
+
+# Canonical form of a LinkedIn job link, so the same posting always dedups to one row
+JOB_VIEW_URL = "https://www.linkedin.com/jobs/view/{}/"
+# Job view links as search results carry them, with an optional title slug and tracking parameters
+JOB_VIEW_PATTERN = re.compile(r"linkedin\.com/jobs/view/(?:[^/?#]*-)?(\d+)/?(?:[?#]|$)")
+
+def _compile(pattern: str) -> Optional[re.Pattern]:
+    """Compile a case-insensitive card rule, or return None for an empty one"""
+    return re.compile(pattern, re.IGNORECASE) if pattern else None
 
 class BaseScraper(ABC):
     """Base class for job scrapers"""
     
+    # Identifies the scraper's checkpoints in the database
+    name = "base"
+    
+    def __init__(self):
+        """Initialize the scraper's checkpoints"""
+        # Newest posting id already seen for each keyword
+        self.checkpoints: Dict[str, int] = {}
+        # Links already stored in the database, if an index has been loaded
+        self.link_index: Optional[BloomFilter] = None
+        # Cheap card rules deciding which new listings get their detail page opened
+        self.fetch_descriptions = settings.SCRAPER_FETCH_DESCRIPTIONS
+        self.exclude_title = _compile(settings.PREFILTER_EXCLUDE_TITLE)
+        self.exclude_company = _compile(settings.PREFILTER_EXCLUDE_COMPANY)
+    
     @abstractmethod
     def setup(self):
         """Set up the scraper"""
@@ -15,7 +41,59 @@ class BaseScraper(ABC):
         """Scrape jobs based on keywords"""
         pass
     
+    def scrape_batches(self, keywords: List[str] = None) -> Iterator[Tuple[str, List[Job]]]:
+        """Scrape jobs keyword by keyword, yielding (keyword, jobs) as each one finishes
+        
+        Callers can store each batch before the next keyword is searched, so
+        an interrupted run loses at most one keyword's work. Keywords whose
+        search fails are not yielded. Scrapers that can stream override this;
+        the default searches one keyword at a time through scrape.
+        """
+        for keyword in keywords or settings.SEARCH_KEYWORDS:
+            yield keyword, self.scrape([keyword])
+    
     @abstractmethod
     def cleanup(self):
         """Clean up resources"""
-        pass
\ No newline at end of file
+        pass
+    
+    def set_checkpoints(self, checkpoints: Dict[str, int]):
+        """Set the newest posting id already seen for each keyword
+        
+        Scrapers that walk result pages newest first stop at these; the
+        checkpoints are advanced as newer postings are scraped.
+        """
+        self.checkpoints = dict(checkpoints)
+    
+    def set_link_index(self, link_index: BloomFilter):
+        """Set the index of links already stored in the database
+        
+        Listings whose link is in the index are dropped before any page is
+        opened for them. The index is shared, so the caller can keep adding
+        links as jobs are saved.
+        """
+        self.link_index = link_index
+    
+    def _canonical_link(self, link: str) -> str:
+        """Reduce a LinkedIn job link to its canonical form; other links are returned unchanged"""
+        match = JOB_VIEW_PATTERN.search(link or "")
+        return JOB_VIEW_URL.format(match.group(1)) if match else link
+    
+    def _is_known(self, link: str) -> bool:
+        """Check whether a listing's link is already stored"""
+        return self.link_index is not None and bool(link) and link in self.link_index
+    
+    def _wants_details(self, job: Job) -> bool:
+        """Check whether a new card is worth fetching the description for
+        
+        Cards matching the pre-filter's title or company rules are still
+        returned without a description, so they are stored and rejected by
+        the evaluator without a detail page ever being opened.
+        """
+        if not self.fetch_descriptions:
+            return False
+        if self.exclude_title and self.exclude_title.search(job.title or ""):
+            return False
+        if self.exclude_company and self.exclude_company.search(job.company or ""):
+            return False
+        return True
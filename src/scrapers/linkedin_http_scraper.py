@@ -0,0 +1,235 @@
+import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+import requests
+import soupsieve
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from src.config import settings
+from src.database.models import Job
+from src.scrapers.base import JOB_VIEW_URL, BaseScraper
+from src.utils.metrics import SEARCH_SECONDS
+from src.utils.rate_limiter import TokenBucket
+from src.utils.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36"
+# Status codes LinkedIn answers with when it wants a real browser
+BROWSER_REQUIRED_STATUSES = {401, 403, 429, 999}
+
+# Selectors are compiled once instead of being re-parsed for every page
+CARD_SELECTOR = soupsieve.compile("div.base-search-card")
+TITLE_SELECTOR = soupsieve.compile(".base-search-card__title")
+COMPANY_SELECTOR = soupsieve.compile(".base-search-card__subtitle")
+LOCATION_SELECTOR = soupsieve.compile(".job-search-card__location")
+DESCRIPTION_SELECTOR = soupsieve.compile(".show-more-less-html__markup")
+JOB_ID_PATTERN = re.compile(r"jobPosting:(\d+)")
+
+def _text(selector, element) -> str:
+    """Get the whitespace-normalized text of the first match of a selector"""
+    match = selector.select_one(element)
+    return " ".join(match.get_text(" ").split()) if match else ""
+
+def _posting_id(job: Job) -> int:
+    """Get the LinkedIn posting id from a job's canonical link"""
+    return int(job.link.rstrip("/").rsplit("/", 1)[-1])
+
+class LinkedInHttpScraper(BaseScraper):
+    """LinkedIn job scraper that fetches plain HTML instead of driving a browser
+    
+    Listings and job descriptions come from LinkedIn's public guest pages
+    over a pooled HTTP session. Keywords whose results cannot be read
+    without JavaScript are handed to the Selenium scraper.
+    
+    Results are walked newest first, and the walk for a keyword stops after
+    the first page holding only postings at or below its checkpoint, so a
+    run only pays for postings published since the last one. Promoted and
+    reposted cards carry old posting ids in between new ones, so cards are
+    kept or dropped by their link, not their id. Postings whose description
+    could not be fetched are left out and the checkpoint is kept below
+    them, so the next run retries them.
+    """
+    
+    name = "linkedin_http"
+    
+    def __init__(self, base_url: str = None, fallback: BaseScraper = None):
+        """Initialize the HTTP scraper"""
+        super().__init__()
+        self.base_url = (base_url or settings.LINKEDIN_GUEST_API_URL).rstrip("/")
+        self.workers = settings.SCRAPER_HTTP_WORKERS
+        self.max_pages = settings.SCRAPER_HTTP_MAX_PAGES
+        self.rate_limiter = TokenBucket(settings.SCRAPER_HTTP_REQUESTS_PER_MINUTE)
+        self.session = None
+        self.fallback = fallback
+    
+    def setup(self):
+        """Set up the pooled HTTP session"""
+        logger.info("Setting up LinkedIn HTTP scraper")
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.workers, pool_maxsize=self.workers, max_retries=2)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"User-Agent": USER_AGENT, "Accept-Language": "en-US,en;q=0.9"})
+        return True
+    
+    def scrape(self, keywords: List[str] = None) -> List[Job]:
+        """Scrape LinkedIn jobs based on keywords"""
+        return [job for _, jobs in self.scrape_batches(keywords) for job in jobs]
+    
+    def scrape_batches(self, keywords: List[str] = None) -> Iterator[Tuple[str, List[Job]]]:
+        """Scrape LinkedIn jobs keyword by keyword, yielding (keyword, jobs) as each one finishes"""
+        if not self.session:
+            self.setup()
+        
+        if not keywords:
+            keywords = settings.SEARCH_KEYWORDS
+        
+        for keyword in keywords:
+            started = time.perf_counter()
+            try:
+                jobs = self._search(keyword)
+                if jobs is None:
+                    logger.info(f"Keyword '{keyword}' needs a browser, falling back to Selenium")
+                    jobs = self._fallback_scraper().scrape([keyword])
+                else:
+                    # Only open detail pages of new postings that pass the card rules
+                    failed = self._fetch_descriptions([job for job in jobs if self._wants_details(job)])
+                    self._advance_checkpoint(keyword, jobs, failed)
+                    if failed:
+                        logger.warning(f"Leaving {len(failed)} jobs without a description for the next run")
+                        jobs = [job for job in jobs if job not in failed]
+            except Exception as e:
+                logger.error(f"Error searching for jobs with keyword '{keyword}': {e}")
+                continue
+            SEARCH_SECONDS.labels(self.name).observe(time.perf_counter() - started)
+            yield keyword, jobs
+    
+    @traced()
+    def _search(self, keyword: str) -> Optional[List[Job]]:
+        """Walk the result pages for a keyword, newest first, down to its checkpoint
+        
+        Returns the cards whose link is not stored yet, or None if the first
+        page cannot be read without a browser.
+        """
+        checkpoint = self.checkpoints.get(keyword, 0)
+        jobs = []
+        start = 0
+        for page in range(self.max_pages):
+            response = self._get(
+                f"{self.base_url}/seeMoreJobPostings/search",
+                {"keywords": keyword, "start": start, "sortBy": "DD"}
+            )
+            if response.status_code in BROWSER_REQUIRED_STATUSES:
+                if page == 0:
+                    return None
+                break
+            response.raise_for_status()
+            
+            cards = self._parse_cards(response.text)
+            if not cards:
+                # An empty first page is either no results or a JavaScript shell
+                if page == 0 and "<html" in response.text.lower():
+                    return None
+                break
+            start += len(cards)
+            
+            jobs.extend(card for card in cards if not self._is_known(card.link))
+            # A single old id may be a promoted card, so only a page of nothing else ends the walk
+            if all(_posting_id(card) <= checkpoint for card in cards):
+                logger.info(f"Reached known postings for keyword '{keyword}' on page {page + 1}")
+                break
+        
+        logger.info(f"Found {len(jobs)} new job listings for keyword: {keyword}")
+        return jobs
+    
+    @traced()
+    def _parse_cards(self, html: str) -> List[Job]:
+        """Parse the job cards of a search results page"""
+        soup = BeautifulSoup(html, "html.parser")
+        jobs = []
+        for card in CARD_SELECTOR.select(soup):
+            match = JOB_ID_PATTERN.search(card.get("data-entity-urn", ""))
+            if not match:
+                continue
+            jobs.append(Job(
+                title=_text(TITLE_SELECTOR, card) or "Unknown Title",
+                company=_text(COMPANY_SELECTOR, card) or "Unknown Company",
+                location=_text(LOCATION_SELECTOR, card) or "Unknown Location",
+                # Same canonical link the Selenium fallback gives its jobs
+                link=JOB_VIEW_URL.format(match.group(1)),
+                source="linkedin"
+            ))
+        return jobs
+    
+    def _advance_checkpoint(self, keyword: str, jobs: List[Job], failed: List[Job]):
+        """Move a keyword's checkpoint up to its newest scraped posting, but below any failed one"""
+        checkpoint = self.checkpoints.get(keyword, 0)
+        newest = max([checkpoint] + [_posting_id(job) for job in jobs])
+        if failed:
+            newest = min(newest, min(_posting_id(job) for job in failed) - 1)
+        if newest > checkpoint:
+            self.checkpoints[keyword] = newest
+    
+    def _fetch_descriptions(self, jobs: List[Job]) -> List[Job]:
+        """Fill in job descriptions from their detail pages in parallel
+        
+        Returns the jobs whose description could not be fetched.
+        """
+        failed = []
+        if not jobs:
+            return failed
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for job, description in zip(jobs, executor.map(self._fetch_description, jobs)):
+                if description is None:
+                    failed.append(job)
+                else:
+                    job.description = description
+        return failed
+    
+    @traced()
+    def _fetch_description(self, job: Job) -> Optional[str]:
+        """Fetch the description of a job from its detail page, or None if it could not be read"""
+        posting_id = _posting_id(job)
+        try:
+            response = self._get(f"{self.base_url}/jobPosting/{posting_id}")
+            response.raise_for_status()
+        except Exception as e:
+            logger.warning(f"Could not fetch description of job {posting_id}: {e}")
+            return None
+        description = _text(DESCRIPTION_SELECTOR, BeautifulSoup(response.text, "html.parser"))
+        if not description:
+            logger.warning(f"Detail page of job {posting_id} has no description")
+            return None
+        return description
+    
+    @traced()
+    def _get(self, url: str, params: dict = None) -> requests.Response:
+        """Send a rate-limited GET request over the pooled session"""
+        self.rate_limiter.acquire()
+        return self.session.get(url, params=params, timeout=settings.SCRAPER_HTTP_TIMEOUT_SECONDS)
+    
+    def _fallback_scraper(self) -> BaseScraper:
+        """Get the Selenium scraper, starting it on first use
+        
+        It is handed this scraper's link index and checkpoints on every call,
+        so stored listings are dropped before their detail page is opened.
+        The link index is shared, so links saved later in the run reach it too.
+        """
+        if self.fallback is None:
+            # Imported lazily so the HTTP backend runs without a browser stack
+            from src.scrapers.linkedin_scraper import LinkedInScraper
+            self.fallback = LinkedInScraper()
+        self.fallback.set_link_index(self.link_index)
+        self.fallback.set_checkpoints(self.checkpoints)
+        return self.fallback
+    
+    def cleanup(self):
+        """Clean up resources"""
+        if self.session:
+            self.session.close()
+            self.session = None
+        if self.fallback:
+            self.fallback.cleanup()
@@ -1,84 +1,291 @@
 import logging
+import threading
 import time
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty, Queue
+from typing import Iterator, List, Optional, Tuple
 from linkedin_scraper import JobSearch, actions
 from src.config import settings
 from src.database.models import Job
 from src.scrapers.base import BaseScraper
-from src.utils.webdriver import setup_chrome_driver
+from src.utils.metrics import SEARCH_SECONDS
+from src.utils.rate_limiter import TokenBucket
+from src.utils.tracing import span, traced
+from src.utils.webdriver import load_cookies, save_cookies, setup_chrome_driver
 
 logger = logging.getLogger(__name__)
 
+LINKEDIN_URL = "https://www.linkedin.com/"
+LINKEDIN_FEED_URL = "https://www.linkedin.com/feed/"
+# Pages LinkedIn redirects to when a session is missing or challenged
+LOGGED_OUT_URL_MARKERS = ("/login", "/checkpoint", "/authwall", "/uas/")
+
 class LinkedInScraper(BaseScraper):
-    """LinkedIn job scraper implementation"""
+    """LinkedIn job scraper implementation
+    
+    Each search returns one list of listings rather than pages to walk, so
+    there is nothing for a checkpoint to cut short: per-keyword checkpoints
+    are ignored here and only the HTTP scraper reads and advances them.
+    Stored listings are still dropped through the link index before any
+    detail page is opened.
+    """
+    
+    name = "linkedin"
     
     def __init__(self):
         """Initialize the LinkedIn scraper"""
+        super().__init__()
         self.driver = None
         self.job_search = None
+        self.sessions = settings.SCRAPER_SESSIONS
+        # Shared by every session, so the pool as a whole respects the limit
+        self.rate_limiter = TokenBucket(settings.SCRAPER_SEARCHES_PER_MINUTE)
+        self.detail_rate_limiter = TokenBucket(settings.SCRAPER_DETAIL_PAGES_PER_MINUTE)
     
+    @traced()
     def setup(self):
-        """Set up the LinkedIn scraper"""
+        """Set up the LinkedIn scraper, reusing a warm session if it is still valid"""
+        if self.driver and self.job_search:
+            if self._is_logged_in(self.driver):
+                logger.info("Reusing warm LinkedIn session")
+                return True
+            # The browser died or LinkedIn ended the session; start over
+            self.cleanup()
+        
         logger.info("Setting up LinkedIn scraper")
-        self.driver = setup_chrome_driver()
+        self.driver = setup_chrome_driver(user_data_dir=settings.CHROME_USER_DATA_DIR)
+        self.job_search = self._login(self.driver)
+        return self.job_search is not None
+    
+    def _login(self, driver) -> Optional[JobSearch]:
+        """Log a driver in to LinkedIn and return a job search bound to it
+        
+        A session restored from saved cookies or the Chrome profile is used
+        if it is still valid; otherwise a full login is done.
+        """
+        if self._restore_session(driver):
+            logger.info("Restored LinkedIn session")
+            return JobSearch(driver=driver, close_on_complete=False, scrape=False)
         
-        # Login to LinkedIn
         email = settings.LINKEDIN_USERNAME
         password = settings.LINKEDIN_PASSWORD
         
         if not email or not password:
             logger.error("LinkedIn credentials not provided in .env file")
-            return False
+            return None
             
         try:
             logger.info("Logging in to LinkedIn...")
-            actions.login(self.driver, email, password)
+            actions.login(driver, email, password)
             logger.info("Login successful")
+            self._save_session(driver)
             
             # Initialize job search
-            self.job_search = JobSearch(driver=self.driver, close_on_complete=False, scrape=False)
-            return True
+            return JobSearch(driver=driver, close_on_complete=False, scrape=False)
         except Exception as e:
             logger.error(f"Error setting up LinkedIn scraper: {e}")
+            return None
+    
+    def _restore_session(self, driver) -> bool:
+        """Restore a saved session into the driver and check that it is still valid"""
+        cookies_path = settings.LINKEDIN_COOKIES_PATH
+        if not cookies_path and not settings.CHROME_USER_DATA_DIR:
+            return False
+        
+        try:
+            if cookies_path:
+                load_cookies(driver, cookies_path, LINKEDIN_URL)
+            if not self._is_logged_in(driver):
+                return False
+            self._save_session(driver)
+            return True
+        except Exception as e:
+            logger.warning(f"Could not restore LinkedIn session: {e}")
+            return False
+    
+    def _save_session(self, driver):
+        """Save the driver's cookies so the next run can skip the login"""
+        if not settings.LINKEDIN_COOKIES_PATH:
+            return
+        try:
+            save_cookies(driver, settings.LINKEDIN_COOKIES_PATH)
+        except Exception as e:
+            logger.warning(f"Could not save LinkedIn session: {e}")
+    
+    def _is_logged_in(self, driver) -> bool:
+        """Check whether the driver has a live, logged-in LinkedIn session"""
+        try:
+            driver.get(LINKEDIN_FEED_URL)
+            current_url = driver.current_url
+        except Exception as e:
+            logger.warning(f"LinkedIn session check failed: {e}")
             return False
+        return not any(marker in current_url for marker in LOGGED_OUT_URL_MARKERS)
     
     def scrape(self, keywords: List[str] = None) -> List[Job]:
         """Scrape LinkedIn jobs based on keywords"""
+        return [job for _, jobs in self.scrape_batches(keywords) for job in jobs]
+    
+    def scrape_batches(self, keywords: List[str] = None) -> Iterator[Tuple[str, List[Job]]]:
+        """Scrape LinkedIn jobs keyword by keyword, yielding (keyword, jobs) as each one finishes"""
         if not self.driver or not self.job_search:
             if not self.setup():
-                return []
+                return
         
         if not keywords:
             keywords = settings.SEARCH_KEYWORDS
         
-        all_jobs = []
+        if self.sessions > 1 and len(keywords) > 1:
+            yield from self._scrape_parallel(keywords)
+            return
+        
         for keyword in keywords:
             try:
-                logger.info(f"Searching for jobs with keyword: {keyword}")
-                job_listings = self.job_search.search(keyword)
-                logger.info(f"Found {len(job_listings)} job listings for keyword: {keyword}")
-                
-                for listing in job_listings:
-                    job = self._convert_to_job(listing)
-                    if job:
-                        all_jobs.append(job)
-                
-                # Add a delay between searches to avoid rate limiting
-                time.sleep(2)
+                jobs = self._search(self.job_search, keyword)
             except Exception as e:
                 logger.error(f"Error searching for jobs with keyword '{keyword}': {e}")
+                continue
+            yield keyword, jobs
+    
+    @traced()
+    def _search(self, job_search: JobSearch, keyword: str) -> List[Job]:
+        """Run one rate-limited search and convert its listings"""
+        # Wait for the shared rate limit to avoid LinkedIn throttling
+        self.rate_limiter.acquire()
+        
+        logger.info(f"Searching for jobs with keyword: {keyword}")
+        started = time.perf_counter()
+        with span("JobSearch.search"):
+            job_listings = job_search.search(keyword)
+        logger.info(f"Found {len(job_listings)} job listings for keyword: {keyword}")
         
-        return all_jobs
+        # Phase one: keep lightweight cards of listings that are not stored yet
+        cards = []
+        known = 0
+        for listing in job_listings:
+            # Drop stored listings before doing any work on them
+            if self._is_known(self._canonical_link(getattr(listing, 'linkedin_url', ""))):
+                known += 1
+                continue
+            job = self._convert_to_job(listing)
+            if job:
+                cards.append((listing, job))
+        if known:
+            logger.info(f"Skipped {known} known job listings for keyword: {keyword}")
+        
+        # Phase two: open detail pages only for cards worth evaluating; each
+        # session does this on its own driver, so concurrency is bounded by the pool.
+        # Jobs whose page could not be read are left out, so the next run retries them
+        jobs = []
+        for listing, job in cards:
+            if not job.description and self._wants_details(job):
+                job.description = self._fetch_description(listing)
+                if job.description is None:
+                    continue
+            jobs.append(job)
+        if len(jobs) < len(cards):
+            logger.warning(f"Leaving {len(cards) - len(jobs)} jobs without a description for the next run")
+        SEARCH_SECONDS.labels(self.name).observe(time.perf_counter() - started)
+        return jobs
+    
+    @traced()
+    def _fetch_description(self, job_listing) -> Optional[str]:
+        """Open a listing's detail page and return its description, or None if it could not be read"""
+        self.detail_rate_limiter.acquire()
+        link = getattr(job_listing, 'linkedin_url', 'job')
+        try:
+            job_listing.scrape(close_on_complete=False)
+        except Exception as e:
+            logger.warning(f"Could not fetch description of {link}: {e}")
+            return None
+        description = (getattr(job_listing, 'job_description', None) or "").strip()
+        if not description:
+            logger.warning(f"Detail page of {link} has no description")
+            return None
+        return description
+    
+    def _scrape_parallel(self, keywords: List[str]) -> Iterator[Tuple[str, List[Job]]]:
+        """Scrape keywords with a pool of logged-in browser sessions
+        
+        The existing session and up to SCRAPER_SESSIONS - 1 extra ones pull
+        keywords from a shared queue. Each keyword's jobs are yielded as soon
+        as its search finishes; jobs found by several keywords are yielded
+        once. Closing the generator early lets the sessions finish their
+        current keyword and stop.
+        """
+        queue = Queue()
+        for keyword in keywords:
+            queue.put(keyword)
+        results = Queue()
+        
+        def work(job_search: JobSearch):
+            while True:
+                try:
+                    keyword = queue.get_nowait()
+                except Empty:
+                    return
+                try:
+                    jobs = self._search(job_search, keyword)
+                except Exception as e:
+                    logger.error(f"Error searching for jobs with keyword '{keyword}': {e}")
+                    continue
+                results.put((keyword, jobs))
+        
+        def extra_session():
+            driver = setup_chrome_driver()
+            try:
+                job_search = self._login(driver)
+                if job_search is not None:
+                    work(job_search)
+            finally:
+                driver.quit()
+        
+        session_count = min(self.sessions, len(keywords))
+        logger.info(f"Scraping {len(keywords)} keywords with {session_count} browser sessions")
+        executor = ThreadPoolExecutor(max_workers=session_count)
+        futures = [executor.submit(work, self.job_search)]
+        futures += [executor.submit(extra_session) for _ in range(session_count - 1)]
+        
+        seen_links = set()
+        try:
+            while True:
+                try:
+                    keyword, jobs = results.get(timeout=0.1)
+                except Empty:
+                    if all(future.done() for future in futures) and results.empty():
+                        break
+                    continue
+                fresh = [job for job in jobs if (job.link or id(job)) not in seen_links]
+                seen_links.update(job.link or id(job) for job in fresh)
+                yield keyword, fresh
+        finally:
+            # Keywords nobody has picked up yet are dropped if the caller stops early
+            while not queue.empty():
+                try:
+                    queue.get_nowait()
+                except Empty:
+                    break
+            executor.shutdown(wait=True)
+            for future in futures:
+                if future.exception():
+                    logger.error(f"Error in scraper session: {future.exception()}")
     
+    @traced()
     def _convert_to_job(self, job_listing) -> Optional[Job]:
         """Convert a LinkedIn job listing to a Job object"""
         try:
             return Job(
-                title=job_listing.title if hasattr(job_listing, 'title') else "Unknown Title",
+                title=job_listing.title if hasattr(job_listing, 'title') else (
+                    getattr(job_listing, 'job_title', None) or "Unknown Title"
+                ),
                 company=job_listing.company if hasattr(job_listing, 'company') else "Unknown Company",
                 location=job_listing.location if hasattr(job_listing, 'location') else "Unknown Location",
-                description=job_listing.description if hasattr(job_listing, 'description') else "",
-                link=job_listing.linkedin_url if hasattr(job_listing, 'linkedin_url') else "",
+                # Search cards carry no description until their detail page is scraped
+                description=job_listing.description if hasattr(job_listing, 'description') else (
+                    getattr(job_listing, 'job_description', None) or ""
+                ),
+                # Tracking parameters are dropped, so the link matches the HTTP scraper's
+                link=self._canonical_link(job_listing.linkedin_url) if hasattr(job_listing, 'linkedin_url') else "",
                 source="linkedin"
             )
         except Exception as e:
@@ -91,4 +298,4 @@ class LinkedInScraper(BaseScraper):
             logger.info("Closing browser")
             self.driver.quit()
             self.driver = None
-            self.job_search = None
\ No newline at end of file
+            self.job_search = None
@@ -0,0 +1,41 @@
+import hashlib
+import math
+
+class BloomFilter:
+    """Compact probabilistic set of strings
+    
+    Membership tests never give false negatives; false positives happen at
+    about error_rate once capacity items have been added.
+    """
+    
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """Size the filter for capacity items at the given false positive rate"""
+        capacity = max(1, capacity)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.hash_count = max(1, int(round(self.size / capacity * math.log(2))))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+    
+    def _positions(self, item: str):
+        """Yield the bit positions of an item using double hashing"""
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+    
+    def add(self, item: str):
+        """Add an item to the filter"""
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+    
+    def __contains__(self, item: str) -> bool:
+        """Check whether an item may have been added"""
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+    
+    def __len__(self) -> int:
+        """Number of items added"""
+        return self.count
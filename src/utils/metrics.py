@@ -0,0 +1,36 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+# Seconds; from a fast cached lookup up to a slow LLM call
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5)
+TOKEN_BUCKETS = (50, 100, 250, 500, 1000, 2000, 4000, 8000, 16000, 32000)
+
+# Scraper
+JOBS_SCRAPED = Counter("jobflow_jobs_scraped_total", "Job listings returned by the scrapers")
+JOBS_DUPLICATE = Counter("jobflow_jobs_duplicate_total", "Scraped jobs whose link was already stored")
+JOBS_SAVED = Counter("jobflow_jobs_saved_total", "Scraped jobs stored for the first time")
+SEARCH_SECONDS = Histogram(
+    "jobflow_search_seconds", "Time to search one keyword and build its jobs", ("source",), buckets=DEFAULT_BUCKETS
+)
+
+# Evaluator
+JOBS_EVALUATED = Counter("jobflow_jobs_evaluated_total", "Jobs that received a verdict")
+JOBS_RELEVANT = Counter("jobflow_jobs_relevant_total", "Jobs judged relevant")
+JOBS_REJECTED = Counter("jobflow_jobs_rejected_total", "Jobs judged not relevant")
+JOBS_ERRORED = Counter(
+    "jobflow_jobs_errored_total", "Evaluations that failed, including ones returned to the queue"
+)
+LLM_REQUEST_SECONDS = Histogram(
+    "jobflow_llm_request_seconds", "OpenRouter call latency, retries included", buckets=DEFAULT_BUCKETS
+)
+LLM_PROMPT_TOKENS = Histogram("jobflow_llm_prompt_tokens", "Prompt tokens per OpenRouter call", buckets=TOKEN_BUCKETS)
+LLM_RESPONSE_TOKENS = Histogram(
+    "jobflow_llm_response_tokens", "Completion tokens per OpenRouter call", buckets=TOKEN_BUCKETS
+)
+# NaN while the database cannot be read
+EVALUATION_BACKLOG = Gauge("jobflow_evaluation_backlog", "Stored jobs still waiting for a verdict")
+
+# Database
+DB_QUERY_SECONDS = Histogram(
+    "jobflow_db_query_seconds", "Database statement time by statement kind", ("statement",), buckets=DB_BUCKETS
+)
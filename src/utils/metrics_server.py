@@ -0,0 +1,33 @@
+import logging
+import threading
+from typing import Optional
+import uvicorn
+from fastapi import FastAPI, Response
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+def create_app(registry: CollectorRegistry = REGISTRY) -> FastAPI:
+    """Create the app serving the registry's metrics at /metrics"""
+    app = FastAPI(title="job-flow metrics", docs_url=None, redoc_url=None, openapi_url=None)
+    
+    # A plain route rather than a mounted app, which would answer /metrics with a redirect
+    @app.get("/metrics")
+    def metrics() -> Response:
+        return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+    
+    return app
+
+def start_metrics_server(host: str = None, port: int = None) -> Optional[threading.Thread]:
+    """Serve /metrics from a background thread when METRICS_ENABLED is set"""
+    if not settings.METRICS_ENABLED:
+        return None
+    
+    host = host or settings.METRICS_HOST
+    port = port or settings.METRICS_PORT
+    server = uvicorn.Server(uvicorn.Config(create_app(), host=host, port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, name="metrics-server", daemon=True)
+    thread.start()
+    logger.info(f"Serving metrics on http://{host}:{port}/metrics")
+    return thread
@@ -0,0 +1,64 @@
+import hashlib
+import random
+import re
+from typing import List, Optional, Set
+
+# Mersenne prime used as the modulus of the permutation hashes
+_PRIME = (1 << 61) - 1
+_WORD = re.compile(r"\w+")
+
+def shingles(text: str, size: int = 5) -> Set[str]:
+    """Split text into the set of its overlapping word n-grams"""
+    words = _WORD.findall((text or "").lower())
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+def _hash64(value: str) -> int:
+    """Hash a string to a stable 64-bit integer"""
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+class MinHasher:
+    """Computes MinHash signatures and LSH band keys for text
+    
+    Signatures estimate the Jaccard similarity of two texts' shingle sets.
+    Splitting a signature into bands of rows and hashing each band gives
+    bucket keys: texts that share any bucket are near-duplicate candidates,
+    so a lookup only touches a few index entries instead of every row.
+    """
+    
+    def __init__(self, num_perm: int = 128, bands: int = 16, seed: int = 1):
+        """Initialize the hasher; num_perm must be divisible by bands"""
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = random.Random(seed)
+        self.permutations = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)
+        ]
+    
+    def signature(self, text: str) -> Optional[List[int]]:
+        """Compute the MinHash signature of a text, or None if it has no words"""
+        hashes = [_hash64(shingle) for shingle in shingles(text)]
+        if not hashes:
+            return None
+        return [min((a * h + b) % _PRIME for h in hashes) for a, b in self.permutations]
+    
+    def band_keys(self, signature: List[int]) -> List[int]:
+        """Hash each band of a signature to a signed 64-bit bucket key"""
+        keys = []
+        for band in range(self.bands):
+            rows = signature[band * self.rows:(band + 1) * self.rows]
+            digest = hashlib.blake2b(
+                b"".join(value.to_bytes(8, "big") for value in rows), digest_size=8
+            ).digest()
+            keys.append(int.from_bytes(digest, "big", signed=True))
+        return keys
+
+def estimate_similarity(signature_a: List[int], signature_b: List[int]) -> float:
+    """Estimate the Jaccard similarity of two texts from their signatures"""
+    if not signature_a or len(signature_a) != len(signature_b):
+        return 0.0
+    return sum(a == b for a, b in zip(signature_a, signature_b)) / len(signature_a)
@@ -0,0 +1,123 @@
+import asyncio
+import threading
+import time
+from typing import Optional
+from src.utils.tracing import traced
+
+class TokenBucket:
+    """Token bucket limiting how many operations may start per minute
+    
+    The bucket is thread-safe and can be awaited from asyncio code, so a single
+    instance can be shared by worker threads and coroutines alike.
+    """
+    
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        """Initialize the bucket; a non-positive rate disables limiting"""
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else 1.0
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it"""
+        if self.rate <= 0:
+            return 0.0
+        
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            
+            # Tokens may go negative; the debt is paid off by waiting
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+    
+    @traced()
+    def acquire(self):
+        """Block the current thread until a token is available"""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+    
+    @traced()
+    async def acquire_async(self):
+        """Wait in the event loop until a token is available"""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+class AdaptiveConcurrency:
+    """Concurrency limit that adapts to a provider's throttling, AIMD style
+    
+    Every success raises the limit by one over a full window of requests,
+    and every throttled response halves it, so the number of requests in
+    flight settles just under what the provider accepts. A throttled
+    response can also pause all requests until its Retry-After has passed.
+    Like TokenBucket it can be shared by threads and coroutines.
+    """
+    
+    # How often waiting callers check for a free slot
+    POLL_SECONDS = 0.05
+    
+    def __init__(self, max_limit: int, min_limit: int = 1):
+        """Initialize the limiter at its maximum"""
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.limit = float(self.max_limit)
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+    
+    def _try_acquire(self) -> float:
+        """Take a slot, or return how many seconds to wait before trying again"""
+        with self._lock:
+            now = time.monotonic()
+            if now < self.paused_until:
+                return self.paused_until - now
+            if self.in_flight < int(self.limit):
+                self.in_flight += 1
+                return 0.0
+            return self.POLL_SECONDS
+    
+    @traced()
+    def acquire(self):
+        """Block the current thread until a slot is free"""
+        while True:
+            delay = self._try_acquire()
+            if delay <= 0:
+                return
+            time.sleep(delay)
+    
+    @traced()
+    async def acquire_async(self):
+        """Wait in the event loop until a slot is free"""
+        while True:
+            delay = self._try_acquire()
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+    
+    def release(self):
+        """Give back a slot taken by acquire"""
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+    
+    def on_success(self):
+        """Additively raise the limit after a request the provider accepted"""
+        with self._lock:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+    
+    def on_throttle(self, retry_after: Optional[float] = None):
+        """Halve the limit after a throttled request, pausing for retry_after seconds"""
+        with self._lock:
+            self.limit = max(self.min_limit, self.limit / 2)
+            if retry_after:
+                self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+    
+    def pause(self, seconds: float):
+        """Hold back new requests for the given time, e.g. until a quota resets"""
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
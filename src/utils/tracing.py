@@ -0,0 +1,259 @@
+import atexit
+import cProfile
+import functools
+import inspect
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import nullcontext
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+MODES = ("spans", "sample", "cprofile")
+
+# Shared by every span() call while tracing is off, so disabled spans allocate nothing
+_NULL_SPAN = nullcontext()
+
+_current_span: ContextVar[Optional["_Span"]] = ContextVar("tracing_span", default=None)
+
+class SpanRecorder:
+    """Self time and call count of every span stack seen while recording"""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stacks: Dict[Tuple[str, ...], List[float]] = {}
+    
+    def record(self, stack: Tuple[str, ...], self_seconds: float):
+        """Add one finished span"""
+        with self.lock:
+            entry = self.stacks.get(stack)
+            if entry is None:
+                self.stacks[stack] = [1, self_seconds]
+            else:
+                entry[0] += 1
+                entry[1] += self_seconds
+    
+    def folded(self) -> List[str]:
+        """Stacks in the folded format flame graph tools read, weighted by self time in microseconds"""
+        with self.lock:
+            stacks = sorted(self.stacks.items())
+        return [f"{';'.join(stack)} {round(seconds * 1e6)}" for stack, (_, seconds) in stacks]
+
+class _Span:
+    """One timed block nested under whatever span is current in its context"""
+    
+    __slots__ = ("recorder", "name", "stack", "started", "child_seconds", "parent", "token")
+    
+    def __init__(self, recorder: SpanRecorder, name: str):
+        self.recorder = recorder
+        self.name = name
+    
+    def __enter__(self):
+        self.parent = _current_span.get()
+        self.stack = self.parent.stack + (self.name,) if self.parent else (self.name,)
+        self.child_seconds = 0.0
+        self.token = _current_span.set(self)
+        self.started = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        elapsed = time.perf_counter() - self.started
+        _current_span.reset(self.token)
+        if self.parent is not None:
+            self.parent.child_seconds += elapsed
+        # Children running concurrently can add up to more than the parent's own time
+        self.recorder.record(self.stack, max(elapsed - self.child_seconds, 0.0))
+        return False
+
+class Sampler:
+    """Background thread sampling the Python stack of every other thread"""
+    
+    def __init__(self, interval_ms: float):
+        """Initialize the sampler"""
+        self.interval = interval_ms / 1000
+        self.samples = Counter()
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="tracing-sampler", daemon=True)
+    
+    def start(self):
+        """Start sampling"""
+        self.thread.start()
+    
+    def stop(self):
+        """Stop sampling and wait for the thread to exit"""
+        self.stop_event.set()
+        self.thread.join()
+    
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self.stop_event.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_id:
+                    self.samples[self._stack(frame)] += 1
+    
+    @staticmethod
+    def _stack(frame) -> Tuple[str, ...]:
+        frames = []
+        while frame is not None:
+            # Leave out the @traced wrappers, so stacks read the same with spans on or off
+            if frame.f_globals.get("__name__") == __name__:
+                frame = frame.f_back
+                continue
+            code = frame.f_code
+            # co_qualname only exists from Python 3.11
+            frames.append(f"{frame.f_globals.get('__name__', '?')}.{getattr(code, 'co_qualname', code.co_name)}")
+            frame = frame.f_back
+        return tuple(reversed(frames))
+    
+    def folded(self) -> List[str]:
+        """Stacks in the folded format flame graph tools read, weighted by sample count"""
+        return [f"{';'.join(stack)} {count}" for stack, count in sorted(self.samples.items())]
+
+class Tracer:
+    """Process-wide switch between no tracing and one of the capture modes
+    
+    spans records the span() and @traced blocks, sample takes periodic stack
+    samples of every thread and cprofile runs cProfile on the thread that
+    switched it on. Stopping writes what was captured to a file in
+    TRACING_OUTPUT_DIR: folded stacks for spans and sample, which flame graph
+    tools such as flamegraph.pl or speedscope read directly, and pstats for
+    cprofile.
+    """
+    
+    def __init__(self):
+        """Initialize a stopped tracer"""
+        # Reentrant, since the SIGUSR1 handler may interrupt the main thread inside start() or stop()
+        self.lock = threading.RLock()
+        self.mode: Optional[str] = None
+        self.name = "jobflow"
+        self.recorder: Optional[SpanRecorder] = None
+        self.sampler: Optional[Sampler] = None
+        self.profile: Optional[cProfile.Profile] = None
+    
+    def start(self, mode: str = None) -> bool:
+        """Start capturing in mode, defaulting to TRACING_MODE"""
+        mode = mode or settings.TRACING_MODE
+        if mode not in MODES:
+            raise ValueError(f"Unknown tracing mode {mode!r}, expected one of {MODES}")
+        with self.lock:
+            if self.mode is not None:
+                return False
+            if mode == "sample":
+                self.sampler = Sampler(settings.TRACING_SAMPLE_INTERVAL_MS)
+                self.sampler.start()
+            elif mode == "cprofile":
+                self.profile = cProfile.Profile()
+                self.profile.enable()
+            else:
+                self.recorder = SpanRecorder()
+            self.mode = mode
+        logger.info(f"Tracing started in {mode} mode")
+        return True
+    
+    def stop(self) -> Optional[str]:
+        """Stop capturing and write the profile, returning its path"""
+        with self.lock:
+            mode, self.mode = self.mode, None
+            recorder, self.recorder = self.recorder, None
+            sampler, self.sampler = self.sampler, None
+            profile, self.profile = self.profile, None
+        if mode is None:
+            return None
+        if profile is not None:
+            profile.disable()
+        if sampler is not None:
+            sampler.stop()
+        
+        os.makedirs(settings.TRACING_OUTPUT_DIR, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        extension = "pstats" if mode == "cprofile" else "folded"
+        path = os.path.join(settings.TRACING_OUTPUT_DIR, f"{self.name}-{mode}-{os.getpid()}-{stamp}.{extension}")
+        try:
+            if profile is not None:
+                profile.dump_stats(path)
+            else:
+                lines = recorder.folded() if recorder is not None else sampler.folded()
+                with open(path, "w") as f:
+                    f.write("\n".join(lines) + "\n")
+        except OSError as e:
+            logger.error(f"Error writing {mode} profile: {e}")
+            return None
+        logger.info(f"Tracing stopped, {mode} profile written to {path}")
+        return path
+    
+    def toggle(self) -> Optional[str]:
+        """Stop if running, start otherwise; returns the profile path when stopping"""
+        if self.mode is None:
+            self.start()
+            return None
+        return self.stop()
+
+TRACER = Tracer()
+
+def span(name: str):
+    """Context manager timing the enclosed block as a child of the current span"""
+    recorder = TRACER.recorder
+    if recorder is None:
+        return _NULL_SPAN
+    return _Span(recorder, name)
+
+def traced(name: str = None):
+    """Decorator timing every call of a function or coroutine function as a span
+    
+    The span is named after the function's qualified name unless name is
+    given. Generator functions are returned undecorated, since their body
+    runs interleaved with whoever consumes them.
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+        if inspect.isgeneratorfunction(func) or inspect.isasyncgenfunction(func):
+            return func
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                recorder = TRACER.recorder
+                if recorder is None:
+                    return await func(*args, **kwargs)
+                with _Span(recorder, span_name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            recorder = TRACER.recorder
+            if recorder is None:
+                return func(*args, **kwargs)
+            with _Span(recorder, span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def traced_methods(cls):
+    """Class decorator applying @traced to every public method the class defines"""
+    for attribute, value in list(vars(cls).items()):
+        if not attribute.startswith("_") and inspect.isfunction(value):
+            setattr(cls, attribute, traced()(value))
+    return cls
+
+def start_tracing(name: str):
+    """Set up tracing for a long-running process
+    
+    Starts capturing when TRACING_ENABLED is set, lets SIGUSR1 switch
+    capturing on and off without a restart, and writes whatever is being
+    captured when the process exits.
+    """
+    TRACER.name = name
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, lambda signum, frame: TRACER.toggle())
+    if settings.TRACING_ENABLED:
+        TRACER.start()
+    atexit.register(TRACER.stop)
@@ -1,8 +1,11 @@
+import json
+import os
+import tempfile
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from src.config import settings
 
-def setup_chrome_driver():
+def setup_chrome_driver(user_data_dir: str = None):
     """Set up Chrome driver with appropriate options"""
     chrome_options = Options()
     
@@ -18,4 +21,39 @@ def setup_chrome_driver():
     # Set user agent to avoid detection
     chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36")
     
-    return webdriver.Chrome(options=chrome_options)
\ No newline at end of file
+    # Keep cookies and local storage between runs in a persistent profile
+    if user_data_dir:
+        chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+    
+    return webdriver.Chrome(options=chrome_options)
+
+def save_cookies(driver, path: str):
+    """Save the driver's cookies to a JSON file"""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    # Write to a temporary file first so concurrent sessions never read half a file
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(driver.get_cookies(), f)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.remove(tmp_path)
+        raise
+
+def load_cookies(driver, path: str, url: str) -> bool:
+    """Load cookies saved by save_cookies into the driver for the given site
+    
+    Returns False if there is no cookie file.
+    """
+    if not os.path.exists(path):
+        return False
+    
+    with open(path) as f:
+        cookies = json.load(f)
+    
+    # Cookies can only be set for the domain the driver is on
+    driver.get(url)
+    for cookie in cookies:
+        driver.add_cookie(cookie)
+    return True
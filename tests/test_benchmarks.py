@@ -0,0 +1,50 @@
+import json
+from benchmarks.metrics import compare, percentile
+from benchmarks.run import main
+
+def test_percentile_uses_nearest_rank():
+    """Test that percentiles pick an observed sample"""
+    values = [float(value) for value in range(1, 101)]
+    
+    assert percentile(values, 0.50) == 50
+    assert percentile(values, 0.99) == 99
+    assert percentile([], 0.95) == 0
+
+def test_benchmark_writes_comparable_results(tmp_path):
+    """Test that a small offline run evaluates every scraped job and reports every metric"""
+    output = tmp_path / "results.json"
+    
+    exit_code = main([
+        "--keywords", "2", "--listings", "10", "--latency-ms", "0", "--jitter-ms", "0",
+        "--db-latency-ms", "0", "--concurrency", "2", "--output", str(output)
+    ])
+    
+    results = json.loads(output.read_text())
+    assert exit_code == 0
+    assert results["stages"]["scrape"]["jobs"] == 20
+    assert results["stages"]["evaluate"]["jobs"] == 20
+    assert results["llm"]["unevaluated"] == 0
+    assert {"scrape.search", "llm.call", "db.save_jobs_bulk", "db.claim_jobs"} <= set(results["latency"])
+    assert results["db"]["round_trips_per_job"]["evaluate"] > 0
+    assert results["peak_rss_mb"] > 0
+    # A run compared with itself shows no regressions
+    assert compare(results, results, tolerance=0.1) == []
+
+def test_compare_flags_slower_runs():
+    """Test that lower throughput and more round trips per job are reported as regressions"""
+    baseline = {
+        "stages": {"evaluate": {"jobs_per_second": 100.0}},
+        "latency": {"llm.call": {"p95_ms": 50.0}},
+        "db": {"round_trips_per_job": {"evaluate": 2.0}},
+        "peak_rss_mb": 60.0,
+    }
+    current = {
+        "stages": {"evaluate": {"jobs_per_second": 80.0}},
+        "latency": {"llm.call": {"p95_ms": 52.0}},
+        "db": {"round_trips_per_job": {"evaluate": 3.0}},
+        "peak_rss_mb": 61.0,
+    }
+    
+    regressions = compare(current, baseline, tolerance=0.1)
+    
+    assert [regression.split(":")[0] for regression in regressions] == ["evaluate jobs/s", "evaluate db round trips/job"]
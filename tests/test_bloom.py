@@ -0,0 +1,26 @@
+from src.utils.bloom import BloomFilter
+
+def test_bloom_filter_has_no_false_negatives():
+    """Test that every added link is reported as known"""
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    links = [f"https://www.linkedin.com/jobs/view/{i}/" for i in range(1000)]
+    
+    for link in links:
+        bloom.add(link)
+    
+    assert all(link in bloom for link in links)
+    assert len(bloom) == 1000
+
+def test_bloom_filter_false_positive_rate_is_bounded():
+    """Test that unknown links are rarely reported as known"""
+    bloom = BloomFilter(capacity=5000, error_rate=0.01)
+    for i in range(5000):
+        bloom.add(f"https://www.linkedin.com/jobs/view/{i}/")
+    
+    false_positives = sum(f"https://www.linkedin.com/jobs/view/{i}/" in bloom for i in range(5000, 15000))
+    
+    assert false_positives / 10000 < 0.02
+
+def test_bloom_filter_size_follows_error_rate():
+    """Test that a lower error rate uses more bits"""
+    assert BloomFilter(10000, 0.001).size > BloomFilter(10000, 0.01).size
@@ -0,0 +1,73 @@
+import json
+from pathlib import Path
+import pytest
+from unittest.mock import patch
+from src.database.models import Job
+from src.evaluators.compaction import compact_description, estimate_tokens, token_budget
+from src.evaluators.openrouter import OpenRouterEvaluator
+from src.evaluators.prefilter import cosine_similarity, hashed_bag_of_words
+
+FIXTURES = Path(__file__).parent / "fixtures" / "descriptions"
+EXPECTED = json.loads((FIXTURES / "expected.json").read_text())
+
+PROFILE = "Python, Data Science 5+ years in software development Remote work, Machine learning projects"
+
+@pytest.mark.parametrize("name", sorted(EXPECTED))
+def test_compaction_keeps_what_matters(name):
+    """Test that every fixture keeps its job content and loses its boilerplate"""
+    description = (FIXTURES / name).read_text()
+    
+    compacted = compact_description(description)
+    
+    for phrase in EXPECTED[name]["keep"]:
+        assert phrase in compacted
+    for phrase in EXPECTED[name]["drop"]:
+        assert phrase not in compacted
+    assert estimate_tokens(compacted) < estimate_tokens(description)
+
+@pytest.mark.parametrize("name", ["python_backend.html", "data_engineer.txt"])
+def test_compaction_does_not_weaken_profile_match(name):
+    """Test that relevant fixtures look at least as similar to the profile after compaction"""
+    description = (FIXTURES / name).read_text()
+    profile = hashed_bag_of_words(PROFILE)
+    
+    before = cosine_similarity(hashed_bag_of_words(description), profile)
+    after = cosine_similarity(hashed_bag_of_words(compact_description(description)), profile)
+    
+    assert after >= before
+
+def test_compaction_drops_repeated_sections():
+    """Test that a section repeated in the posting is sent once"""
+    compacted = compact_description((FIXTURES / "data_engineer.txt").read_text())
+    
+    assert compacted.count("Globex builds logistics software") == 1
+
+def test_truncates_to_token_budget():
+    """Test that long descriptions are cut at the budget with a marker"""
+    description = "\n".join(f"Requirement number {i} for this role." for i in range(200))
+    
+    compacted = compact_description(description, budget=100)
+    
+    assert compacted.endswith("[truncated]")
+    assert estimate_tokens(compacted) <= 100 + estimate_tokens("[truncated]")
+    assert compacted.startswith("Requirement number 0 for this role.")
+
+def test_token_budget_per_model():
+    """Test that per-model budgets override the default"""
+    with patch('src.evaluators.compaction.settings') as mock_settings:
+        mock_settings.LLM_TOKEN_BUDGETS = "openai/gpt-4o-mini=800, google/gemini-1.5-pro=3000"
+        mock_settings.LLM_DESCRIPTION_TOKEN_BUDGET = 1500
+        
+        assert token_budget("google/gemini-1.5-pro") == 3000
+        assert token_budget("anthropic/claude-3-haiku") == 1500
+
+def test_prompt_uses_compacted_description():
+    """Test that the evaluation prompt carries the compacted description"""
+    evaluator = OpenRouterEvaluator()
+    description = (FIXTURES / "python_backend.html").read_text()
+    
+    prompt = evaluator._create_evaluation_prompt(Job(id=1, title="Python Developer", description=description))
+    
+    assert "FastAPI and PostgreSQL" in prompt
+    assert "equal opportunity" not in prompt
+    assert "<li>" not in prompt
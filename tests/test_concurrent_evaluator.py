@@ -0,0 +1,125 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock
+import pytest
+from src.database.models import Job
+from src.evaluators.base import BaseEvaluator, EvaluatorUnavailableError, StageEvaluator
+from src.evaluators.concurrent import ConcurrentEvaluator
+from src.utils.rate_limiter import TokenBucket
+
+class SlowEvaluator(BaseEvaluator):
+    """Evaluator that records how many evaluations run at once"""
+    
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+    
+    def setup(self):
+        return True
+    
+    def evaluate(self, job: Job) -> dict:
+        return {"is_relevant": True, "score": 90, "summary": job.title}
+    
+    async def evaluate_async(self, job: Job) -> dict:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return self.evaluate(job)
+    
+    def cleanup(self):
+        pass
+
+def test_concurrent_evaluator_bounds_parallelism():
+    """Test that no more than the configured number of evaluations run at once"""
+    evaluator = SlowEvaluator()
+    jobs = [Job(id=i, title=f"Job {i}") for i in range(10)]
+    results = {}
+    
+    concurrent = ConcurrentEvaluator(evaluator, concurrency=3, requests_per_minute=0)
+    evaluated = asyncio.run(concurrent.run(jobs, lambda job, evaluation: results.update({job.id: evaluation})))
+    
+    assert evaluated == 10
+    assert evaluator.max_running == 3
+    assert results[4]["summary"] == "Job 4"
+
+def test_concurrent_evaluator_continues_after_save_error():
+    """Test that a failing result callback does not stop the other jobs"""
+    evaluator = SlowEvaluator()
+    jobs = [Job(id=i) for i in range(4)]
+    saved = []
+    
+    def on_result(job, evaluation):
+        if job.id == 1:
+            raise Exception("database unavailable")
+        saved.append(job.id)
+    
+    concurrent = ConcurrentEvaluator(evaluator, concurrency=2, requests_per_minute=0)
+    evaluated = asyncio.run(concurrent.run(jobs, on_result))
+    
+    assert evaluated == 3
+    assert sorted(saved) == [0, 2, 3]
+
+def test_concurrent_evaluator_stops_when_evaluator_is_unavailable():
+    """Test that an unusable evaluator ends the run instead of failing job after job"""
+    evaluator = SlowEvaluator()
+    evaluator.evaluate = lambda job: (_ for _ in ()).throw(EvaluatorUnavailableError("HTTP 402"))
+    jobs = [Job(id=i) for i in range(20)]
+    saved = []
+    
+    concurrent = ConcurrentEvaluator(evaluator, concurrency=2, requests_per_minute=0)
+    with pytest.raises(EvaluatorUnavailableError):
+        asyncio.run(concurrent.run(jobs, lambda job, evaluation: saved.append(job.id)))
+    
+    assert saved == []
+
+def test_base_evaluator_runs_sync_evaluate_in_thread():
+    """Test that evaluators without an async client still work asynchronously"""
+    class SyncOnlyEvaluator(SlowEvaluator):
+        evaluate_async = BaseEvaluator.evaluate_async
+    
+    evaluation = asyncio.run(SyncOnlyEvaluator().evaluate_async(Job(title="Developer")))
+    
+    assert evaluation["summary"] == "Developer"
+
+def test_token_bucket_spaces_out_requests():
+    """Test that the token bucket makes callers wait once it is empty"""
+    bucket = TokenBucket(rate_per_minute=60)
+    
+    assert bucket._reserve() == 0.0
+    assert 0.9 < bucket._reserve() <= 1.0
+    assert 1.9 < bucket._reserve() <= 2.0
+
+def test_token_bucket_disabled():
+    """Test that a non-positive rate never waits"""
+    bucket = TokenBucket(rate_per_minute=0)
+    
+    assert all(bucket._reserve() == 0.0 for _ in range(5))
+
+def test_stage_lookups_run_off_the_event_loop():
+    """Test that a stage's database lookups and stores do not block the event loop"""
+    stage_threads = set()
+    
+    class RecordingStage(StageEvaluator):
+        def _lookup(self, job):
+            stage_threads.add(threading.get_ident())
+            return None
+        
+        def _store(self, job, evaluation):
+            stage_threads.add(threading.get_ident())
+    
+    inner = MagicMock()
+    inner.evaluate_async = AsyncMock(return_value={"is_relevant": True})
+    inner.evaluate_batch_async = AsyncMock(return_value=[{"is_relevant": True}, {"is_relevant": False}])
+    stage = RecordingStage(inner)
+    
+    async def evaluate():
+        loop_thread = threading.get_ident()
+        await stage.evaluate_async(Job(id=1, title="Developer"))
+        evaluations = await stage.evaluate_batch_async([Job(id=2), Job(id=3)])
+        return loop_thread, evaluations
+    
+    loop_thread, evaluations = asyncio.run(evaluate())
+    
+    assert evaluations == [{"is_relevant": True}, {"is_relevant": False}]
+    assert stage_threads and loop_thread not in stage_threads
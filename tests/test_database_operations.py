@@ -0,0 +1,296 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from src.database.operations import DatabaseOperations
+from src.database.models import Job
+
+@pytest.fixture
+def db():
+    """Create database operations with a mock connection"""
+    db = DatabaseOperations(host="localhost", database="test", user="test", password="test")
+    db.conn = MagicMock()
+    return db
+
+def make_job(link):
+    """Create a job with the given link"""
+    return Job(title="Developer", company="Tech Corp", location="Remote", link=link, source="linkedin")
+
+@patch('src.database.operations.execute_values')
+def test_save_jobs_bulk_counts_new_and_duplicate_jobs(mock_execute_values, db):
+    """Test that bulk saving reports new and duplicate jobs"""
+    jobs = [make_job("https://linkedin.com/jobs/1"), make_job("https://linkedin.com/jobs/2")]
+    # Only the second job is new to the database
+    mock_execute_values.return_value = [(42, "https://linkedin.com/jobs/2")]
+    
+    saved, duplicates = db.save_jobs_bulk(jobs)
+    
+    assert (saved, duplicates) == (1, 1)
+    assert jobs[0].id is None
+    assert jobs[1].id == 42
+    mock_execute_values.assert_called_once()
+    assert "ON CONFLICT (link) DO NOTHING" in mock_execute_values.call_args[0][1]
+    db.conn.commit.assert_called_once()
+
+@patch('src.database.operations.execute_values')
+def test_save_jobs_bulk_dedups_within_batch(mock_execute_values, db):
+    """Test that duplicate links inside one batch are sent only once"""
+    jobs = [make_job("https://linkedin.com/jobs/1"), make_job("https://linkedin.com/jobs/1")]
+    mock_execute_values.return_value = [(7, "https://linkedin.com/jobs/1")]
+    
+    saved, duplicates = db.save_jobs_bulk(jobs)
+    
+    assert len(mock_execute_values.call_args[0][2]) == 1
+    assert (saved, duplicates) == (1, 1)
+
+@patch('src.database.operations.execute_values')
+def test_save_jobs_bulk_rolls_back_on_error(mock_execute_values, db):
+    """Test that a failing batch is rolled back"""
+    mock_execute_values.side_effect = Exception("connection lost")
+    
+    result = db.save_jobs_bulk([make_job("https://linkedin.com/jobs/1")])
+    
+    assert result == (0, 0)
+    db.conn.rollback.assert_called_once()
+
+def test_save_jobs_bulk_empty_batch(db):
+    """Test that an empty batch does not touch the database"""
+    assert db.save_jobs_bulk([]) == (0, 0)
+    db.conn.cursor.assert_not_called()
+
+def test_claim_jobs_leases_unevaluated_jobs(db):
+    """Test that claiming skips locked rows and returns jobs in id order"""
+    cursor = db.conn.cursor.return_value
+    cursor.fetchall.return_value = [
+        (2, "Developer", "Tech Corp", "Remote", "", "https://linkedin.com/jobs/2", "linkedin", None),
+        (1, "Engineer", "Tech Corp", "Remote", "", "https://linkedin.com/jobs/1", "linkedin", None),
+    ]
+    
+    jobs = db.claim_jobs("worker-1", limit=10, lease_seconds=600)
+    
+    query, params = cursor.execute.call_args[0]
+    assert "FOR UPDATE SKIP LOCKED" in query
+    assert "claim_expires_at < NOW()" in query
+    assert params == ("worker-1", 600, 0, 10)
+    assert [job.id for job in jobs] == [1, 2]
+    db.conn.commit.assert_called_once()
+
+def test_claim_jobs_restricted_to_notified_ids(db):
+    """Test that claiming can be limited to the given job ids"""
+    cursor = db.conn.cursor.return_value
+    cursor.fetchall.return_value = []
+    
+    db.claim_jobs("worker-1", limit=10, lease_seconds=600, job_ids=[3, 4])
+    
+    query, params = cursor.execute.call_args[0]
+    assert "s.id = ANY(%s)" in query
+    assert params == ("worker-1", 600, 0, [3, 4], 10)
+
+@patch('src.database.operations.select.select')
+def test_wait_for_notifications_drains_queued_payloads(mock_select, db):
+    """Test that waiting returns every queued notification without blocking"""
+    db.conn.notifies = [MagicMock(payload="1,2"), MagicMock(payload="3")]
+    
+    assert db.wait_for_notifications(5) == ["1,2", "3"]
+    assert db.conn.notifies == []
+    mock_select.assert_not_called()
+
+@patch('src.database.operations.select.select', return_value=([], [], []))
+def test_wait_for_notifications_times_out(mock_select, db):
+    """Test that waiting returns nothing when no notification arrives"""
+    db.conn.notifies = []
+    
+    assert db.wait_for_notifications(1.5) == []
+    mock_select.assert_called_once_with([db.conn], [], [], 1.5)
+    db.conn.poll.assert_not_called()
+
+def test_release_jobs_only_releases_own_leases(db):
+    """Test that a worker only releases the leases it still holds"""
+    cursor = db.conn.cursor.return_value
+    cursor.rowcount = 2
+    
+    released = db.release_jobs("worker-1", [1, 2])
+    
+    query, params = cursor.execute.call_args[0]
+    assert "claimed_by = %s" in query
+    assert params == ([1, 2], "worker-1")
+    assert released == 2
+
+def test_record_failed_evaluations_sets_jobs_aside_after_max_attempts(db):
+    """Test that failures count attempts on pending jobs instead of recording verdicts"""
+    cursor = db.conn.cursor.return_value
+    cursor.rowcount = 2
+    
+    assert db.record_failed_evaluations([1, 2], 3) == 2
+    
+    query, params = cursor.execute.call_args[0]
+    assert "evaluation_attempts = evaluation_attempts + 1" in query
+    assert "THEN 'failed'" in query
+    assert "evaluation_status = 'pending'" in query
+    assert params == (3, [1, 2])
+    db.conn.commit.assert_called_once()
+
+def test_save_verdict_twice_is_ignored(db):
+    """Test that a second verdict for the same job is not recorded"""
+    from src.database.models import RejectedJob
+    db.conn.cursor.return_value.fetchone.return_value = None
+    
+    assert db.save_rejected_job(RejectedJob(job_id=1, reason="Java role")) is None
+    db.conn.rollback.assert_not_called()
+
+@patch('src.database.operations.execute_values')
+def test_save_verdicts_bulk_writes_one_transaction(mock_execute_values, db):
+    """Test that a batch of verdicts is saved with one insert per table and one commit"""
+    from src.database.models import RelevantJob, RejectedJob
+    # The second rejected job already had a verdict
+    mock_execute_values.side_effect = [[(1,)], [(2,)]]
+    
+    saved = db.save_verdicts_bulk(
+        [RelevantJob(job_id=1, evaluation_score=90, evaluation_summary="Good")],
+        [RejectedJob(job_id=2, reason="Java"), RejectedJob(job_id=3, reason="Java")]
+    )
+    
+    assert saved == 2
+    assert mock_execute_values.call_args_list[1][0][2] == [(2, "Java"), (3, "Java")]
+    assert "evaluation_status = 'rejected'" in mock_execute_values.call_args_list[1][0][1]
+    db.conn.commit.assert_called_once()
+
+@patch('src.database.operations.execute_values', side_effect=Exception("connection lost"))
+def test_save_verdicts_bulk_reports_failure(mock_execute_values, db):
+    """Test that a failed batch is rolled back and reported as unsaved"""
+    from src.database.models import RejectedJob
+    
+    assert db.save_verdicts_bulk([], [RejectedJob(job_id=2, reason="Java")]) is None
+    db.conn.rollback.assert_called_once()
+
+def test_get_finished_keywords_ignores_stale_progress(db):
+    """Test that only recent progress of the scraper's run is read back"""
+    cursor = db.conn.cursor.return_value
+    cursor.fetchall.return_value = [("python",), ("django",)]
+    
+    assert db.get_finished_keywords("linkedin", 3600) == {"python", "django"}
+    query, params = cursor.execute.call_args[0]
+    assert "finished_at > NOW() - make_interval(secs => %s)" in query
+    assert params == ("linkedin", 3600)
+
+def test_mark_keyword_finished_rolls_back_on_error(db):
+    """Test that a failed progress write is rolled back and reported"""
+    db.conn.cursor.return_value.execute.side_effect = Exception("DB down")
+    
+    assert db.mark_keyword_finished("linkedin", "python") is False
+    db.conn.rollback.assert_called_once()
+
+def test_count_pending_jobs_returns_none_on_error(db):
+    """Test that the backlog is counted, and unknown when the database fails"""
+    cursor = db.conn.cursor.return_value
+    cursor.fetchone.return_value = (12,)
+    
+    assert db.count_pending_jobs() == 12
+    
+    cursor.execute.side_effect = Exception("DB down")
+    
+    assert db.count_pending_jobs() is None
+    db.conn.rollback.assert_called_once()
+
+def make_row(job_id):
+    """Create a scraped_jobs row"""
+    return (job_id, "Developer", "Tech Corp", "Remote", "", f"https://linkedin.com/jobs/{job_id}", "linkedin", None)
+
+def test_iter_unevaluated_jobs_pages_by_id(db):
+    """Test that unevaluated jobs are streamed with keyset pagination"""
+    cursor = db.conn.cursor.return_value
+    cursor.fetchall.side_effect = [[make_row(1), make_row(2)], [make_row(5)]]
+    
+    stream = db.iter_unevaluated_jobs(fetch_size=2)
+    first = next(stream)
+    
+    # Only the first page has been fetched when the first job is available
+    assert first.id == 1
+    assert cursor.execute.call_count == 1
+    
+    assert [job.id for job in stream] == [2, 5]
+    assert [call[0][1] for call in cursor.execute.call_args_list] == [(0, 2), (2, 2)]
+    assert db.conn.commit.call_count == 2
+
+def test_iter_unevaluated_jobs_rolls_back_failed_page(db):
+    """Test that a failed page does not leave the connection in an aborted transaction"""
+    cursor = db.conn.cursor.return_value
+    cursor.fetchall.side_effect = [[make_row(1), make_row(2)], Exception("connection lost")]
+    
+    assert [job.id for job in db.iter_unevaluated_jobs(fetch_size=2)] == [1, 2]
+    db.conn.rollback.assert_called_once()
+
+def test_get_unevaluated_jobs_collects_stream(db):
+    """Test that the list API still returns every unevaluated job"""
+    db.conn.cursor.return_value.fetchall.return_value = [make_row(3)]
+    
+    jobs = db.get_unevaluated_jobs()
+    
+    assert [job.link for job in jobs] == ["https://linkedin.com/jobs/3"]
+
+def test_iter_job_links_streams_with_named_cursor(db):
+    """Test that stored links are streamed through one server-side cursor"""
+    cursor = db.conn.cursor.return_value
+    cursor.__iter__.return_value = iter([("https://linkedin.com/jobs/1",), ("https://linkedin.com/jobs/2",)])
+    
+    links = list(db.iter_job_links(fetch_size=500))
+    
+    assert links == ["https://linkedin.com/jobs/1", "https://linkedin.com/jobs/2"]
+    db.conn.cursor.assert_called_once_with(name="job_links")
+    assert cursor.itersize == 500
+    cursor.close.assert_called_once()
+    db.conn.commit.assert_called_once()
+
+def test_hot_queries_are_prepared_once_per_connection(db):
+    """Test that pooled connections parse a hot query once and then execute it"""
+    from src.database.pool import PreparingConnection
+    db.conn = MagicMock(spec=PreparingConnection)
+    db.conn.prepared = set()
+    cursor = db.conn.cursor.return_value
+    cursor.fetchone.return_value = None
+    
+    db.job_exists("https://linkedin.com/jobs/1")
+    db.job_exists("https://linkedin.com/jobs/2")
+    
+    statements = [call.args for call in cursor.execute.call_args_list]
+    assert statements[0] == ("PREPARE job_exists AS SELECT id FROM scraped_jobs WHERE link = $1",)
+    assert statements[1:] == [
+        ("EXECUTE job_exists (%s)", ("https://linkedin.com/jobs/1",)),
+        ("EXECUTE job_exists (%s)", ("https://linkedin.com/jobs/2",)),
+    ]
+
+@patch('src.database.operations.get_pool')
+def test_context_manager_returns_connection_to_pool(mock_get_pool):
+    """Test that a with block checks a connection out and hands it back"""
+    pool = mock_get_pool.return_value
+    
+    with DatabaseOperations(host="localhost", database="test", user="test", password="test") as db:
+        conn = db.conn
+    
+    assert conn is pool.getconn.return_value
+    pool.putconn.assert_called_once_with(conn, close=False)
+    assert db.conn is None
+
+@patch('src.database.operations.get_pool')
+def test_listening_connection_is_not_reused(mock_get_pool):
+    """Test that a connection left listening is closed instead of pooled"""
+    pool = mock_get_pool.return_value
+    db = DatabaseOperations(host="localhost", database="test", user="test", password="test")
+    
+    db.listen()
+    conn = db.conn
+    db.close()
+    
+    pool.putconn.assert_called_once_with(conn, close=True)
+
+def test_find_near_duplicate_candidates_ends_its_transaction(db):
+    """Test that the candidate lookup commits, and rolls back when the query fails"""
+    cursor = db.conn.cursor.return_value
+    cursor.fetchall.return_value = [(7, [1, 2], False, None, None, "Not a Python role", False)]
+    
+    candidates = db.find_near_duplicate_candidates(8, [11, 12])
+    
+    assert [(candidate["job_id"], candidate["failed"]) for candidate in candidates] == [(7, False)]
+    db.conn.commit.assert_called_once()
+    
+    cursor.execute.side_effect = Exception("connection lost")
+    assert db.find_near_duplicate_candidates(8, [11, 12]) == []
+    db.conn.rollback.assert_called_once()
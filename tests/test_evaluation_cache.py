@@ -0,0 +1,89 @@
+import pytest
+from unittest.mock import MagicMock
+from src.database.models import Job
+from src.evaluators.cache import CachingEvaluator, content_hash
+
+@pytest.fixture
+def db():
+    """Create mock database operations with an empty cache"""
+    db = MagicMock()
+    db.get_cached_evaluation.return_value = None
+    return db
+
+@pytest.fixture
+def inner():
+    """Create a mock wrapped evaluator"""
+    inner = MagicMock()
+    inner.model = "test-model"
+    inner.evaluate.return_value = {"is_relevant": True, "score": 90, "reason": "", "summary": "Python role"}
+    return inner
+
+def make_job(link, description="Build APIs in Python"):
+    """Create a job posted under the given link"""
+    return Job(title="Python Developer", company="Tech Corp", description=description, link=link)
+
+def test_content_hash_ignores_link_and_formatting():
+    """Test that reposts with different links and whitespace hash the same"""
+    original = make_job("https://linkedin.com/jobs/1")
+    repost = make_job("https://linkedin.com/jobs/2", description="Build  APIs\nin PYTHON ")
+    
+    assert content_hash(original, "model", "v1") == content_hash(repost, "model", "v1")
+    assert content_hash(original, "model", "v1") != content_hash(original, "model", "v2")
+    assert content_hash(original, "model", "v1") != content_hash(original, "other-model", "v1")
+
+def test_repost_is_served_from_lru(db, inner):
+    """Test that a repost reuses the verdict without another LLM call"""
+    evaluator = CachingEvaluator(inner, db, lru_size=10)
+    
+    first = evaluator.evaluate(make_job("https://linkedin.com/jobs/1"))
+    second = evaluator.evaluate(make_job("https://linkedin.com/jobs/2"))
+    
+    inner.evaluate.assert_called_once()
+    db.save_cached_evaluation.assert_called_once()
+    assert first == second
+    assert (evaluator.hits, evaluator.misses) == (1, 1)
+
+def test_database_hit_skips_llm(db, inner):
+    """Test that a verdict cached by an earlier run is reused"""
+    db.get_cached_evaluation.return_value = {"is_relevant": False, "score": 10, "reason": "Java role", "summary": ""}
+    evaluator = CachingEvaluator(inner, db, lru_size=0)
+    
+    evaluation = evaluator.evaluate(make_job("https://linkedin.com/jobs/1"))
+    
+    assert evaluation["reason"] == "Java role"
+    inner.evaluate.assert_not_called()
+
+def test_error_verdicts_are_not_cached(db, inner):
+    """Test that failed evaluations are retried instead of cached"""
+    inner.evaluate.return_value = {"is_relevant": False, "reason": "Error during evaluation", "error": True}
+    evaluator = CachingEvaluator(inner, db, lru_size=10)
+    
+    evaluator.evaluate(make_job("https://linkedin.com/jobs/1"))
+    evaluator.evaluate(make_job("https://linkedin.com/jobs/2"))
+    
+    assert inner.evaluate.call_count == 2
+    db.save_cached_evaluation.assert_not_called()
+
+def test_batch_sends_only_misses(db, inner):
+    """Test that cached jobs are left out of the batch sent to the LLM"""
+    inner.evaluate_batch.return_value = [{"is_relevant": False, "score": 5, "reason": "Go role", "summary": ""}]
+    evaluator = CachingEvaluator(inner, db, lru_size=10)
+    evaluator.evaluate(make_job("https://linkedin.com/jobs/1"))
+    
+    evaluations = evaluator.evaluate_batch([
+        make_job("https://linkedin.com/jobs/2"),
+        make_job("https://linkedin.com/jobs/3", description="Build services in Go"),
+    ])
+    
+    assert len(inner.evaluate_batch.call_args[0][0]) == 1
+    assert evaluations[0]["summary"] == "Python role"
+    assert evaluations[1]["reason"] == "Go role"
+
+def test_lru_is_bounded(db, inner):
+    """Test that the in-process LRU evicts the least recently used entries"""
+    evaluator = CachingEvaluator(inner, db, lru_size=2)
+    
+    for description in ("a", "b", "c"):
+        evaluator.evaluate(make_job("https://linkedin.com/jobs/1", description=description))
+    
+    assert len(evaluator.lru) == 2
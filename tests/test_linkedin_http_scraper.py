@@ -0,0 +1,218 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import MagicMock
+from urllib.parse import parse_qs, urlparse
+import pytest
+from src.database.models import Job
+from src.scrapers.linkedin_http_scraper import LinkedInHttpScraper
+
+FIXTURES = Path(__file__).parent / "fixtures" / "linkedin"
+
+class StubLinkedInHandler(BaseHTTPRequestHandler):
+    """Serve saved LinkedIn guest pages"""
+    
+    search_queries = []
+    
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if url.path.endswith("/search"):
+            self.search_queries.append(query)
+            if query["keywords"][0] == "blocked":
+                self._send(999, "authwall.html")
+            elif query["start"][0] == "0":
+                self._send(200, "search_results.html")
+            else:
+                self._send(200, None)
+        elif "/jobPosting/" in url.path:
+            self._send(200, "job_posting.html")
+        else:
+            self._send(404, None)
+    
+    def _send(self, status, fixture):
+        body = (FIXTURES / fixture).read_bytes() if fixture else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture(scope="module")
+def stub_server():
+    """Run a local stub of the LinkedIn guest pages"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubLinkedInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/jobs-guest/jobs/api"
+    server.shutdown()
+
+@pytest.fixture
+def scraper(stub_server):
+    """Create an HTTP scraper pointed at the stub server"""
+    scraper = LinkedInHttpScraper(base_url=stub_server, fallback=MagicMock())
+    scraper.rate_limiter = MagicMock()
+    scraper.setup()
+    yield scraper
+    scraper.cleanup()
+
+def test_parse_cards_from_fixture():
+    """Test that search result cards are parsed with canonical links"""
+    scraper = LinkedInHttpScraper()
+    
+    jobs = scraper._parse_cards((FIXTURES / "search_results.html").read_text())
+    
+    assert [(job.title, job.company, job.location) for job in jobs] == [
+        ("Python Developer", "Acme", "Warsaw, Mazowieckie, Poland"),
+        ("Data Engineer", "Globex", "Remote"),
+    ]
+    assert jobs[0].link == "https://www.linkedin.com/jobs/view/3812345678/"
+    assert jobs[0].source == "linkedin"
+
+def test_scrape_fetches_listings_and_descriptions(scraper):
+    """Test that a keyword is scraped over HTTP without the browser fallback"""
+    jobs = scraper.scrape(["python"])
+    
+    assert len(jobs) == 2
+    assert jobs[1].title == "Data Engineer"
+    assert jobs[0].description.startswith("About the role We are looking for a Python developer")
+    assert "Show more" not in jobs[0].description
+    scraper.fallback.scrape.assert_not_called()
+
+def test_scrape_falls_back_to_browser_when_blocked(scraper):
+    """Test that keywords that need JavaScript are handed to the Selenium scraper"""
+    scraper.fallback.scrape.return_value = [Job(title="From browser", link="https://linkedin.com/jobs/9")]
+    
+    jobs = scraper.scrape(["blocked", "python"])
+    
+    scraper.fallback.scrape.assert_called_once_with(["blocked"])
+    assert [job.title for job in jobs] == ["From browser", "Python Developer", "Data Engineer"]
+
+def test_scrape_batches_yields_each_keyword(scraper):
+    """Test that jobs are yielded per keyword, including keywords scraped by the fallback"""
+    scraper.fallback.scrape.return_value = [Job(title="From browser", link="https://linkedin.com/jobs/9")]
+    
+    batches = scraper.scrape_batches(["python", "blocked"])
+    keyword, jobs = next(batches)
+    
+    # The second keyword is not searched until the first batch is consumed
+    assert keyword == "python"
+    assert [job.title for job in jobs] == ["Python Developer", "Data Engineer"]
+    scraper.fallback.scrape.assert_not_called()
+    assert [(keyword, [job.title for job in jobs]) for keyword, jobs in batches] == [("blocked", ["From browser"])]
+
+def test_cleanup_closes_fallback(scraper):
+    """Test that cleanup also closes the browser fallback"""
+    fallback = scraper.fallback
+    
+    scraper.cleanup()
+    
+    fallback.cleanup.assert_called_once()
+    assert scraper.session is None
+
+def test_scrape_stops_at_checkpoint(scraper):
+    """Test that the walk stops after a page of postings at or below the checkpoint"""
+    from src.utils.bloom import BloomFilter
+    StubLinkedInHandler.search_queries.clear()
+    link_index = BloomFilter(capacity=100)
+    link_index.add("https://www.linkedin.com/jobs/view/3812345678/")
+    link_index.add("https://www.linkedin.com/jobs/view/3812345999/")
+    scraper.set_link_index(link_index)
+    scraper.set_checkpoints({"python": 3812345999})
+    
+    jobs = scraper.scrape(["python"])
+    
+    assert jobs == []
+    assert scraper.checkpoints == {"python": 3812345999}
+    # The first page only held known postings, so no second page is requested
+    assert len(StubLinkedInHandler.search_queries) == 1
+    assert StubLinkedInHandler.search_queries[0]["sortBy"] == ["DD"]
+
+def test_scrape_keeps_promoted_cards_below_checkpoint(scraper):
+    """Test that an unstored card with an old id does not end the walk or get dropped"""
+    StubLinkedInHandler.search_queries.clear()
+    # The first card is a promoted posting older than the checkpoint, listed above a new one
+    scraper.set_checkpoints({"python": 3812345700})
+    
+    jobs = scraper.scrape(["python"])
+    
+    assert [job.title for job in jobs] == ["Python Developer", "Data Engineer"]
+    assert scraper.checkpoints == {"python": 3812345999}
+    assert [query["start"] for query in StubLinkedInHandler.search_queries] == [["0"], ["2"]]
+
+def test_scrape_without_checkpoint_records_newest_posting(scraper):
+    """Test that a first run walks every page and records the newest posting"""
+    StubLinkedInHandler.search_queries.clear()
+    
+    jobs = scraper.scrape(["django"])
+    
+    assert len(jobs) == 2
+    assert scraper.checkpoints == {"django": 3812345999}
+    assert [query["start"] for query in StubLinkedInHandler.search_queries] == [["0"], ["2"]]
+
+def test_scrape_skips_detail_pages_of_known_links(scraper):
+    """Test that listings already stored are dropped before their detail page is fetched"""
+    from src.utils.bloom import BloomFilter
+    link_index = BloomFilter(capacity=100)
+    link_index.add("https://www.linkedin.com/jobs/view/3812345678/")
+    scraper.set_link_index(link_index)
+    scraper._fetch_description = MagicMock(return_value="Fetched")
+    
+    jobs = scraper.scrape(["flask"])
+    
+    assert [job.title for job in jobs] == ["Data Engineer"]
+    scraper._fetch_description.assert_called_once()
+
+def test_scrape_skips_detail_pages_of_excluded_titles(scraper):
+    """Test that cards failing the title rule are kept without fetching their description"""
+    import re
+    scraper.exclude_title = re.compile(r"data engineer", re.IGNORECASE)
+    scraper._fetch_description = MagicMock(return_value="Fetched")
+    
+    jobs = scraper.scrape(["pandas"])
+    
+    assert [(job.title, job.description) for job in jobs] == [("Python Developer", "Fetched"), ("Data Engineer", "")]
+    scraper._fetch_description.assert_called_once()
+
+def test_scrape_retries_jobs_whose_description_failed(scraper):
+    """Test that a failed detail page leaves the job out and keeps the checkpoint below it"""
+    scraper._fetch_description = MagicMock(side_effect=lambda job: None if "3812345678" in job.link else "Fetched")
+    
+    jobs = scraper.scrape(["numpy"])
+    
+    assert [(job.title, job.description) for job in jobs] == [("Data Engineer", "Fetched")]
+    assert scraper.checkpoints == {"numpy": 3812345677}
+
+def test_fallback_drops_known_links_before_opening_them(stub_server):
+    """Test that the browser fallback uses the HTTP scraper's link index"""
+    from src.scrapers.linkedin_scraper import LinkedInScraper
+    from src.utils.bloom import BloomFilter
+    stored = MagicMock(spec=['job_title', 'company', 'linkedin_url', 'scrape', 'job_description'])
+    stored.job_title = "Stored Developer"
+    stored.linkedin_url = "https://www.linkedin.com/jobs/view/3812340001/?trackingId=abc"
+    stored.job_description = None
+    fresh = MagicMock(spec=['job_title', 'company', 'linkedin_url', 'scrape', 'job_description'])
+    fresh.job_title = "Fresh Developer"
+    fresh.linkedin_url = "https://www.linkedin.com/jobs/view/3812340002/"
+    fresh.job_description = None
+    fresh.scrape.side_effect = lambda close_on_complete: setattr(fresh, 'job_description', "Build APIs")
+    fallback = LinkedInScraper()
+    fallback.driver = MagicMock()
+    fallback.job_search = MagicMock()
+    fallback.job_search.search.return_value = [stored, fresh]
+    fallback.rate_limiter = MagicMock()
+    fallback.detail_rate_limiter = MagicMock()
+    link_index = BloomFilter(capacity=100)
+    link_index.add("https://www.linkedin.com/jobs/view/3812340001/")
+    
+    scraper = LinkedInHttpScraper(base_url=stub_server, fallback=fallback)
+    scraper.rate_limiter = MagicMock()
+    scraper.set_link_index(link_index)
+    jobs = scraper.scrape(["blocked"])
+    
+    assert [job.title for job in jobs] == ["Fresh Developer"]
+    stored.scrape.assert_not_called()
+    fresh.scrape.assert_called_once_with(close_on_complete=False)
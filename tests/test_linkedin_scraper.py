@@ -1,3 +1,4 @@
+import re
 import pytest
 from unittest.mock import MagicMock, patch
 from src.scrapers.linkedin_scraper import LinkedInScraper
@@ -32,6 +33,8 @@ def test_setup_success(mock_job_search_class, mock_actions, mock_setup_driver, m
     with patch('src.scrapers.linkedin_scraper.settings') as mock_settings:
         mock_settings.LINKEDIN_USERNAME = "test@example.com"
         mock_settings.LINKEDIN_PASSWORD = "password"
+        mock_settings.LINKEDIN_COOKIES_PATH = ""
+        mock_settings.CHROME_USER_DATA_DIR = None
         
         scraper = LinkedInScraper()
         result = scraper.setup()
@@ -64,6 +67,8 @@ def test_setup_login_exception(mock_actions, mock_driver):
         with patch('src.scrapers.linkedin_scraper.settings') as mock_settings:
             mock_settings.LINKEDIN_USERNAME = "test@example.com"
             mock_settings.LINKEDIN_PASSWORD = "password"
+            mock_settings.LINKEDIN_COOKIES_PATH = ""
+            mock_settings.CHROME_USER_DATA_DIR = None
             
             scraper = LinkedInScraper()
             result = scraper.setup()
@@ -122,6 +127,31 @@ def test_convert_to_job():
     assert job.link == "https://linkedin.com/jobs/123"
     assert job.source == "linkedin"
 
+def test_convert_to_job_drops_tracking_parameters():
+    """Test that a listing's link is reduced to the canonical job view link"""
+    scraper = LinkedInScraper()
+    
+    job_listing = MagicMock()
+    job_listing.linkedin_url = "https://www.linkedin.com/jobs/view/python-developer-at-acme-3812345678?position=1&refId=abc&trackingId=def"
+    
+    job = scraper._convert_to_job(job_listing)
+    
+    assert job.link == "https://www.linkedin.com/jobs/view/3812345678/"
+
+def test_scrape_checks_known_links_in_canonical_form(mock_job_search):
+    """Test that a stored posting is recognised even when its listing carries tracking parameters"""
+    from src.utils.bloom import BloomFilter
+    mock_job_search.search.return_value[0].linkedin_url = "https://www.linkedin.com/jobs/view/3812345678/?refId=abc&trackingId=def"
+    link_index = BloomFilter(capacity=100)
+    link_index.add("https://www.linkedin.com/jobs/view/3812345678/")
+    
+    scraper = LinkedInScraper()
+    scraper.driver = MagicMock()
+    scraper.job_search = mock_job_search
+    scraper.set_link_index(link_index)
+    
+    assert scraper.scrape(keywords=["python"]) == []
+
 def test_convert_to_job_handles_missing_attributes():
     """Test that job conversion gracefully handles missing attributes"""
     scraper = LinkedInScraper()
@@ -141,6 +171,31 @@ def test_convert_to_job_handles_missing_attributes():
     assert job.link == ""
     assert job.source == "linkedin"
 
+def test_scrape_fetches_descriptions_only_for_wanted_cards(mock_job_search):
+    """Test that detail pages are opened only for cards passing the title rule"""
+    wanted = MagicMock(spec=['job_title', 'company', 'linkedin_url', 'scrape', 'job_description'])
+    wanted.job_title = "Python Developer"
+    wanted.linkedin_url = "https://www.linkedin.com/jobs/view/101/"
+    wanted.job_description = None
+    wanted.scrape.side_effect = lambda close_on_complete: setattr(wanted, 'job_description', "Build APIs ")
+    skipped = MagicMock(spec=['job_title', 'company', 'linkedin_url', 'scrape', 'job_description'])
+    skipped.job_title = "Python Intern"
+    skipped.linkedin_url = "https://www.linkedin.com/jobs/view/102/"
+    skipped.job_description = None
+    mock_job_search.search.return_value = [wanted, skipped]
+    
+    scraper = LinkedInScraper()
+    scraper.driver = MagicMock()
+    scraper.job_search = mock_job_search
+    scraper.exclude_title = re.compile(r"intern", re.IGNORECASE)
+    scraper.detail_rate_limiter = MagicMock()
+    
+    jobs = scraper.scrape(keywords=["python"])
+    
+    assert [(job.title, job.description) for job in jobs] == [("Python Developer", "Build APIs"), ("Python Intern", "")]
+    wanted.scrape.assert_called_once_with(close_on_complete=False)
+    skipped.scrape.assert_not_called()
+
 def test_cleanup():
     """Test cleanup of resources"""
     scraper = LinkedInScraper()
@@ -155,3 +210,147 @@ def test_cleanup():
     driver.quit.assert_called_once()
     assert scraper.driver is None
     assert scraper.job_search is None
+
+@patch('src.scrapers.linkedin_scraper.setup_chrome_driver')
+@patch('src.scrapers.linkedin_scraper.actions')
+@patch('src.scrapers.linkedin_scraper.JobSearch')
+def test_scrape_parallel_sessions_dedup_jobs(mock_job_search_class, mock_actions, mock_setup_driver, mock_job_search):
+    """Test that a pool of sessions covers every keyword and dedups jobs by link"""
+    extra_driver = MagicMock()
+    mock_setup_driver.return_value = extra_driver
+    mock_job_search_class.return_value = mock_job_search
+    
+    scraper = LinkedInScraper()
+    scraper.sessions = 2
+    scraper.rate_limiter = MagicMock()
+    scraper.driver = MagicMock()
+    scraper.job_search = mock_job_search
+    
+    with patch('src.scrapers.linkedin_scraper.settings') as mock_settings:
+        mock_settings.LINKEDIN_USERNAME = "test@example.com"
+        mock_settings.LINKEDIN_PASSWORD = "password"
+        mock_settings.LINKEDIN_COOKIES_PATH = ""
+        mock_settings.CHROME_USER_DATA_DIR = None
+        
+        jobs = scraper.scrape(keywords=["python", "django", "flask"])
+    
+    # Every keyword is searched once, across both sessions
+    assert sorted(call[0][0] for call in mock_job_search.search.call_args_list) == ["django", "flask", "python"]
+    assert scraper.rate_limiter.acquire.call_count == 3
+    # The same listing was found for every keyword
+    assert len(jobs) == 1
+    # The extra session is logged in and closed; the main one stays open
+    mock_actions.login.assert_called_once_with(extra_driver, "test@example.com", "password")
+    extra_driver.quit.assert_called_once()
+    scraper.driver.quit.assert_not_called()
+
+def test_scrape_batches_skips_failed_keywords(mock_job_search):
+    """Test that each keyword's jobs are yielded on their own and failed searches are left out"""
+    scraper = LinkedInScraper()
+    scraper.driver = MagicMock()
+    scraper.job_search = mock_job_search
+    scraper.rate_limiter = MagicMock()
+    listings = mock_job_search.search.return_value
+    mock_job_search.search.side_effect = [listings, Exception("Search failed"), listings]
+    
+    batches = list(scraper.scrape_batches(keywords=["python", "django", "flask"]))
+    
+    assert [(keyword, len(jobs)) for keyword, jobs in batches] == [("python", 1), ("flask", 1)]
+
+@patch('src.scrapers.linkedin_scraper.setup_chrome_driver')
+@patch('src.scrapers.linkedin_scraper.actions')
+@patch('src.scrapers.linkedin_scraper.JobSearch')
+def test_scrape_parallel_yields_batches_per_keyword(mock_job_search_class, mock_actions, mock_setup_driver, mock_job_search):
+    """Test that parallel sessions yield one batch per keyword with jobs deduped across batches"""
+    mock_setup_driver.return_value = MagicMock()
+    mock_job_search_class.return_value = mock_job_search
+    
+    scraper = LinkedInScraper()
+    scraper.sessions = 2
+    scraper.rate_limiter = MagicMock()
+    scraper.driver = MagicMock()
+    scraper.job_search = mock_job_search
+    
+    with patch('src.scrapers.linkedin_scraper.settings') as mock_settings:
+        mock_settings.LINKEDIN_COOKIES_PATH = ""
+        mock_settings.CHROME_USER_DATA_DIR = None
+        
+        batches = list(scraper.scrape_batches(keywords=["python", "django"]))
+    
+    assert sorted(keyword for keyword, _ in batches) == ["django", "python"]
+    # The shared listing is only part of the first batch
+    assert sorted(len(jobs) for _, jobs in batches) == [0, 1]
+
+@patch('src.scrapers.linkedin_scraper.setup_chrome_driver')
+@patch('src.scrapers.linkedin_scraper.actions')
+@patch('src.scrapers.linkedin_scraper.JobSearch')
+def test_setup_restores_saved_session(mock_job_search_class, mock_actions, mock_setup_driver, mock_driver, tmp_path):
+    """Test that valid saved cookies skip the login"""
+    cookies_path = tmp_path / "cookies.json"
+    cookies_path.write_text('[{"name": "li_at", "value": "token"}]')
+    mock_driver.current_url = "https://www.linkedin.com/feed/"
+    mock_setup_driver.return_value = mock_driver
+    
+    with patch('src.scrapers.linkedin_scraper.settings') as mock_settings:
+        mock_settings.LINKEDIN_COOKIES_PATH = str(cookies_path)
+        mock_settings.CHROME_USER_DATA_DIR = None
+        
+        scraper = LinkedInScraper()
+        result = scraper.setup()
+    
+    assert result is True
+    mock_driver.add_cookie.assert_called_once_with({"name": "li_at", "value": "token"})
+    mock_actions.login.assert_not_called()
+
+@patch('src.scrapers.linkedin_scraper.setup_chrome_driver')
+@patch('src.scrapers.linkedin_scraper.actions')
+@patch('src.scrapers.linkedin_scraper.JobSearch')
+def test_setup_logs_in_when_saved_session_expired(mock_job_search_class, mock_actions, mock_setup_driver, mock_driver, tmp_path):
+    """Test that an expired saved session falls back to a full login and is saved again"""
+    cookies_path = tmp_path / "cookies.json"
+    cookies_path.write_text('[]')
+    mock_driver.current_url = "https://www.linkedin.com/login"
+    mock_driver.get_cookies.return_value = [{"name": "li_at", "value": "new-token"}]
+    mock_setup_driver.return_value = mock_driver
+    
+    with patch('src.scrapers.linkedin_scraper.settings') as mock_settings:
+        mock_settings.LINKEDIN_USERNAME = "test@example.com"
+        mock_settings.LINKEDIN_PASSWORD = "password"
+        mock_settings.LINKEDIN_COOKIES_PATH = str(cookies_path)
+        mock_settings.CHROME_USER_DATA_DIR = None
+        
+        scraper = LinkedInScraper()
+        result = scraper.setup()
+    
+    assert result is True
+    mock_actions.login.assert_called_once_with(mock_driver, "test@example.com", "password")
+    assert "new-token" in cookies_path.read_text()
+
+@patch('src.scrapers.linkedin_scraper.setup_chrome_driver')
+def test_setup_reuses_warm_session(mock_setup_driver):
+    """Test that a live session from an earlier run is reused without a new browser"""
+    scraper = LinkedInScraper()
+    scraper.driver = MagicMock()
+    scraper.driver.current_url = "https://www.linkedin.com/feed/"
+    scraper.job_search = MagicMock()
+    
+    assert scraper.setup() is True
+    mock_setup_driver.assert_not_called()
+    scraper.driver.quit.assert_not_called()
+
+def test_scrape_leaves_out_jobs_whose_description_failed(mock_job_search):
+    """Test that a job whose detail page could not be read is not returned with an empty description"""
+    failing = MagicMock(spec=['job_title', 'company', 'linkedin_url', 'scrape', 'job_description'])
+    failing.job_title = "Python Developer"
+    failing.linkedin_url = "https://www.linkedin.com/jobs/view/101/"
+    failing.job_description = None
+    failing.scrape.side_effect = TimeoutError("page load timed out")
+    mock_job_search.search.return_value = [failing]
+    
+    scraper = LinkedInScraper()
+    scraper.driver = MagicMock()
+    scraper.job_search = mock_job_search
+    scraper.detail_rate_limiter = MagicMock()
+    
+    assert scraper.scrape(keywords=["python"]) == []
+    failing.scrape.assert_called_once_with(close_on_complete=False)
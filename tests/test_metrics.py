@@ -0,0 +1,53 @@
+import math
+from fastapi.testclient import TestClient
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter
+from src.database.models import Job
+from src.database.pool import _statement_kind
+from src.database.verdict_sink import VerdictSink
+from src.run_evaluator import count_backlog
+from src.utils.metrics_server import create_app
+from unittest.mock import MagicMock, patch
+
+def sample(name: str) -> float:
+    """Read an unlabelled sample from the default registry"""
+    return REGISTRY.get_sample_value(name) or 0.0
+
+def test_metrics_endpoint_serves_text_format():
+    """Test that /metrics serves the registry in the Prometheus text format without a redirect"""
+    registry = CollectorRegistry()
+    Counter("jobs_saved_total", "Saved jobs", registry=registry).inc(5)
+    
+    response = TestClient(create_app(registry)).get("/metrics", follow_redirects=False)
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"] == CONTENT_TYPE_LATEST
+    assert "jobs_saved_total 5.0" in response.text
+
+def test_statement_kind_labels_prepared_statements_by_name():
+    """Test that statements are labelled by keyword and prepared ones by their name"""
+    assert _statement_kind("\n    SELECT id FROM scraped_jobs") == "select"
+    assert _statement_kind("EXECUTE claim_jobs (%s, %s)") == "claim_jobs"
+    assert _statement_kind(b"INSERT INTO scraped_jobs VALUES (1)") == "insert"
+
+def test_verdict_sink_counts_verdicts_and_errors():
+    """Test that verdicts and failed evaluations are counted as they reach the sink"""
+    sink = VerdictSink(db=MagicMock(), batch_size=10, flush_interval_ms=0)
+    names = ("jobflow_jobs_evaluated_total", "jobflow_jobs_relevant_total", "jobflow_jobs_errored_total")
+    before = [sample(name) for name in names]
+    
+    sink.add(Job(id=1), {"is_relevant": True, "score": 90, "summary": "Match"})
+    sink.add(Job(id=2), {"is_relevant": False, "reason": "Error", "error": True})
+    sink.add(Job(id=3), {"is_relevant": False, "reason": "Throttled", "error": True, "transient": True})
+    
+    assert [sample(name) - value for name, value in zip(names, before)] == [1, 1, 2]
+
+@patch('src.run_evaluator.DatabaseOperations')
+def test_backlog_is_unknown_when_database_is_down(mock_db_class):
+    """Test that the backlog gauge reads NaN rather than failing the scrape"""
+    mock_db_class.return_value.__enter__.return_value.count_pending_jobs.return_value = 7
+    
+    assert count_backlog() == 7
+    
+    mock_db_class.return_value.__enter__.side_effect = Exception("DB down")
+    
+    assert math.isnan(count_backlog())
@@ -0,0 +1,43 @@
+import pytest
+from unittest.mock import MagicMock
+from src.database.migrate import apply_migrations, list_migrations
+from src.database.operations import DatabaseOperations
+
+@pytest.fixture
+def db():
+    """Create database operations with a mock connection"""
+    db = DatabaseOperations(host="localhost", database="test", user="test", password="test")
+    db.conn = MagicMock()
+    return db
+
+def test_list_migrations_in_version_order():
+    """Test that migration files are numbered without gaps"""
+    versions = [version for version, _ in list_migrations()]
+    
+    assert versions == list(range(1, len(versions) + 1))
+
+def test_apply_migrations_skips_applied_versions(db):
+    """Test that only pending migrations run, each recorded in schema_migrations"""
+    cursor = db.conn.cursor.return_value
+    cursor.fetchall.return_value = [(1,)]
+    
+    applied = apply_migrations(db)
+    
+    statements = [call.args for call in cursor.execute.call_args_list]
+    assert statements[0] == ("SELECT pg_advisory_xact_lock(%s)", (7351,))
+    recorded = [args[1][0] for args in statements if args[0].startswith("INSERT INTO schema_migrations")]
+    assert recorded == [version for version, _ in list_migrations()][1:]
+    assert applied == len(recorded)
+    db.conn.commit.assert_called_once()
+
+def test_apply_migrations_rolls_back_on_error(db):
+    """Test that a failing migration leaves the schema untouched"""
+    cursor = db.conn.cursor.return_value
+    cursor.fetchall.return_value = []
+    cursor.execute.side_effect = [None, None, None, Exception("syntax error")]
+    
+    with pytest.raises(Exception):
+        apply_migrations(db)
+    
+    db.conn.rollback.assert_called_once()
+    db.conn.commit.assert_not_called()
@@ -0,0 +1,104 @@
+import pytest
+from unittest.mock import MagicMock
+from src.database.models import Job
+from src.evaluators.near_duplicate import NearDuplicateEvaluator, NearDuplicateIndex
+from src.utils.minhash import MinHasher, estimate_similarity
+
+DESCRIPTION = " ".join(
+    f"We are hiring a Python developer to build data pipeline number {i} with PostgreSQL and Docker."
+    for i in range(20)
+)
+
+@pytest.fixture
+def hasher():
+    """Create a MinHasher with the default parameters"""
+    return MinHasher(num_perm=128, bands=16)
+
+def test_similar_descriptions_share_buckets(hasher):
+    """Test that a reworded paragraph keeps descriptions in common LSH buckets"""
+    original = hasher.signature(DESCRIPTION + " We offer private health care and a gym card.")
+    reworded = hasher.signature(DESCRIPTION + " Benefits include a gym card and health insurance.")
+    unrelated = hasher.signature("Senior Java engineer for a banking platform, on-site in Berlin, Spring Boot.")
+    
+    assert estimate_similarity(original, reworded) > 0.8
+    assert estimate_similarity(original, unrelated) < 0.1
+    assert set(hasher.band_keys(original)) & set(hasher.band_keys(reworded))
+    assert not set(hasher.band_keys(original)) & set(hasher.band_keys(unrelated))
+
+def test_empty_description_has_no_signature(hasher):
+    """Test that jobs without a description are never matched"""
+    assert hasher.signature("") is None
+
+def test_index_jobs_skips_unsaved_and_empty_jobs(hasher):
+    """Test that only saved jobs with a description are indexed"""
+    db = MagicMock()
+    index = NearDuplicateIndex(db, threshold=0.9, hasher=hasher)
+    
+    indexed = index.index_jobs([Job(id=1, description=DESCRIPTION), Job(description=DESCRIPTION), Job(id=3)])
+    
+    assert indexed == 1
+    (job_id, signature, band_keys), = db.save_job_signatures.call_args[0][0]
+    assert job_id == 1
+    assert len(signature) == 128
+    assert len(band_keys) == 16
+
+def test_evaluator_inherits_verdict_of_near_duplicate(hasher):
+    """Test that a near-duplicate takes over the earlier verdict without an LLM call"""
+    db = MagicMock()
+    db.find_near_duplicate_candidates.return_value = [{
+        "job_id": 7,
+        "minhash": hasher.signature(DESCRIPTION),
+        "is_relevant": False,
+        "score": 10,
+        "summary": "",
+        "reason": "Requires relocation",
+    }]
+    inner = MagicMock()
+    evaluator = NearDuplicateEvaluator(inner, db, threshold=0.9)
+    evaluator.index.hasher = hasher
+    
+    evaluation = evaluator.evaluate(Job(id=8, description=DESCRIPTION + " Apply today."))
+    
+    inner.evaluate.assert_not_called()
+    assert evaluation["is_relevant"] is False
+    assert evaluation["near_duplicate_of"] == 7
+    assert evaluation["reason"].endswith("Requires relocation")
+
+def test_evaluator_falls_through_below_threshold(hasher):
+    """Test that candidates below the similarity threshold are ignored"""
+    db = MagicMock()
+    db.find_near_duplicate_candidates.return_value = [{
+        "job_id": 7,
+        "minhash": hasher.signature("Senior Java engineer for a banking platform"),
+        "is_relevant": True,
+        "score": 90,
+        "summary": "",
+        "reason": "",
+    }]
+    inner = MagicMock()
+    inner.evaluate.return_value = {"is_relevant": True, "score": 80}
+    evaluator = NearDuplicateEvaluator(inner, db, threshold=0.9)
+    evaluator.index.hasher = hasher
+    
+    evaluation = evaluator.evaluate(Job(id=8, description=DESCRIPTION))
+    
+    inner.evaluate.assert_called_once()
+    assert evaluation["score"] == 80
+
+def test_evaluator_ignores_failed_verdicts(hasher):
+    """Test that a near-duplicate of a job whose evaluation failed does not inherit the failure"""
+    db = MagicMock()
+    db.find_near_duplicate_candidates.return_value = [{
+        "job_id": 12,
+        "minhash": hasher.signature(DESCRIPTION),
+        "is_relevant": False,
+        "score": 0,
+        "summary": "",
+        "reason": "Error during evaluation: 402 Payment Required",
+        "failed": True,
+    }]
+    evaluator = NearDuplicateEvaluator(MagicMock(), db, threshold=0.9)
+    evaluator.index.hasher = hasher
+    
+    assert evaluator._lookup(Job(id=13, description=DESCRIPTION + " Apply today.")) is None
+    assert evaluator.inherited == 0
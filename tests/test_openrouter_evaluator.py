@@ -0,0 +1,151 @@
+import json
+import pytest
+import requests
+from unittest.mock import MagicMock, patch
+from src.evaluators.base import EvaluatorUnavailableError, TransientEvaluationError
+from src.evaluators.openrouter import OpenRouterEvaluator
+from src.utils.rate_limiter import AdaptiveConcurrency
+from src.database.models import Job
+
+@pytest.fixture
+def evaluator():
+    """Create an OpenRouter evaluator with a fake API key"""
+    evaluator = OpenRouterEvaluator()
+    evaluator.api_key = "test-key"
+    return evaluator
+
+@pytest.fixture
+def jobs():
+    """Create a batch of jobs"""
+    return [Job(id=i, title=f"Developer {i}", company="Tech Corp") for i in (1, 2, 3)]
+
+def verdict(job_id, is_relevant=True):
+    """Create a verdict element for a batch response"""
+    return {"job_id": job_id, "is_relevant": is_relevant, "score": 80, "reason": "Good match", "summary": "Python role"}
+
+def test_parse_evaluation_result_rejects_invalid_verdict(evaluator):
+    """Test that a response without is_relevant is treated as a parse failure"""
+    evaluation = evaluator._parse_evaluation_result(json.dumps({"score": 90}))
+    
+    assert evaluation["is_relevant"] is False
+    assert evaluation["reason"] == "Failed to parse LLM response"
+
+def test_parse_evaluation_result_fills_defaults(evaluator):
+    """Test that a minimal valid verdict gets the fields the runner relies on"""
+    evaluation = evaluator._parse_evaluation_result(json.dumps({"is_relevant": True, "score": "75"}))
+    
+    assert evaluation == {"is_relevant": True, "score": 75.0, "reason": "", "summary": ""}
+
+def test_create_batch_evaluation_prompt_includes_profile_once(evaluator, jobs):
+    """Test that a batch prompt lists every job but the profile only once"""
+    prompt = evaluator._create_batch_evaluation_prompt(jobs)
+    
+    assert prompt.count("MY PROFILE:") == 1
+    assert all(f"Job ID: {job.id}" in prompt for job in jobs)
+
+def test_evaluate_batch_uses_single_request(evaluator, jobs):
+    """Test that a complete batch response needs only one API call"""
+    evaluator._call_llm_api = MagicMock(return_value=json.dumps(
+        {"evaluations": [verdict(1), verdict(2, is_relevant=False), verdict(3)]}
+    ))
+    
+    evaluations = evaluator.evaluate_batch(jobs)
+    
+    evaluator._call_llm_api.assert_called_once()
+    assert [evaluation["is_relevant"] for evaluation in evaluations] == [True, False, True]
+    assert "job_id" not in evaluations[0]
+
+def test_evaluate_batch_retries_missing_and_malformed_jobs(evaluator, jobs):
+    """Test that jobs missing from a partial response are evaluated on their own"""
+    batch_response = json.dumps({"evaluations": [verdict(1), {"job_id": 2, "score": 10}]})
+    single_response = json.dumps({"is_relevant": False, "score": 20, "reason": "Java role"})
+    evaluator._call_llm_api = MagicMock(side_effect=[batch_response, single_response, single_response])
+    
+    evaluations = evaluator.evaluate_batch(jobs)
+    
+    assert evaluator._call_llm_api.call_count == 3
+    assert evaluations[0]["reason"] == "Good match"
+    assert evaluations[1]["reason"] == "Java role"
+    assert evaluations[2]["reason"] == "Java role"
+
+def test_evaluate_batch_retries_all_jobs_after_malformed_response(evaluator, jobs):
+    """Test that an unparseable batch response falls back to single evaluations"""
+    single_response = json.dumps({"is_relevant": True, "score": 70})
+    evaluator._call_llm_api = MagicMock(side_effect=["not json", single_response, single_response, single_response])
+    
+    evaluations = evaluator.evaluate_batch(jobs)
+    
+    assert evaluator._call_llm_api.call_count == 4
+    assert all(evaluation["score"] == 70 for evaluation in evaluations)
+
+def make_response(status_code, content=None, headers=None):
+    """Create a mock HTTP response"""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = {"choices": [{"message": {"content": content}}]}
+    return response
+
+@patch('src.evaluators.openrouter.time.sleep')
+@patch('src.evaluators.openrouter.requests.post')
+def test_call_llm_api_honors_retry_after(mock_post, mock_sleep, evaluator):
+    """Test that a throttled request is retried after Retry-After and halves concurrency"""
+    evaluator.concurrency = AdaptiveConcurrency(8)
+    evaluator.concurrency.on_throttle = MagicMock()
+    mock_post.side_effect = [make_response(429, headers={"Retry-After": "7"}), make_response(200, "{}")]
+    
+    assert evaluator._call_llm_api("prompt") == "{}"
+    
+    evaluator.concurrency.on_throttle.assert_called_once_with(7.0)
+    mock_sleep.assert_called_once()
+    assert mock_sleep.call_args[0][0] >= 7
+    assert mock_post.call_args.kwargs["timeout"] == evaluator.timeout
+    assert evaluator.concurrency.in_flight == 0
+
+@patch('src.evaluators.openrouter.time.sleep')
+@patch('src.evaluators.openrouter.requests.post')
+def test_evaluate_marks_exhausted_retries_as_transient(mock_post, mock_sleep, evaluator):
+    """Test that a job still failing after all retries is not recorded as rejected"""
+    evaluator.max_retries = 2
+    mock_post.return_value = make_response(503)
+    
+    evaluation = evaluator.evaluate(Job(id=1, title="Developer"))
+    
+    assert mock_post.call_count == 3
+    assert evaluation["transient"] is True
+    assert evaluation["is_relevant"] is False
+
+@patch('src.evaluators.openrouter.requests.post')
+def test_client_errors_are_not_retried(mock_post, evaluator):
+    """Test that a request the provider refuses outright fails without retries"""
+    response = make_response(400)
+    response.raise_for_status.side_effect = requests.HTTPError("400 Bad Request")
+    mock_post.return_value = response
+    
+    evaluation = evaluator.evaluate(Job(id=1, title="Developer"))
+    
+    mock_post.assert_called_once()
+    assert evaluation["error"] is True
+    assert "transient" not in evaluation
+
+@pytest.mark.parametrize("status_code", [401, 402, 403])
+@patch('src.evaluators.openrouter.requests.post')
+def test_unusable_account_stops_evaluation(mock_post, status_code, evaluator, jobs):
+    """Test that a revoked key or exhausted credits raise instead of producing verdicts"""
+    mock_post.return_value = make_response(status_code)
+    
+    with pytest.raises(EvaluatorUnavailableError):
+        evaluator.evaluate(jobs[0])
+    with pytest.raises(EvaluatorUnavailableError):
+        evaluator.evaluate_batch(jobs)
+    
+    assert mock_post.call_count == 2
+
+def test_evaluate_batch_does_not_fan_out_on_transient_failure(evaluator, jobs):
+    """Test that a throttled batch is returned to the queue instead of retried job by job"""
+    evaluator._call_llm_api = MagicMock(side_effect=TransientEvaluationError("OpenRouter returned HTTP 429"))
+    
+    evaluations = evaluator.evaluate_batch(jobs)
+    
+    evaluator._call_llm_api.assert_called_once()
+    assert all(evaluation["transient"] for evaluation in evaluations)
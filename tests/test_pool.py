@@ -0,0 +1,55 @@
+import psycopg2
+import pytest
+from unittest.mock import MagicMock, patch
+from src.database.pool import ConnectionPool
+
+@pytest.fixture
+def pool():
+    """Create a connection pool over a mock psycopg2 pool"""
+    with patch('src.database.pool.ThreadedConnectionPool') as mock_pool_class:
+        pool = ConnectionPool(1, 2, host="localhost")
+    pool.pool = mock_pool_class.return_value
+    return pool
+
+def make_conn(closed=0, ping_error=None):
+    """Create a mock connection whose health check succeeds or fails"""
+    conn = MagicMock()
+    conn.closed = closed
+    conn.cursor.return_value.execute.side_effect = ping_error
+    return conn
+
+def test_getconn_replaces_broken_connections(pool):
+    """Test that connections failing the health check are discarded"""
+    dropped = make_conn(closed=2)
+    stale = make_conn(ping_error=psycopg2.OperationalError("server closed the connection"))
+    healthy = make_conn()
+    pool.pool.getconn.side_effect = [dropped, stale, healthy]
+    
+    assert pool.getconn() is healthy
+    assert [call.args for call in pool.pool.putconn.call_args_list] == [(dropped,), (stale,)]
+    assert all(call.kwargs == {"close": True} for call in pool.pool.putconn.call_args_list)
+
+def test_getconn_gives_up_when_nothing_is_healthy(pool):
+    """Test that checkout fails once every attempt returned a broken connection"""
+    pool.pool.getconn.side_effect = lambda: make_conn(closed=1)
+    
+    with pytest.raises(psycopg2.OperationalError):
+        pool.getconn()
+
+def test_putconn_rolls_back_open_transactions(pool):
+    """Test that a returned connection is reset before it is reused"""
+    conn = make_conn()
+    
+    pool.putconn(conn)
+    
+    conn.rollback.assert_called_once()
+    pool.pool.putconn.assert_called_once_with(conn, close=False)
+
+def test_putconn_closes_dead_connections(pool):
+    """Test that a connection closed by the server is not kept in the pool"""
+    conn = make_conn(closed=2)
+    
+    pool.putconn(conn)
+    
+    conn.rollback.assert_not_called()
+    pool.pool.putconn.assert_called_once_with(conn, close=True)
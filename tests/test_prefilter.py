@@ -0,0 +1,85 @@
+import pytest
+from unittest.mock import MagicMock
+from src.database.models import Job
+from src.evaluators.prefilter import PreFilterEvaluator
+
+@pytest.fixture
+def inner():
+    """Create a mock wrapped evaluator"""
+    inner = MagicMock()
+    inner.evaluate.return_value = {"is_relevant": True, "score": 85, "reason": "", "summary": ""}
+    return inner
+
+def make_prefilter(inner, **rules):
+    """Create a pre-filter with only the given rules enabled"""
+    options = {"exclude_title": "", "exclude_company": "", "exclude_location": "", "required_keywords": "", "min_similarity": 0}
+    options.update(rules)
+    return PreFilterEvaluator(inner, **options)
+
+def test_title_rule_rejects_without_llm(inner):
+    """Test that an excluded title is rejected locally with a rule-based reason"""
+    prefilter = make_prefilter(inner, exclude_title=r"\b(intern|junior)\b")
+    
+    evaluation = prefilter.evaluate(Job(title="Junior Python Developer"))
+    
+    inner.evaluate.assert_not_called()
+    assert evaluation["is_relevant"] is False
+    assert evaluation["reason"] == "Pre-filter: title matches excluded pattern 'Junior'"
+    assert prefilter.stats["title"] == 1
+
+def test_company_rule(inner):
+    """Test that an excluded company is rejected"""
+    prefilter = make_prefilter(inner, exclude_company=r"recruit")
+    
+    evaluation = prefilter.evaluate(Job(title="Developer", company="Best Recruiters Ltd"))
+    
+    assert evaluation["prefiltered"] == "company"
+
+def test_location_rule(inner):
+    """Test that an excluded location is rejected"""
+    prefilter = make_prefilter(inner, exclude_location=r"on-site.*germany")
+    
+    evaluation = prefilter.evaluate(Job(title="Developer", location="On-site, Berlin, Germany"))
+    
+    assert evaluation["prefiltered"] == "location"
+
+def test_required_keywords_match_whole_words(inner):
+    """Test that required keywords do not match inside other words"""
+    prefilter = make_prefilter(inner, required_keywords="python, c++")
+    
+    rejected = prefilter.evaluate(Job(title="Developer", description="Work on our pythonic DSL in Java"))
+    passed = prefilter.evaluate(Job(title="Developer", description="Modern C++ and tooling"))
+    
+    assert rejected["prefiltered"] == "keywords"
+    assert passed["score"] == 85
+
+def test_similarity_rule_passes_uncertain_jobs(inner):
+    """Test that only jobs dissimilar to the profile are rejected by similarity"""
+    prefilter = make_prefilter(inner, min_similarity=0.1)
+    
+    rejected = prefilter.evaluate(Job(title="Nurse", description="Night shifts at the hospital ward"))
+    passed = prefilter.evaluate(Job(title="Python Developer", description="Data Science with Python and Docker"))
+    
+    assert rejected["prefiltered"] == "similarity"
+    assert passed["is_relevant"] is True
+    inner.evaluate.assert_called_once()
+
+def test_batch_sends_only_passed_jobs(inner):
+    """Test that rejected jobs are left out of the batch sent to the LLM"""
+    inner.evaluate_batch.return_value = [{"is_relevant": True, "score": 70, "reason": "", "summary": ""}]
+    prefilter = make_prefilter(inner, exclude_title="intern")
+    
+    evaluations = prefilter.evaluate_batch([Job(title="Intern"), Job(title="Python Developer")])
+    
+    assert [job.title for job in inner.evaluate_batch.call_args[0][0]] == ["Python Developer"]
+    assert evaluations[0]["prefiltered"] == "title"
+    assert evaluations[1]["score"] == 70
+    assert (prefilter.stats["title"], prefilter.stats["passed"]) == (1, 1)
+
+def test_no_rules_passes_everything(inner):
+    """Test that the default, unconfigured pre-filter rejects nothing"""
+    prefilter = make_prefilter(inner)
+    
+    prefilter.evaluate(Job(title="Anything"))
+    
+    inner.evaluate.assert_called_once()
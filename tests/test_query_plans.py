@@ -0,0 +1,95 @@
+import os
+import uuid
+import pytest
+from src.database.migrate import apply_migrations
+from src.database.operations import (
+    CLAIM_JOBS_QUERY, JOB_EXISTS_QUERY, UNEVALUATED_JOBS_QUERY, DatabaseOperations
+)
+
+psycopg2 = pytest.importorskip("psycopg2")
+
+# e.g. "host=localhost dbname=jobflow_test user=jobflow password=password"
+TEST_DATABASE_DSN = os.getenv("TEST_DATABASE_DSN")
+
+pytestmark = pytest.mark.skipif(not TEST_DATABASE_DSN, reason="TEST_DATABASE_DSN is not set")
+
+@pytest.fixture(scope="module")
+def db():
+    """Migrate a throwaway schema with some evaluated history and a small backlog"""
+    db = DatabaseOperations()
+    db.conn = psycopg2.connect(TEST_DATABASE_DSN)
+    schema = f"plans_{uuid.uuid4().hex[:8]}"
+    cursor = db.conn.cursor()
+    cursor.execute(f"CREATE SCHEMA {schema}")
+    cursor.execute(f"SET search_path TO {schema}")
+    db.conn.commit()
+    apply_migrations(db)
+    
+    cursor.execute(
+        """
+        INSERT INTO scraped_jobs (title, link, evaluation_status)
+        SELECT 'Developer', 'https://www.linkedin.com/jobs/view/' || n || '/',
+               CASE WHEN n % 100 = 0 THEN 'pending' ELSE 'rejected' END
+        FROM generate_series(1, 5000) AS n
+        """
+    )
+    cursor.execute("ANALYZE")
+    db.conn.commit()
+    yield db
+    
+    db.conn.rollback()
+    cursor = db.conn.cursor()
+    cursor.execute(f"DROP SCHEMA {schema} CASCADE")
+    db.conn.commit()
+    db.close()
+
+def indexes_by_alias(plan: dict, found: dict = None) -> dict:
+    """Map each table alias scanned in a JSON query plan to the indexes read for it
+    
+    A sequential scan shows up as "Seq Scan" in place of an index name.
+    """
+    found = {} if found is None else found
+    if "Alias" in plan:
+        names = found.setdefault(plan["Alias"], set())
+        if "Index Name" in plan:
+            names.add(plan["Index Name"])
+        if plan["Node Type"] == "Seq Scan":
+            names.add("Seq Scan")
+        if plan["Node Type"] == "Bitmap Heap Scan":
+            names |= {child["Index Name"] for child in plan.get("Plans", []) if "Index Name" in child}
+    for child in plan.get("Plans", []):
+        indexes_by_alias(child, found)
+    return found
+
+def explain(db: DatabaseOperations, query: str, params: tuple) -> dict:
+    """Plan a query with sequential scans discouraged and return the indexes read per table alias
+    
+    Postgres still picks a sequential scan when no index can serve the query,
+    and otherwise the cheapest index, so the index named here is the one the
+    query relies on.
+    """
+    cursor = db.conn.cursor()
+    cursor.execute("SET enable_seqscan = off")
+    cursor.execute("EXPLAIN (FORMAT JSON) " + query, params)
+    plan = cursor.fetchone()[0][0]["Plan"]
+    db.conn.rollback()
+    return indexes_by_alias(plan)
+
+def test_unevaluated_jobs_query_uses_pending_index(db):
+    """Test that the backlog query reads only the partial index on pending jobs"""
+    assert explain(db, UNEVALUATED_JOBS_QUERY, (0, 100))["j"] == {"scraped_jobs_pending_idx"}
+
+def test_claim_jobs_query_uses_pending_index(db):
+    """Test that claiming finds candidates through the partial index on pending jobs"""
+    query = CLAIM_JOBS_QUERY.format(id_filter="")
+    
+    indexes = explain(db, query, ("worker-1", 600, 0, 50))
+    
+    assert indexes["s"] == {"scraped_jobs_pending_idx"}
+    assert "Seq Scan" not in indexes["j"]
+
+def test_job_exists_query_uses_link_index(db):
+    """Test that link lookups use the unique index on link"""
+    indexes = explain(db, JOB_EXISTS_QUERY, ("https://www.linkedin.com/jobs/view/1/",))
+    
+    assert indexes == {"scraped_jobs": {"scraped_jobs_link_key"}}
@@ -0,0 +1,55 @@
+import time
+from src.utils.rate_limiter import AdaptiveConcurrency
+from src.utils.retry import backoff_delay, parse_retry_after
+
+def test_adaptive_concurrency_aimd():
+    """Test that throttling halves the limit and successes win it back slowly"""
+    limiter = AdaptiveConcurrency(8)
+    
+    limiter.on_throttle()
+    limiter.on_throttle()
+    assert limiter.limit == 2
+    
+    for _ in range(3):
+        limiter.on_success()
+    assert 3 <= limiter.limit < 4
+    
+    for _ in range(1000):
+        limiter.on_success()
+    assert limiter.limit == 8
+
+def test_adaptive_concurrency_caps_requests_in_flight():
+    """Test that no slot is handed out beyond the current limit"""
+    limiter = AdaptiveConcurrency(2)
+    
+    assert limiter._try_acquire() == 0
+    assert limiter._try_acquire() == 0
+    assert limiter._try_acquire() > 0
+    limiter.release()
+    assert limiter._try_acquire() == 0
+
+def test_adaptive_concurrency_pauses_after_retry_after():
+    """Test that Retry-After holds back every caller"""
+    limiter = AdaptiveConcurrency(4)
+    
+    limiter.on_throttle(retry_after=30)
+    
+    assert 29 < limiter._try_acquire() <= 30
+    assert limiter.in_flight == 0
+
+def test_backoff_delay_is_jittered_and_capped():
+    """Test that backoff stays within the exponential envelope and the cap"""
+    delays = [backoff_delay(attempt, base=1, cap=10) for attempt in range(8) for _ in range(20)]
+    
+    assert all(0 <= delay <= 10 for delay in delays)
+    assert len(set(delays)) > 1
+    assert backoff_delay(0, base=1, cap=10, retry_after=12) == 12
+
+def test_parse_retry_after_formats():
+    """Test that Retry-After is read as seconds or as an HTTP date"""
+    future = time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(time.time() + 120))
+    
+    assert parse_retry_after("5") == 5.0
+    assert 110 < parse_retry_after(future) <= 120
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
@@ -0,0 +1,30 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from src.run_evaluator import listen_for_jobs, parse_job_ids
+
+class StopListening(Exception):
+    """Raised by a mock to end the listening loop"""
+
+def test_parse_job_ids_merges_payloads():
+    """Test that notification payloads are merged into sorted unique ids"""
+    assert parse_job_ids(["3,1", "2,3", ""]) == [1, 2, 3]
+
+@patch('src.run_evaluator.time.sleep')
+@patch('src.run_evaluator.run_evaluator')
+@patch('src.run_evaluator.DatabaseOperations')
+def test_listen_for_jobs_batches_notifications(mock_db_class, mock_run_evaluator, mock_sleep):
+    """Test that notifications arriving together trigger one run over their jobs"""
+    listener = mock_db_class.return_value
+    listener.wait_for_notifications.side_effect = [["5,6"], ["7"], StopListening()]
+    
+    with patch('src.run_evaluator.settings') as mock_settings:
+        mock_settings.EVALUATOR_DEBOUNCE_SECONDS = 2
+        mock_settings.EVALUATOR_INTERVAL_SECONDS = 3600
+        with pytest.raises(StopListening):
+            listen_for_jobs()
+    
+    listener.listen.assert_called_once()
+    mock_sleep.assert_called_once_with(2)
+    # The first pass also runs the catch-up sweep
+    assert [call.args for call in mock_run_evaluator.call_args_list] == [([5, 6, 7],), ()]
+    listener.close.assert_called_once()
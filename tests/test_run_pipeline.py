@@ -0,0 +1,65 @@
+import threading
+from unittest.mock import MagicMock, patch
+from src.database.models import Job
+from src.run_pipeline import JobHandoff, evaluate_handoff
+
+def make_job(job_id):
+    """Create a stored job with the given id"""
+    return Job(id=job_id, title="Developer", company="Tech Corp", location="Remote",
+               link=f"https://linkedin.com/jobs/{job_id}", source="linkedin")
+
+def test_handoff_takes_queued_jobs_in_batches():
+    """Test that waiting jobs are taken together, up to the batch size"""
+    handoff = JobHandoff(maxsize=10)
+    handoff.put([make_job(1), make_job(2), make_job(3)])
+    
+    assert [job.id for job in handoff.take(2, timeout=0)] == [1, 2]
+    assert [job.id for job in handoff.take(2, timeout=0)] == [3]
+    assert handoff.take(2, timeout=0) == []
+
+def test_closed_handoff_never_blocks_the_scraper():
+    """Test that a full queue drops jobs instead of waiting once the evaluator has stopped"""
+    handoff = JobHandoff(maxsize=1)
+    handoff.close()
+    
+    handoff.put([make_job(1), make_job(2)])
+    
+    assert handoff.queue.qsize() == 0
+
+@patch('src.run_pipeline.evaluate_jobs')
+@patch('src.run_pipeline.claim_jobs')
+@patch('src.run_pipeline.VerdictSink')
+@patch('src.run_pipeline.build_evaluator')
+@patch('src.run_pipeline.apply_migrations')
+@patch('src.run_pipeline.DatabaseOperations')
+def test_evaluate_handoff_claims_and_releases_handed_off_jobs(mock_db_class, mock_migrate, mock_build_evaluator,
+                                                              mock_sink_class, mock_claim_jobs, mock_evaluate_jobs):
+    """Test that the evaluator stage sweeps once, then evaluates handed-off jobs under a claim"""
+    db = mock_db_class.return_value
+    sink = mock_sink_class.return_value
+    sink.flush.return_value = True
+    stop = threading.Event()
+    handoff = JobHandoff(maxsize=10)
+    handoff.put([make_job(1), make_job(2)])
+    
+    def claim(db, worker_id, claimed_ids, job_ids=None):
+        claimed_ids.update(job_ids or [])
+        return [make_job(job_id) for job_id in job_ids or []]
+    
+    mock_claim_jobs.side_effect = claim
+    # Stop after the handed-off jobs are evaluated
+    mock_evaluate_jobs.side_effect = lambda evaluator, sink, jobs, rate_limiter: stop.set() if jobs else None
+    
+    with patch('src.run_pipeline.settings') as mock_settings:
+        mock_settings.EVALUATOR_INTERVAL_SECONDS = 3600
+        mock_settings.EVALUATOR_CLAIM_BATCH_SIZE = 50
+        mock_settings.EVALUATOR_REQUESTS_PER_MINUTE = 0
+        evaluate_handoff(handoff, stop)
+    
+    # The first pass sweeps the whole queue, the second claims only the handed-off jobs
+    assert [call.args[3:] for call in mock_claim_jobs.call_args_list] == [(), ([1, 2],)]
+    db.release_jobs.assert_called_once()
+    assert sorted(db.release_jobs.call_args[0][1]) == [1, 2]
+    sink.close.assert_called_once()
+    db.close.assert_called_once()
+    assert handoff.closed.is_set()
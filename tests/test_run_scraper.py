@@ -0,0 +1,124 @@
+from unittest.mock import MagicMock, patch
+from src.database.models import Job
+from src.run_scraper import run_scraper
+
+def make_scraper(batches):
+    """Create a mock scraper that yields the given (keyword, jobs) batches"""
+    scraper = MagicMock()
+    scraper.name = "linkedin"
+    scraper.checkpoints = {"python": 10, "django": 20}
+    scraper.link_index = None
+    scraper.scrape_batches.side_effect = lambda keywords: iter(batches)
+    return scraper
+
+def make_job(link):
+    """Create a job with the given link"""
+    return Job(title="Developer", company="Tech Corp", location="Remote", link=link, source="linkedin")
+
+@patch('src.run_scraper.apply_migrations')
+@patch('src.run_scraper.DatabaseOperations')
+def test_run_scraper_saves_each_keyword_as_it_arrives(mock_db_class, mock_migrate):
+    """Test that every batch is stored and recorded before the run moves on"""
+    db = mock_db_class.return_value
+    db.get_finished_keywords.return_value = set()
+    db.save_jobs_bulk.side_effect = [(1, 0), (0, 1)]
+    scraper = make_scraper([
+        ("python", [make_job("https://linkedin.com/jobs/1")]),
+        ("django", [make_job("https://linkedin.com/jobs/2")]),
+    ])
+    
+    with patch('src.run_scraper.settings') as mock_settings:
+        mock_settings.SEARCH_KEYWORDS = ["python", "django"]
+        mock_settings.SCRAPER_FULL_RESYNC = False
+        mock_settings.LINK_INDEX_ENABLED = False
+        mock_settings.NEAR_DUPLICATE_ENABLED = False
+        run_scraper(scraper)
+    
+    assert db.save_jobs_bulk.call_count == 2
+    assert [call.args for call in db.save_scrape_checkpoints.call_args_list] == [
+        ("linkedin", {"python": 10}), ("linkedin", {"django": 20})
+    ]
+    assert [call.args for call in db.mark_keyword_finished.call_args_list] == [
+        ("linkedin", "python"), ("linkedin", "django")
+    ]
+    db.clear_scrape_progress.assert_called_once_with("linkedin")
+    scraper.cleanup.assert_not_called()
+
+@patch('src.run_scraper.apply_migrations')
+@patch('src.run_scraper.DatabaseOperations')
+def test_run_scraper_resumes_after_finished_keywords(mock_db_class, mock_migrate):
+    """Test that keywords stored by an interrupted run are not scraped again"""
+    db = mock_db_class.return_value
+    db.get_finished_keywords.return_value = {"python"}
+    scraper = make_scraper([])
+    
+    with patch('src.run_scraper.settings') as mock_settings:
+        mock_settings.SEARCH_KEYWORDS = ["python", "django"]
+        mock_settings.SCRAPER_FULL_RESYNC = False
+        mock_settings.LINK_INDEX_ENABLED = False
+        mock_settings.NEAR_DUPLICATE_ENABLED = False
+        mock_settings.SCRAPER_RESUME_MAX_AGE_SECONDS = 86400
+        run_scraper(scraper)
+    
+    db.get_finished_keywords.assert_called_once_with("linkedin", 86400)
+    scraper.scrape_batches.assert_called_once_with(["django"])
+
+@patch('src.run_scraper.apply_migrations')
+@patch('src.run_scraper.DatabaseOperations')
+def test_run_scraper_keeps_progress_when_interrupted(mock_db_class, mock_migrate):
+    """Test that a run failing midway keeps its progress and the unsaved keyword unfinished"""
+    db = mock_db_class.return_value
+    db.get_finished_keywords.return_value = set()
+    db.save_jobs_bulk.return_value = (1, 0)
+    
+    def batches(keywords):
+        yield "python", [make_job("https://linkedin.com/jobs/1")]
+        raise RuntimeError("Browser crashed")
+    
+    scraper = make_scraper([])
+    scraper.scrape_batches.side_effect = batches
+    
+    with patch('src.run_scraper.settings') as mock_settings:
+        mock_settings.SEARCH_KEYWORDS = ["python", "django"]
+        mock_settings.SCRAPER_FULL_RESYNC = False
+        mock_settings.LINK_INDEX_ENABLED = False
+        mock_settings.NEAR_DUPLICATE_ENABLED = False
+        run_scraper(scraper)
+    
+    db.mark_keyword_finished.assert_called_once_with("linkedin", "python")
+    db.clear_scrape_progress.assert_not_called()
+    db.close.assert_called_once()
+
+@patch('src.run_scraper.apply_migrations')
+@patch('src.run_scraper.DatabaseOperations')
+def test_next_run_resumes_after_interrupted_run(mock_db_class, mock_migrate):
+    """Test that the run after a crash skips the keywords the crashed run stored"""
+    db = mock_db_class.return_value
+    progress = set()
+    db.mark_keyword_finished.side_effect = lambda source, keyword: progress.add(keyword)
+    db.get_finished_keywords.side_effect = lambda source, max_age_seconds: set(progress)
+    db.save_jobs_bulk.return_value = (1, 0)
+    
+    def crashing_batches(keywords):
+        yield "python", [make_job("https://linkedin.com/jobs/1")]
+        raise RuntimeError("Browser crashed")
+    
+    scraper = make_scraper([])
+    scraper.scrape_batches.side_effect = crashing_batches
+    
+    with patch('src.run_scraper.settings') as mock_settings:
+        mock_settings.SEARCH_KEYWORDS = ["python", "django"]
+        mock_settings.SCRAPER_FULL_RESYNC = False
+        mock_settings.LINK_INDEX_ENABLED = False
+        mock_settings.NEAR_DUPLICATE_ENABLED = False
+        mock_settings.SCRAPER_INTERVAL_SECONDS = 21600
+        mock_settings.SCRAPER_RESUME_MAX_AGE_SECONDS = 86400
+        run_scraper(scraper)
+        
+        scraper.scrape_batches.side_effect = lambda keywords: iter([])
+        run_scraper(scraper)
+    
+    # The resume window outlasts the sleep between scheduled runs
+    assert db.get_finished_keywords.call_args.args == ("linkedin", 86400)
+    assert scraper.scrape_batches.call_args_list[-1].args == (["django"],)
+    db.clear_scrape_progress.assert_called_once_with("linkedin")
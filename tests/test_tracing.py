@@ -0,0 +1,102 @@
+import asyncio
+import os
+import time
+import pytest
+from unittest.mock import patch
+from src.utils import tracing
+from src.utils.tracing import TRACER, span, traced, traced_methods
+
+@pytest.fixture
+def tracer(tmp_path):
+    """Start span capture, writing profiles to a temporary directory"""
+    with patch.object(tracing.settings, "TRACING_OUTPUT_DIR", str(tmp_path)):
+        TRACER.start("spans")
+        yield TRACER
+        TRACER.stop()
+
+def read_folded(path):
+    """Parse a folded stacks file into {stack: weight}"""
+    with open(path) as f:
+        return {line.rsplit(" ", 1)[0]: int(line.rsplit(" ", 1)[1]) for line in f if line.strip()}
+
+def test_spans_are_free_while_tracing_is_off():
+    """Test that span() hands out a shared no-op and @traced calls straight through"""
+    assert TRACER.mode is None
+    assert span("one") is span("two")
+    
+    @traced()
+    def add(a, b):
+        return a + b
+    
+    assert add(1, 2) == 3
+
+def test_nested_spans_record_self_time(tracer):
+    """Test that spans nest into stacks weighted by the time not spent in children"""
+    @traced("child")
+    def child():
+        time.sleep(0.02)
+    
+    with span("parent"):
+        child()
+        child()
+    
+    stacks = read_folded(tracer.stop())
+    
+    assert set(stacks) == {"parent", "parent;child"}
+    assert stacks["parent;child"] >= 40000
+    assert stacks["parent"] < stacks["parent;child"]
+
+def test_concurrent_tasks_keep_their_own_stacks(tracer):
+    """Test that coroutines interleaving on one event loop nest under their own parents"""
+    @traced("request")
+    async def request():
+        await asyncio.sleep(0.01)
+    
+    async def evaluate(name):
+        with span(name):
+            await request()
+    
+    async def main():
+        await asyncio.gather(evaluate("first"), evaluate("second"))
+    
+    asyncio.run(main())
+    
+    assert set(read_folded(tracer.stop())) == {"first", "first;request", "second", "second;request"}
+
+def test_traced_methods_skips_private_methods_and_generators(tracer):
+    """Test that only public, non-generator methods of a decorated class get spans"""
+    @traced_methods
+    class Operations:
+        def save(self):
+            return self._write()
+        
+        def _write(self):
+            return True
+        
+        def iterate(self):
+            yield 1
+    
+    assert Operations().save() is True
+    assert list(Operations().iterate()) == [1]
+    assert set(read_folded(tracer.stop())) == {"test_traced_methods_skips_private_methods_and_generators.<locals>.Operations.save"}
+
+def test_sample_mode_writes_folded_stacks(tmp_path):
+    """Test that the sampler captures other threads' stacks and toggling off writes them"""
+    with patch.object(tracing.settings, "TRACING_OUTPUT_DIR", str(tmp_path)), \
+            patch.object(tracing.settings, "TRACING_MODE", "sample"), \
+            patch.object(tracing.settings, "TRACING_SAMPLE_INTERVAL_MS", 1):
+        assert TRACER.toggle() is None
+        time.sleep(0.05)
+        path = TRACER.toggle()
+    
+    assert TRACER.mode is None
+    assert os.path.basename(path).startswith("jobflow-sample-")
+    stacks = read_folded(path)
+    assert any(stack.endswith("test_sample_mode_writes_folded_stacks") for stack in stacks)
+    assert not any("src.utils.tracing" in stack for stack in stacks)
+
+def test_unknown_mode_is_refused():
+    """Test that a misspelt mode fails instead of silently capturing nothing"""
+    with pytest.raises(ValueError):
+        TRACER.start("flamegraph")
+    assert TRACER.mode is None
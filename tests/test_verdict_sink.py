@@ -0,0 +1,132 @@
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+from src.database.models import Job
+from src.database.verdict_sink import VerdictSink
+
+RELEVANT = {"is_relevant": True, "score": 85, "summary": "Good match", "reason": ""}
+REJECTED = {"is_relevant": False, "score": 10, "summary": "", "reason": "Java role"}
+
+@pytest.fixture
+def db():
+    """Create mock database operations that save every verdict"""
+    db = MagicMock()
+    db.save_verdicts_bulk.side_effect = lambda relevant, rejected: len(relevant) + len(rejected)
+    return db
+
+def wait_for(condition, timeout: float = 2):
+    """Wait until condition() holds or the timeout passes"""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+def test_flushes_when_batch_is_full(db):
+    """Test that verdicts are saved together once the batch size is reached"""
+    with VerdictSink(db, batch_size=3, flush_interval_ms=0) as sink:
+        sink.add(Job(id=1), RELEVANT)
+        sink.add(Job(id=2), REJECTED)
+        time.sleep(0.05)
+        db.save_verdicts_bulk.assert_not_called()
+        sink.add(Job(id=3), REJECTED)
+        
+        assert wait_for(lambda: sink.saved == 3)
+    
+    relevant, rejected = db.save_verdicts_bulk.call_args[0]
+    assert [job.job_id for job in relevant] == [1]
+    assert relevant[0].evaluation_summary == "Good match"
+    assert [job.job_id for job in rejected] == [2, 3]
+    assert sink.saved == 3
+    assert len(sink) == 0
+
+def test_failed_flush_keeps_verdicts(db):
+    """Test that verdicts stay buffered when the database rejects a batch"""
+    db.save_verdicts_bulk.side_effect = [None, 1]
+    sink = VerdictSink(db, batch_size=1, flush_interval_ms=0)
+    sink.add(Job(id=1), REJECTED)
+    
+    assert sink.flush() is False
+    assert len(sink) == 1
+    assert sink.flush() is True
+    assert len(sink) == 0
+
+@patch('src.database.verdict_sink.time.sleep')
+def test_close_retries_final_flush(mock_sleep, db):
+    """Test that shutdown retries until the buffered verdicts are saved"""
+    db.save_verdicts_bulk.side_effect = [Exception("connection lost"), None, 1]
+    sink = VerdictSink(db, batch_size=10, flush_interval_ms=0)
+    sink.add(Job(id=1), RELEVANT)
+    
+    sink.close()
+    
+    assert db.save_verdicts_bulk.call_count == 3
+    assert len(sink) == 0
+    # The caller owns the connection it passed in
+    db.close.assert_not_called()
+
+def test_periodic_flush_saves_partial_batches(db):
+    """Test that the background flush saves verdicts before the batch fills up"""
+    with VerdictSink(db, batch_size=100, flush_interval_ms=10) as sink:
+        sink.add(Job(id=1), RELEVANT)
+        sink._stopped.wait(0.2)
+        assert len(sink) == 0
+    
+    db.save_verdicts_bulk.assert_called_once()
+
+def test_failed_evaluations_count_attempts_instead_of_verdicts(db):
+    """Test that a failed evaluation leaves the job pending with one more attempt"""
+    db.record_failed_evaluations.return_value = 1
+    sink = VerdictSink(db, batch_size=10, flush_interval_ms=0)
+    
+    sink.add(Job(id=1), dict(REJECTED, reason="Error during evaluation: 400 Bad Request", error=True))
+    sink.add(Job(id=2), REJECTED)
+    
+    assert sink.flush() is True
+    relevant, rejected = db.save_verdicts_bulk.call_args[0]
+    assert [job.job_id for job in rejected] == [2]
+    db.record_failed_evaluations.assert_called_once_with([1], sink.max_attempts)
+
+def test_failed_attempts_stay_buffered_when_not_recorded(db):
+    """Test that attempts the database did not record are kept for the next flush"""
+    db.record_failed_evaluations.side_effect = [None, 1]
+    sink = VerdictSink(db, batch_size=10, flush_interval_ms=0)
+    sink.add(Job(id=1), dict(REJECTED, error=True))
+    
+    assert sink.flush() is False
+    assert sink.failed_job_ids == [1]
+    assert sink.flush() is True
+    assert len(sink) == 0
+    db.save_verdicts_bulk.assert_not_called()
+
+def test_transient_failures_are_not_recorded(db):
+    """Test that a transient failure leaves the job pending instead of rejecting it"""
+    sink = VerdictSink(db, batch_size=1, flush_interval_ms=0)
+    
+    sink.add(Job(id=1), dict(REJECTED, error=True, transient=True))
+    
+    assert len(sink) == 0
+    db.save_verdicts_bulk.assert_not_called()
+
+def test_add_never_waits_for_the_database(db):
+    """Test that buffering carries on while a full batch is being written"""
+    writing, release = threading.Event(), threading.Event()
+    
+    def slow_save(relevant, rejected):
+        writing.set()
+        release.wait(2)
+        return len(relevant) + len(rejected)
+    
+    db.save_verdicts_bulk.side_effect = slow_save
+    with VerdictSink(db, batch_size=1, flush_interval_ms=0) as sink:
+        sink.add(Job(id=1), RELEVANT)
+        assert writing.wait(2)
+        
+        started = time.monotonic()
+        sink.add(Job(id=2), REJECTED)
+        
+        assert time.monotonic() - started < 0.5
+        release.set()
+    
+    assert sink.saved == 2
+    assert len(sink) == 0